@@ -0,0 +1,40 @@
+"""
+Compares the speed and accuracy of the INormalDistribution implementations.
+Accuracy is measured against the standard library's statistics.NormalDist.
+
+Run from the repository root with:
+    python -m Benchmarks.NormalDistributionBenchmark
+"""
+import random
+import timeit
+from statistics import NormalDist
+
+from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
+
+CALLS: int = 20000
+
+def benchmark(name: str, normalDist: INormalDistribution) -> None:
+    reference: NormalDist = NormalDist()
+    random.seed(0)
+    zValues: list = [random.uniform(-4.5, 4.5) for _ in range(CALLS)]
+    percentiles: list = [random.uniform(0.0001, 0.9999) for _ in range(CALLS)]
+
+    normalDist.getZPercentileValue(0.5)
+    areaTime: float = timeit.timeit(lambda: [normalDist.getLeftTailArea(z) for z in zValues], number=1)
+    percentileTime: float = timeit.timeit(lambda: [normalDist.getZPercentileValue(p) for p in percentiles], number=1)
+    areaError: float = max(abs(normalDist.getLeftTailArea(z) - reference.cdf(z)) for z in zValues)
+    percentileError: float = max(abs(normalDist.getZPercentileValue(p) - reference.inv_cdf(p)) for p in percentiles)
+
+    print(f"{name:<36}{areaTime / CALLS * 1e6:>10.3f}{percentileTime / CALLS * 1e6:>15.3f}{areaError:>14.2e}{percentileError:>14.2e}")
+
+if __name__ == "__main__":
+    for integration in ("rectangle", "trapezoid", "simpson"):
+        buildTime: float = timeit.timeit(lambda: ApproximateNormalTable(step=0.00001, precision=5, integration=integration).getCdfValues(), number=1)
+        print(f"ApproximateNormalTable build, step=1e-5, {integration}: {buildTime * 1e3:.1f} ms")
+    print(f"{'implementation':<36}{'area us':>10}{'percentile us':>15}{'area error':>14}{'z error':>14}")
+    benchmark("ApproximateNormalTable", ApproximateNormalTable())
+    benchmark("ApproximateNormalTable interpolated", ApproximateNormalTable(interpolate=True))
+    benchmark("ApproximateNormalTable simpson 0.01", ApproximateNormalTable(step=0.01, precision=2, interpolate=True, integration="simpson"))
+    benchmark("ErfNormalDistribution", ErfNormalDistribution())
@@ -0,0 +1,53 @@
+"""
+Compares the speed and accuracy of the pure Python t, F and chi squared
+distributions against the scipy.special backed ones, and the cost of importing
+each. Accuracy is the largest relative error of the pure Python quantiles.
+
+Run from the repository root with:
+    python -m Benchmarks.TFChiSquaredBenchmark
+"""
+import random
+import subprocess
+import sys
+import timeit
+
+from Utilities.ChiSquaredDistribution.IncompleteGammaChiSquared import IncompleteGammaChiSquared
+from Utilities.ChiSquaredDistribution.SciPySpecialChiSquared import SciPySpecialChiSquared
+from Utilities.FDistribution.IncompleteBetaFDistribution import IncompleteBetaFDistribution
+from Utilities.FDistribution.SciPySpecialFDistribution import SciPySpecialFDistribution
+from Utilities.TDistribution.IncompleteBetaTDistribution import IncompleteBetaTDistribution
+from Utilities.TDistribution.SciPySpecialTDistribution import SciPySpecialTDistribution
+
+CALLS: int = 2000
+
+def importTime(module: str) -> float:
+    script: str = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    return float(subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout)
+
+def benchmark(name: str, pure: callable, reference: callable, arguments: list) -> None:
+    pureTime: float = timeit.timeit(lambda: [pure(*args) for args in arguments], number=1)
+    referenceTime: float = timeit.timeit(lambda: [reference(*args) for args in arguments], number=1)
+    error: float = max(abs(pure(*args) - reference(*args)) / abs(reference(*args)) for args in arguments if reference(*args) != 0)
+    print(f"{name:<28}{pureTime / len(arguments) * 1e6:>12.2f}{referenceTime / len(arguments) * 1e6:>12.2f}{error:>16.2e}")
+
+if __name__ == "__main__":
+    random.seed(0)
+    percentiles: list = [random.choice((0.005, 0.025, 0.05, 0.95, 0.975, 0.995)) if i % 2 else random.uniform(0.0001, 0.9999) for i in range(CALLS)]
+    dfs: list = [random.choice((1, 2, 5, 10, 30, 100, 1000, 10000)) for _ in range(CALLS)]
+    otherDfs: list = [random.choice((1, 2, 5, 10, 30, 100, 1000, 10000)) for _ in range(CALLS)]
+    values: list = [random.gauss(0, 3) for _ in range(CALLS)]
+
+    pureT, scipyT = IncompleteBetaTDistribution(), SciPySpecialTDistribution()
+    pureChi, scipyChi = IncompleteGammaChiSquared(), SciPySpecialChiSquared()
+    pureF, scipyF = IncompleteBetaFDistribution(), SciPySpecialFDistribution()
+    scipyT.getTPercentileValue(0.5, 1)
+
+    print(f"{'function':<28}{'pure us':>12}{'scipy us':>12}{'max rel error':>16}")
+    benchmark("t left tail area", pureT.getLeftTailArea, scipyT.getLeftTailArea, list(zip(values, dfs)))
+    benchmark("t percentile", pureT.getTPercentileValue, scipyT.getTPercentileValue, list(zip(percentiles, dfs)))
+    benchmark("chi squared left tail area", pureChi.getLeftTailArea, scipyChi.getLeftTailArea, [(abs(v) * df, df) for v, df in zip(values, dfs)])
+    benchmark("chi squared percentile", pureChi.getChiSquaredPercentileVal, scipyChi.getChiSquaredPercentileVal, list(zip(percentiles, dfs)))
+    benchmark("F percentile", pureF.getFPercentileValue, scipyF.getFPercentileValue, list(zip(percentiles, dfs, otherDfs)))
+
+    print(f"import Utilities.SpecialFunctions: {importTime('Utilities.SpecialFunctions') * 1e3:.1f} ms")
+    print(f"import scipy.special: {importTime('scipy.special') * 1e3:.1f} ms")
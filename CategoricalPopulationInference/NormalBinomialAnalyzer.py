@@ -1,9 +1,12 @@
 import math
 from CategoricalPopulationInference.IBinomialPopulationAnalyzer import IBinomialPopulationAnalyzer
+from Utilities.BetaDistribution.IBetaDistribution import IBetaDistribution
+from Utilities.BetaDistribution.SciPyBetaDistribution import SciPyBetaDistribution
 from Utilities.BinomialDistribution.BinomialDistribution import BinomialDistribution
 from Utilities.BinomialDistribution.IBinomialDistribution import IBinomialDistribution
 from Utilities.CategoricalSampleUtilities import CategoricalSampleUtilities
-from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
+from Utilities.MomentSummary import MomentSummary
+from Utilities.NormalDistriution.DefaultNormalDistribution import DefaultNormalDistribution
 from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
 
 class NormalBinomialAnalyzer(IBinomialPopulationAnalyzer):
@@ -12,7 +15,9 @@ class NormalBinomialAnalyzer(IBinomialPopulationAnalyzer):
     def __init__(self, 
         values: list, 
         binomialDist: IBinomialDistribution = BinomialDistribution(),
-        normalDist: INormalDistribution = ApproximateNormalTable()) -> None:
+        normalDist: INormalDistribution = DefaultNormalDistribution(),
+        retainSample: bool = True,
+        betaDist: IBetaDistribution = SciPyBetaDistribution()) -> None:
         """
         Description
         ----------
@@ -21,27 +26,42 @@ class NormalBinomialAnalyzer(IBinomialPopulationAnalyzer):
         Parameters
         ----------
         values: list
-            The list of floats representing a sample from the population distribution
+            The list of floats representing a sample from the population distribution,
+            or a MomentSummary of that sample
 
         binomialDist: IBinomialDistribution
             Binomial distribution utility
 
         normalDist: INormalDistribution
             Normal distribution utility
+
+        retainSample: bool
+            Whether the raw sample should be kept on the instance. Passing False
+            lets the sample be released once its statistics have been estimated
+
+        betaDist: IBetaDistribution
+            Beta distribution utility used by the exact intervals
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null values")
         if binomialDist == None:
             raise ValueError("Cannot have null binomialDist")
         if normalDist == None:
             raise ValueError("Cannot have null normalDist")
+        if betaDist == None:
+            raise ValueError("Cannot have null betaDist")
         
-        self.values: list = values
+        self.values: list = values if retainSample and not isinstance(values, MomentSummary) else None
         self.binomialDist: IBinomialDistribution = binomialDist
         self.normalDist: INormalDistribution = normalDist
-        self.likelihood = CategoricalSampleUtilities.estimateLikelihood(values)
-        self.standardError = CategoricalSampleUtilities.estimateStandardError(values)
+        self.betaDist: IBetaDistribution = betaDist
+        if isinstance(values, MomentSummary):
+            self.likelihood = values.getMean()
+        else:
+            self.likelihood = CategoricalSampleUtilities.estimateLikelihood(values)
         self.n = len(values)
+        self.successes: int = round(self.likelihood * self.n)
+        self.standardError = math.sqrt(self.likelihood * (1 - self.likelihood) / self.n)
 
     def getSampleLikelihood(self) -> float:
         return self.likelihood
@@ -72,6 +92,220 @@ class NormalBinomialAnalyzer(IBinomialPopulationAnalyzer):
 
         return (newLikelihood - width, newLikelihood + width)
 
+    def getClopperPearsonInterval(self, confidenceLevel: float) -> tuple:
+        """
+        Description
+        ----------
+        Contructs the exact Clopper-Pearson confidence interval of the population likelihood
+
+        Parameters
+        ----------
+        confidenceLevel : float
+            The likelihood of the true likelihood falling in this interval
+
+        Returns
+        -------
+        tuple
+            The bounds of the interval
+        """
+        return NormalBinomialAnalyzer.clopperPearsonInterval(self.successes, self.n, confidenceLevel, self.betaDist)
+
+    def getJeffreysInterval(self, confidenceLevel: float) -> tuple:
+        """
+        Description
+        ----------
+        Contructs the Jeffreys confidence interval of the population likelihood
+
+        Parameters
+        ----------
+        confidenceLevel : float
+            The likelihood of the true likelihood falling in this interval
+
+        Returns
+        -------
+        tuple
+            The bounds of the interval
+        """
+        return NormalBinomialAnalyzer.jeffreysInterval(self.successes, self.n, confidenceLevel, self.betaDist)
+
+    @staticmethod
+    def clopperPearsonInterval(
+        successes: int, 
+        trials: int, 
+        confidenceLevel: float, 
+        betaDist: IBetaDistribution = SciPyBetaDistribution()) -> tuple:
+        """
+        Description
+        ----------
+        Contructs the exact Clopper-Pearson confidence interval of a likelihood
+        from the counts of a sample, by inverting the binomial tails through
+        beta quantiles rather than searching over binomial tail areas
+
+        Parameters
+        ----------
+        successes : int
+            The number of successful trials
+
+        trials : int
+            The number of total trials
+
+        confidenceLevel : float
+            The likelihood of the true likelihood falling in this interval
+
+        betaDist: IBetaDistribution
+            Beta distribution utility
+
+        Returns
+        -------
+        tuple
+            The bounds of the interval
+        """
+        return NormalBinomialAnalyzer.clopperPearsonIntervals([successes], [trials], confidenceLevel, betaDist)[0]
+
+    @staticmethod
+    def jeffreysInterval(
+        successes: int, 
+        trials: int, 
+        confidenceLevel: float, 
+        betaDist: IBetaDistribution = SciPyBetaDistribution()) -> tuple:
+        """
+        Description
+        ----------
+        Contructs the Jeffreys confidence interval of a likelihood from the counts
+        of a sample, using the quantiles of the Jeffreys prior's beta posterior
+
+        Parameters
+        ----------
+        successes : int
+            The number of successful trials
+
+        trials : int
+            The number of total trials
+
+        confidenceLevel : float
+            The likelihood of the true likelihood falling in this interval
+
+        betaDist: IBetaDistribution
+            Beta distribution utility
+
+        Returns
+        -------
+        tuple
+            The bounds of the interval
+        """
+        return NormalBinomialAnalyzer.jeffreysIntervals([successes], [trials], confidenceLevel, betaDist)[0]
+
+    @staticmethod
+    def clopperPearsonIntervals(
+        successes: list, 
+        trials: list, 
+        confidenceLevel: float, 
+        betaDist: IBetaDistribution = SciPyBetaDistribution()) -> list:
+        """
+        Description
+        ----------
+        Contructs the Clopper-Pearson confidence interval of many segments at once,
+        evaluating all of their beta quantiles in two batches
+
+        Parameters
+        ----------
+        successes : list
+            The number of successful trials of each segment
+
+        trials : list
+            The number of total trials of each segment
+
+        confidenceLevel : float
+            The likelihood of the true likelihood falling in each interval
+
+        betaDist: IBetaDistribution
+            Beta distribution utility
+
+        Returns
+        -------
+        list
+            The bounds of the interval of each segment
+        """
+        NormalBinomialAnalyzer.__validateCounts(successes, trials, confidenceLevel, betaDist)
+        alpha: float = (1 - confidenceLevel) / 2
+
+        # The bounds are fixed at 0 and 1 when no trial, or every trial, succeeded.
+        # Their shape parameters are clamped only to keep the batch well defined
+        lowers = betaDist.getBetaPercentileValueBatch(
+            [alpha] * len(successes),
+            [max(x, 1) for x in successes],
+            [n - x + 1 for x, n in zip(successes, trials)])
+        uppers = betaDist.getBetaPercentileValueBatch(
+            [1 - alpha] * len(successes),
+            [x + 1 for x in successes],
+            [max(n - x, 1) for x, n in zip(successes, trials)])
+        return NormalBinomialAnalyzer.__toIntervals(successes, trials, lowers, uppers)
+
+    @staticmethod
+    def jeffreysIntervals(
+        successes: list, 
+        trials: list, 
+        confidenceLevel: float, 
+        betaDist: IBetaDistribution = SciPyBetaDistribution()) -> list:
+        """
+        Description
+        ----------
+        Contructs the Jeffreys confidence interval of many segments at once,
+        evaluating all of their beta quantiles in two batches
+
+        Parameters
+        ----------
+        successes : list
+            The number of successful trials of each segment
+
+        trials : list
+            The number of total trials of each segment
+
+        confidenceLevel : float
+            The likelihood of the true likelihood falling in each interval
+
+        betaDist: IBetaDistribution
+            Beta distribution utility
+
+        Returns
+        -------
+        list
+            The bounds of the interval of each segment
+        """
+        NormalBinomialAnalyzer.__validateCounts(successes, trials, confidenceLevel, betaDist)
+        alpha: float = (1 - confidenceLevel) / 2
+
+        a: list = [x + 0.5 for x in successes]
+        b: list = [n - x + 0.5 for x, n in zip(successes, trials)]
+        lowers = betaDist.getBetaPercentileValueBatch([alpha] * len(successes), a, b)
+        uppers = betaDist.getBetaPercentileValueBatch([1 - alpha] * len(successes), a, b)
+        return NormalBinomialAnalyzer.__toIntervals(successes, trials, lowers, uppers)
+
+    @staticmethod
+    def __validateCounts(successes: list, trials: list, confidenceLevel: float, betaDist: IBetaDistribution) -> None:
+        if successes is None or trials is None:
+            raise ValueError("Cannot have null successes or trials")
+        if len(successes) != len(trials):
+            raise ValueError("Cannot have a different number of successes and trials")
+        for x, n in zip(successes, trials):
+            if x == None or x < 0:
+                raise ValueError("Cannot have negative or null successes")
+            if n == None or n <= 0:
+                raise ValueError("Cannot have non-positive or null trials")
+            if x > n:
+                raise ValueError("Cannot have more successes than trials")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+        if betaDist == None:
+            raise ValueError("Cannot have null betaDist")
+
+    @staticmethod
+    def __toIntervals(successes: list, trials: list, lowers: list, uppers: list) -> list:
+        return [(0.0 if x == 0 else float(lower), 1.0 if x == n else float(upper)) 
+            for x, n, lower, upper in zip(successes, trials, lowers, uppers)]
+
     def sampleSizeForConfidenceInterval(self, confidenceLevel: float, width: float) -> int:
         if confidenceLevel == None or confidenceLevel < 0:
             raise ValueError("Cannot have negative or null confidenceLevel")
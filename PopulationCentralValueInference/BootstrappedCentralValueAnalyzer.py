@@ -16,14 +16,15 @@ class BootstrappedCentralValueAnalyzer(IPopulationCentralValueAnalyzer):
         values: list
             The list of floats representing a sample from the population distribution
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null values")
         if resampleCount == None or resampleCount < 0:
             raise ValueError("Cannot have negative or null resampleCount")
         
         self.values = values
-        self.mean: float = SampleUtilities.estimateMean(values)
-        self.stdDev: float = SampleUtilities.estimateStdDev(values)
+        mean, variance = SampleUtilities.estimateMeanAndVariance(values)
+        self.mean: float = mean
+        self.stdDev: float = math.sqrt(variance)
         self.n = len(values)
         self.resampleCount = resampleCount
 
@@ -40,9 +41,8 @@ class BootstrappedCentralValueAnalyzer(IPopulationCentralValueAnalyzer):
         testStatistics: list = []
         for _ in range(self.resampleCount):
             newSample: list = SampleUtilities.bootstrap(self.values)
-            newMean: float = SampleUtilities.estimateMean(newSample)
-            newStdDev: float = SampleUtilities.estimateStdDev(newSample)
-            testStatistics.append(self.__getBootstrapTestStatistic(newMean, newStdDev))
+            newMean, newVariance = SampleUtilities.estimateMeanAndVariance(newSample)
+            testStatistics.append(self.__getBootstrapTestStatistic(newMean, math.sqrt(newVariance)))
         return testStatistics
 
     def getConfidenceInterval(self, confidenceLevel: float) -> tuple:
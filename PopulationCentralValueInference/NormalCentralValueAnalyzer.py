@@ -1,13 +1,13 @@
 import math
 from PopulationCentralValueInference.IPopulationCentralValueAnalyzer import IPopulationCentralValueAnalyzer
 from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
-from Utilities.SampleUtilities import SampleUtilities
-from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
+from Utilities.MomentSummary import MomentSummary
+from Utilities.NormalDistriution.DefaultNormalDistribution import DefaultNormalDistribution
 
 class NormalCentralValueAnalyzer(IPopulationCentralValueAnalyzer):
     """Class representing an analyzer for single dimensional, normally distributed populations"""
 
-    def __init__(self, values: list, normalDist: INormalDistribution = ApproximateNormalTable())  -> None:
+    def __init__(self, values: list, normalDist: INormalDistribution = DefaultNormalDistribution(), retainSample: bool = True)  -> None:
         """
         Description
         ----------
@@ -16,22 +16,57 @@ class NormalCentralValueAnalyzer(IPopulationCentralValueAnalyzer):
         Parameters
         ----------
         values: list
-            The list of floats representing a sample from the population distribution
+            The list of floats representing a sample from the population distribution,
+            or a MomentSummary of that sample
 
         normalDist: INormalDistribution
             Normal distribution utility
+
+        retainSample: bool
+            Whether the raw sample should be kept on the instance. Passing False
+            lets the sample be released once its statistics have been estimated
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null values")
         if normalDist == None:
             raise ValueError("Cannot have null normalDist")
 
-        self.sample: list = values
-        self.mean: float = SampleUtilities.estimateMean(values)
-        self.stdDev: float = SampleUtilities.estimateStdDev(values)
-        self.n: int = len(values)
+        summary: MomentSummary = MomentSummary.asSummary(values)
+        self.sample: list = values if retainSample and not isinstance(values, MomentSummary) else None
+        self.mean: float = summary.getMean()
+        self.stdDev: float = summary.getStdDev()
+        self.n: int = summary.n
         self.normalTable: INormalDistribution = normalDist
 
+    @staticmethod
+    def fromSummary(n: int, mean: float, stdDev: float, normalDist: INormalDistribution = DefaultNormalDistribution()) -> "NormalCentralValueAnalyzer":
+        """
+        Description
+        ----------
+        Constructs the NormalCentralValueAnalyzer from the sufficient statistics of a sample
+        rather than from the sample itself
+
+        Parameters
+        ----------
+        n: int
+            The size of the sample
+
+        mean: float
+            The mean of the sample
+
+        stdDev: float
+            The standard deviation of the sample
+
+        normalDist: INormalDistribution
+            Normal distribution utility
+
+        Returns
+        -------
+        NormalCentralValueAnalyzer
+            The analyzer of the summarized sample
+        """
+        return NormalCentralValueAnalyzer(MomentSummary.fromStatistics(n, mean, stdDev), normalDist)
+
     def getMean(self) -> float:
         return self.mean
 
@@ -1,13 +1,13 @@
 import math
 from Utilities.TDistribution.ITDistribution import ITDistribution
-from Utilities.SampleUtilities import SampleUtilities
+from Utilities.MomentSummary import MomentSummary
 from PopulationCentralValueInference.IPopulationCentralValueAnalyzer import IPopulationCentralValueAnalyzer
-from Utilities.TDistribution.SciPyTDistribution import SciPyTDistribution
+from Utilities.TDistribution.TableTDistribution import TableTDistribution
 
 class TDistributionCentralValueAnalyzer(IPopulationCentralValueAnalyzer):
     """Class representing an analyzer for single dimensional population under a student's t distribution"""
 
-    def __init__(self, values: list, tDist: ITDistribution = SciPyTDistribution()) -> None:
+    def __init__(self, values: list, tDist: ITDistribution = TableTDistribution(), retainSample: bool = True) -> None:
         """
         Description
         ----------
@@ -16,22 +16,57 @@ class TDistributionCentralValueAnalyzer(IPopulationCentralValueAnalyzer):
         Parameters
         ----------
         values: list
-            The list of floats representing a sample from the population distribution
+            The list of floats representing a sample from the population distribution,
+            or a MomentSummary of that sample
 
         tDist: ITDistribution
             The t distribution used by the class
+
+        retainSample: bool
+            Whether the raw sample should be kept on the instance. Passing False
+            lets the sample be released once its statistics have been estimated
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null values")
         if tDist == None:
             raise ValueError("Cannot have null tDist")
-        self.values: list = values
-        self.mean: float = SampleUtilities.estimateMean(values)
-        self.stdDev: float = SampleUtilities.estimateStdDev(values)
-        self.n: int = len(values)
+        summary: MomentSummary = MomentSummary.asSummary(values)
+        self.values: list = values if retainSample and not isinstance(values, MomentSummary) else None
+        self.mean: float = summary.getMean()
+        self.stdDev: float = summary.getStdDev()
+        self.n: int = summary.n
         self.df: int = self.n - 1
         self.tDist = tDist
 
+    @staticmethod
+    def fromSummary(n: int, mean: float, stdDev: float, tDist: ITDistribution = TableTDistribution()) -> "TDistributionCentralValueAnalyzer":
+        """
+        Description
+        ----------
+        Constructs the TDistributionCentralValueAnalyzer from the sufficient statistics of a sample
+        rather than from the sample itself
+
+        Parameters
+        ----------
+        n: int
+            The size of the sample
+
+        mean: float
+            The mean of the sample
+
+        stdDev: float
+            The standard deviation of the sample
+
+        tDist: ITDistribution
+            The t distribution used by the class
+
+        Returns
+        -------
+        TDistributionCentralValueAnalyzer
+            The analyzer of the summarized sample
+        """
+        return TDistributionCentralValueAnalyzer(MomentSummary.fromStatistics(n, mean, stdDev), tDist)
+
     def getMean(self) -> float:
         return self.mean
 
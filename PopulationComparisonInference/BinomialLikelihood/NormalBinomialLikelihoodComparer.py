@@ -1,6 +1,7 @@
 from math import sqrt
 from Utilities.CategoricalSampleUtilities import CategoricalSampleUtilities
-from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
+from Utilities.MomentSummary import MomentSummary
+from Utilities.NormalDistriution.DefaultNormalDistribution import DefaultNormalDistribution
 from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
 from PopulationComparisonInference.BinomialLikelihood.IPopulationBinomalLikelihoodComparer import IPopulationBinomialLikelihoodComparer
 
@@ -8,7 +9,7 @@ from PopulationComparisonInference.BinomialLikelihood.IPopulationBinomalLikeliho
 class NormalBinomialLikelihoodComparer(IPopulationBinomialLikelihoodComparer):
     """Class for comparing the likelihoods of two independent single dimensional, normally distributed populations with binary data"""
 
-    def __init__(self, sample1: list, sample2: list, normDist: INormalDistribution = ApproximateNormalTable()) -> None:
+    def __init__(self, sample1: list, sample2: list, normDist: INormalDistribution = DefaultNormalDistribution(), retainSample: bool = True) -> None:
         """
         Description
         ----------
@@ -17,33 +18,45 @@ class NormalBinomialLikelihoodComparer(IPopulationBinomialLikelihoodComparer):
         Parameters
         ----------
         sample1: list
-            The list of floats representing a sample from the population distribution 1
+            The list of floats representing a sample from the population distribution 1,
+            or a MomentSummary of that sample
 
         sample2: list
-            The list of floats representing a sample from the population distribution 2
+            The list of floats representing a sample from the population distribution 2,
+            or a MomentSummary of that sample
 
         normDist: INormalDistribution
             normal distribution utility
+
+        retainSample: bool
+            Whether the raw samples should be kept on the instance. Passing False
+            lets the samples be released once their statistics have been estimated
         """
-        if sample1 == None or len(sample1) == 0:
+        if sample1 is None or len(sample1) == 0:
             raise ValueError("Cannot have empty or null sample1")
-        if sample2 == None or len(sample2) == 0:
+        if sample2 is None or len(sample2) == 0:
             raise ValueError("Cannot have empty or null sample2")
         if normDist == None:
             raise ValueError("Cannot have null normDist")
 
-        self.sample1: list = sample1
-        self.likelihood1: float = CategoricalSampleUtilities.estimateLikelihood(sample1)
+        self.sample1: list = sample1 if retainSample and not isinstance(sample1, MomentSummary) else None
+        self.likelihood1: float = NormalBinomialLikelihoodComparer.__estimateLikelihood(sample1)
         self.n1: int = len(sample1)
 
-        self.sample2: list = sample2
-        self.likelihood2: float = CategoricalSampleUtilities.estimateLikelihood(sample2)
+        self.sample2: list = sample2 if retainSample and not isinstance(sample2, MomentSummary) else None
+        self.likelihood2: float = NormalBinomialLikelihoodComparer.__estimateLikelihood(sample2)
         self.n2: int = len(sample2)
 
 
         self.stdError: float = self.getStandardError()
         self.normDist: INormalDistribution = normDist
 
+    @staticmethod
+    def __estimateLikelihood(sample: list) -> float:
+        if isinstance(sample, MomentSummary):
+            return sample.getMean()
+        return CategoricalSampleUtilities.estimateLikelihood(sample)
+
     def getStandardError(self) -> float:
         return sqrt( (self.likelihood1 * (1 - self.likelihood1) / self.n1) + (self.likelihood2 * (1 - self.likelihood2) / self.n2) )
 
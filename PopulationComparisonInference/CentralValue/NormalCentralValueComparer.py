@@ -1,13 +1,13 @@
 from math import sqrt
-from Utilities.SampleUtilities import SampleUtilities
+from Utilities.MomentSummary import MomentSummary
 from PopulationComparisonInference.CentralValue.IPopulationCentralValueComparer import IPopulationCentralValueComparer
 from Utilities.TDistribution.ITDistribution import ITDistribution
-from Utilities.TDistribution.SciPyTDistribution import SciPyTDistribution
+from Utilities.TDistribution.TableTDistribution import TableTDistribution
 
 class NormalCentralValueComparer(IPopulationCentralValueComparer):
     """Class for comparing the central values of two independent single dimensional, normally distributed populations with unequal variances"""
 
-    def __init__(self, sample1: list, sample2: list, tDist: ITDistribution = SciPyTDistribution()) -> None:
+    def __init__(self, sample1: list, sample2: list, tDist: ITDistribution = TableTDistribution(), retainSample: bool = True) -> None:
         """
         Description
         ----------
@@ -16,35 +16,81 @@ class NormalCentralValueComparer(IPopulationCentralValueComparer):
         Parameters
         ----------
         sample1: list
-            The list of floats representing a sample from the population distribution 1
+            The list of floats representing a sample from the population distribution 1,
+            or a MomentSummary of that sample
 
         sample2: list
-            The list of floats representing a sample from the population distribution 2
+            The list of floats representing a sample from the population distribution 2,
+            or a MomentSummary of that sample
 
         tDist: ITDistribution
             t distribution utility
+
+        retainSample: bool
+            Whether the raw samples should be kept on the instance. Passing False
+            lets the samples be released once their statistics have been estimated
         """
-        if sample1 == None or len(sample1) == 0:
+        if sample1 is None or len(sample1) == 0:
             raise ValueError("Cannot have empty or null sample1")
-        if sample2 == None or len(sample2) == 0:
+        if sample2 is None or len(sample2) == 0:
             raise ValueError("Cannot have empty or null sample2")
         if tDist == None:
             raise ValueError("Cannot have null tDist")
 
-        self.sample1: list = sample1
-        self.mean1: float = SampleUtilities.estimateMean(sample1)
-        self.stdDev1: float = SampleUtilities.estimateStdDev(sample1)
-        self.var1: float = self.stdDev1 ** 2
-        self.n1: int = len(sample1)
-        self.sample2: list = sample2
-        self.mean2: float = SampleUtilities.estimateMean(sample2)
-        self.stdDev2: float = SampleUtilities.estimateStdDev(sample2)
-        self.var2: float = self.stdDev2 ** 2
-        self.n2: int = len(sample2)
+        summary1: MomentSummary = MomentSummary.asSummary(sample1)
+        self.sample1: list = sample1 if retainSample and not isinstance(sample1, MomentSummary) else None
+        self.mean1: float = summary1.getMean()
+        self.stdDev1: float = summary1.getStdDev()
+        self.var1: float = summary1.getVariance()
+        self.n1: int = summary1.n
+        summary2: MomentSummary = MomentSummary.asSummary(sample2)
+        self.sample2: list = sample2 if retainSample and not isinstance(sample2, MomentSummary) else None
+        self.mean2: float = summary2.getMean()
+        self.stdDev2: float = summary2.getStdDev()
+        self.var2: float = summary2.getVariance()
+        self.n2: int = summary2.n
         self.c: float = self.__getCValue()
         self.df: float = self.__getDf()
         self.tDist: ITDistribution = tDist
     
+    @staticmethod
+    def fromSummary(n1: int, mean1: float, stdDev1: float, n2: int, mean2: float, stdDev2: float, tDist: ITDistribution = TableTDistribution()) -> "NormalCentralValueComparer":
+        """
+        Description
+        ----------
+        Constructs the NormalCentralValueComparer from the sufficient statistics of both samples
+        rather than from the samples themselves
+
+        Parameters
+        ----------
+        n1: int
+            The size of the sample from population 1
+
+        mean1: float
+            The mean of the sample from population 1
+
+        stdDev1: float
+            The standard deviation of the sample from population 1
+
+        n2: int
+            The size of the sample from population 2
+
+        mean2: float
+            The mean of the sample from population 2
+
+        stdDev2: float
+            The standard deviation of the sample from population 2
+
+        tDist: ITDistribution
+            t distribution utility
+
+        Returns
+        -------
+        NormalCentralValueComparer
+            The comparer of the summarized samples
+        """
+        return NormalCentralValueComparer(MomentSummary.fromStatistics(n1, mean1, stdDev1), MomentSummary.fromStatistics(n2, mean2, stdDev2), tDist)
+
     def __getCValue(self) -> float:
         return self.var1 / (self.n1 * ((self.var1/self.n1) + (self.var2/self.n2)))
 
@@ -1,13 +1,13 @@
 from math import sqrt
 from Utilities.SampleUtilities import SampleUtilities
 from Utilities.TDistribution.ITDistribution import ITDistribution
-from Utilities.TDistribution.SciPyTDistribution import SciPyTDistribution
+from Utilities.TDistribution.TableTDistribution import TableTDistribution
 from PopulationComparisonInference.CentralValue.IPopulationCentralValueComparer import IPopulationCentralValueComparer
 
 class PairedNormalCentralValueComparer(IPopulationCentralValueComparer):
     """Class for comparing the central values of two paired single dimensional, normally distributed populations"""
 
-    def __init__(self, sample1: list, sample2: list, tDist: ITDistribution = SciPyTDistribution()) -> None:
+    def __init__(self, sample1: list, sample2: list, tDist: ITDistribution = TableTDistribution(), retainSample: bool = True) -> None:
         """
         Description
         ----------
@@ -23,24 +23,35 @@ class PairedNormalCentralValueComparer(IPopulationCentralValueComparer):
 
         tDist: ITDistribution
             t distribution utility
+
+        retainSample: bool
+            Whether the paired differences should be kept on the instance. Passing False
+            lets them be released once their statistics have been estimated
         """
-        if sample1 == None or len(sample1) == 0:
+        if sample1 is None or len(sample1) == 0:
             raise ValueError("Cannot have empty or null sample1")
-        if sample2 == None or len(sample2) == 0:
+        if sample2 is None or len(sample2) == 0:
             raise ValueError("Cannot have empty or null sample2")
         if len(sample1) != len(sample2):
             raise ValueError("Both samples must have equal size")
         if tDist == None:
             raise ValueError("Cannot have null tDist")
 
-        self.values: list = PairedNormalCentralValueComparer.__getDifferenceList(sample1, sample2)
-        self.mean: float = SampleUtilities.estimateMean(self.values)
-        self.stdDev: float = SampleUtilities.estimateStdDev(self.values)
+        differences: list = PairedNormalCentralValueComparer.__getDifferenceList(sample1, sample2)
+        mean, variance = SampleUtilities.estimateMeanAndVariance(differences)
+        self.values: list = differences if retainSample else None
+        self.mean: float = mean
+        self.stdDev: float = sqrt(variance)
         self.n: int = len(sample1)
         self.df: float = self.n - 1
         self.tDist: ITDistribution = tDist
 
     def __getDifferenceList(sample1: list, sample2: list) -> list:
+        array1 = SampleUtilities.asArray(sample1)
+        array2 = SampleUtilities.asArray(sample2)
+        if array1 is not None and array2 is not None:
+            return array1 - array2
+
         differencesList: list = []
         for i in range(len(sample1)):
             differencesList.append(sample1[i] - sample2[i])
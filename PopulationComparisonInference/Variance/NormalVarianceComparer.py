@@ -1,13 +1,13 @@
 from math import sqrt
-from Utilities.SampleUtilities import SampleUtilities
+from Utilities.MomentSummary import MomentSummary
 from PopulationComparisonInference.Variance.IPopulationVarianceComparer import IPopulationVarianceComparer
 from Utilities.FDistribution.IFDistribution import IFDistribution
-from Utilities.FDistribution.SciPyFDistribution import SciPyFDistribution
+from Utilities.FDistribution.TableFDistribution import TableFDistribution
 
 class NormalVarianceComparer(IPopulationVarianceComparer):
     """Class for comparing the central values of two independent single dimensional, normally distributed populations with unequal variances"""
 
-    def __init__(self, sample1: list, sample2: list, fDist: IFDistribution = SciPyFDistribution()) -> None:
+    def __init__(self, sample1: list, sample2: list, fDist: IFDistribution = TableFDistribution(), retainSample: bool = True) -> None:
         """
         Description
         ----------
@@ -16,33 +16,79 @@ class NormalVarianceComparer(IPopulationVarianceComparer):
         Parameters
         ----------
         sample1: list
-            The list of floats representing a sample from the population distribution 1
+            The list of floats representing a sample from the population distribution 1,
+            or a MomentSummary of that sample
 
         sample2: list
-            The list of floats representing a sample from the population distribution 2
+            The list of floats representing a sample from the population distribution 2,
+            or a MomentSummary of that sample
 
         fDist: IFDistribution
             f distribution utility
+
+        retainSample: bool
+            Whether the raw samples should be kept on the instance. Passing False
+            lets the samples be released once their statistics have been estimated
         """
-        if sample1 == None or len(sample1) == 0:
+        if sample1 is None or len(sample1) == 0:
             raise ValueError("Cannot have empty or null sample1")
-        if sample2 == None or len(sample2) == 0:
+        if sample2 is None or len(sample2) == 0:
             raise ValueError("Cannot have empty or null sample2")
         if fDist == None:
             raise ValueError("Cannot have null fDist")
 
-        self.sample1: list = sample1
-        self.var1: float = SampleUtilities.estimateVariance(sample1)
-        self.n1: int = len(sample1)
+        summary1: MomentSummary = MomentSummary.asSummary(sample1)
+        self.sample1: list = sample1 if retainSample and not isinstance(sample1, MomentSummary) else None
+        self.var1: float = summary1.getVariance()
+        self.n1: int = summary1.n
         self.df1: int = self.n1 - 1
 
-        self.sample2: list = sample2
-        self.var2: float = SampleUtilities.estimateVariance(sample2)
-        self.n2: int = len(sample2)
+        summary2: MomentSummary = MomentSummary.asSummary(sample2)
+        self.sample2: list = sample2 if retainSample and not isinstance(sample2, MomentSummary) else None
+        self.var2: float = summary2.getVariance()
+        self.n2: int = summary2.n
         self.df2: int = self.n2 - 1
 
         self.fDist: IFDistribution = fDist
 
+    @staticmethod
+    def fromSummary(n1: int, mean1: float, stdDev1: float, n2: int, mean2: float, stdDev2: float, fDist: IFDistribution = TableFDistribution()) -> "NormalVarianceComparer":
+        """
+        Description
+        ----------
+        Constructs the NormalVarianceComparer from the sufficient statistics of both samples
+        rather than from the samples themselves
+
+        Parameters
+        ----------
+        n1: int
+            The size of the sample from population 1
+
+        mean1: float
+            The mean of the sample from population 1
+
+        stdDev1: float
+            The standard deviation of the sample from population 1
+
+        n2: int
+            The size of the sample from population 2
+
+        mean2: float
+            The mean of the sample from population 2
+
+        stdDev2: float
+            The standard deviation of the sample from population 2
+
+        fDist: IFDistribution
+            f distribution utility
+
+        Returns
+        -------
+        NormalVarianceComparer
+            The comparer of the summarized samples
+        """
+        return NormalVarianceComparer(MomentSummary.fromStatistics(n1, mean1, stdDev1), MomentSummary.fromStatistics(n2, mean2, stdDev2), fDist)
+
     def getConfidenceInterval(self, confidenceLevel: float) -> tuple:
         if confidenceLevel == None or confidenceLevel < 0:
             raise ValueError("Cannot have negative or null confidenceLevel")
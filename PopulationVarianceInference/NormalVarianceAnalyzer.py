@@ -2,25 +2,55 @@ import math
 
 from PopulationVarianceInference.IPopulationVarianceAnalyzer import IPopulationVarianceAnalyzer
 from Utilities.ChiSquaredDistribution.IChiSquaredDistribution import IChiSquaredDistribution
-from Utilities.ChiSquaredDistribution.SciPyChiSquared import SciPyChiSquared
-from Utilities.SampleUtilities import SampleUtilities
+from Utilities.ChiSquaredDistribution.TableChiSquared import TableChiSquared
+from Utilities.MomentSummary import MomentSummary
 
 class NormalVarianceAnalyzer(IPopulationVarianceAnalyzer):
     """Class representing an analyzer for single dimensional, normally distributed populations"""
 
-    def __init__(self, values: list, chisquare: IChiSquaredDistribution = SciPyChiSquared()) -> None:
-        if values == None or len(values) == 0:
+    def __init__(self, values: list, chisquare: IChiSquaredDistribution = TableChiSquared(), retainSample: bool = True) -> None:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null values")
         if chisquare == None:
             raise ValueError("Cannot have null chisquare")
 
-        self.values: list = values
-        self.mean: float = SampleUtilities.estimateMean(values)
-        self.variance: float = SampleUtilities.estimateVariance(values)
-        self.n: int = len(values)
+        summary: MomentSummary = MomentSummary.asSummary(values)
+        self.values: list = values if retainSample and not isinstance(values, MomentSummary) else None
+        self.mean: float = summary.getMean()
+        self.variance: float = summary.getVariance()
+        self.n: int = summary.n
         self.df: int = self.n - 1
         self.chisquare: IChiSquaredDistribution = chisquare
 
+    @staticmethod
+    def fromSummary(n: int, mean: float, stdDev: float, chisquare: IChiSquaredDistribution = TableChiSquared()) -> "NormalVarianceAnalyzer":
+        """
+        Description
+        ----------
+        Constructs the NormalVarianceAnalyzer from the sufficient statistics of a sample
+        rather than from the sample itself
+
+        Parameters
+        ----------
+        n: int
+            The size of the sample
+
+        mean: float
+            The mean of the sample
+
+        stdDev: float
+            The standard deviation of the sample
+
+        chisquare: IChiSquaredDistribution
+            Chi squared distribution utility
+
+        Returns
+        -------
+        NormalVarianceAnalyzer
+            The analyzer of the summarized sample
+        """
+        return NormalVarianceAnalyzer(MomentSummary.fromStatistics(n, mean, stdDev), chisquare)
+
     def getSampleVariance(self) -> float:
         return self.variance
 
@@ -1,4 +1,9 @@
+import os
+import struct
+import sys
+import tempfile
 import unittest
+from unittest import mock
 from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
 
 class ApproximateNormalTableTests(unittest.TestCase):
@@ -40,6 +45,115 @@ class ApproximateNormalTableTests(unittest.TestCase):
         """
         self.assertRaises(ValueError, ApproximateNormalTable, upperbound=None)  
 
+    def test_construction_upperboundBelowLowerbound(self):
+        """
+        Tests that the constructor raises an exception when the upperbound is not above the lowerbound
+        """
+        self.assertRaises(ValueError, ApproximateNormalTable, lowerbound=1.0, upperbound=-1.0)
+
+    def test_construction_integrationUnknown(self):
+        """
+        Tests that the constructor raises an exception when given an unknown integration rule
+        """
+        self.assertRaises(ValueError, ApproximateNormalTable, integration="midpoint")
+
+    def test_getLeftTailArea_trapezoid(self):
+        """
+        Tests that a coarse trapezoid table is more accurate than a rectangle table of the same step
+        """
+        trapezoid: ApproximateNormalTable = ApproximateNormalTable(step=0.01, precision=2, integration="trapezoid")
+        rectangle: ApproximateNormalTable = ApproximateNormalTable(step=0.01, precision=2)
+        self.assertAlmostEqual(trapezoid.getLeftTailArea(1.96), 0.9750021048517795, places=5)
+        self.assertGreater(abs(rectangle.getLeftTailArea(1.96) - 0.9750021048517795), 1e-4)
+
+    def test_getLeftTailArea_simpson(self):
+        """
+        Tests the accuracy of a coarse simpson table
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(step=0.01, precision=2, integration="simpson")
+        self.assertAlmostEqual(table.getLeftTailArea(1.96), 0.9750021048517795, places=5)
+        self.assertAlmostEqual(table.getZPercentileValue(0.975), 1.96)
+
+    def test_table_sharedBetweenInstances(self):
+        """
+        Tests that instances with the same parameters share a single table
+        """
+        self.assertIs(ApproximateNormalTable().getCdfValues(), ApproximateNormalTable().getCdfValues())
+
+    def test_table_notSharedAcrossParameters(self):
+        """
+        Tests that instances with different parameters do not share a table
+        """
+        coarseTable: ApproximateNormalTable = ApproximateNormalTable(step=0.01, precision=2)
+        self.assertIsNot(coarseTable.getCdfValues(), ApproximateNormalTable().getCdfValues())
+        self.assertEqual(len(coarseTable.getCdfValues()), 1001)
+
+    def test_load_whenSaved(self):
+        """
+        Tests that a saved table loads back with the same parameters and values
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(step=0.01, precision=2, lowerbound=-3.0, upperbound=3.0)
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            path: str = os.path.join(directory, "table.bin")
+            table.save(path)
+            loaded: ApproximateNormalTable = ApproximateNormalTable.load(path)
+            self.assertEqual((loaded.step, loaded.precision, loaded.lowerbound, loaded.uppperbound), (0.01, 2, -3.0, 3.0))
+            self.assertEqual(list(loaded.getCdfValues()), list(table.getCdfValues()))
+            self.assertEqual(loaded.getLeftTailArea(1.96), table.getLeftTailArea(1.96))
+            self.assertEqual(loaded.getZPercentileValue(0.975), table.getZPercentileValue(0.975))
+
+    def test_save_littleEndian(self):
+        """
+        Tests that the header and cdf values are written little endian whatever the platform
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(step=0.5, precision=1, lowerbound=-1.0, upperbound=1.0)
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            path: str = os.path.join(directory, "table.bin")
+            table.save(path)
+            with open(path, "rb") as file:
+                contents: bytes = file.read()
+        self.assertEqual(struct.unpack_from("<8sdqddqq", contents, 0)[1:], (0.5, 1, -1.0, 1.0, 0, 5))
+        self.assertEqual(list(struct.unpack_from("<5d", contents, 56)), list(table.getCdfValues()))
+
+    def test_load_bigEndian(self):
+        """
+        Tests that a big endian platform swaps the cdf values on save and back on load
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(step=0.25, precision=2, lowerbound=-2.0, upperbound=2.0)
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            path: str = os.path.join(directory, "table.bin")
+            with mock.patch.object(sys, "byteorder", "big"):
+                table.save(path)
+                loaded: ApproximateNormalTable = ApproximateNormalTable.load(path)
+            self.assertEqual(list(loaded.getCdfValues()), list(table.getCdfValues()))
+
+    def test_load_sharesLoadedTable(self):
+        """
+        Tests that tables constructed after a load use the loaded values
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(step=0.1, precision=1, lowerbound=-4.0, upperbound=4.0)
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            path: str = os.path.join(directory, "table.bin")
+            table.save(path)
+            loaded: ApproximateNormalTable = ApproximateNormalTable.load(path)
+            self.assertIs(ApproximateNormalTable(step=0.1, precision=1, lowerbound=-4.0, upperbound=4.0).getCdfValues(), loaded.getCdfValues())
+
+    def test_load_notATable(self):
+        """
+        Tests that load raises an exception when given a file that does not hold a table
+        """
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            path: str = os.path.join(directory, "table.bin")
+            with open(path, "wb") as file:
+                file.write(b"\0" * 64)
+            self.assertRaises(ValueError, ApproximateNormalTable.load, path)
+
+    def test_load_pathNone(self):
+        """
+        Tests that load raises an exception when given a null path
+        """
+        self.assertRaises(ValueError, ApproximateNormalTable.load, None)
+
     def test_pdf_whencalled(self):
         """
         Tests the value of the pdf function
@@ -73,6 +187,22 @@ class ApproximateNormalTableTests(unittest.TestCase):
         table: ApproximateNormalTable = ApproximateNormalTable()
         self.assertAlmostEqual(table.getLeftTailArea(1.96), 0.9750315874100378)
 
+    def test_getLeftTailArea_interpolated(self):
+        """
+        Tests that an interpolating table returns the midpoint area halfway between two grid points
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(interpolate=True)
+        expected: float = (table.getLeftTailArea(1.96) + table.getLeftTailArea(1.961)) / 2
+        self.assertAlmostEqual(table.getLeftTailArea(1.9605), expected, places=12)
+
+    def test_getLeftTailArea_interpolatedOutOfBounds(self):
+        """
+        Tests the value of an interpolating table's getLeftTailArea outside of its bounds
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(interpolate=True)
+        self.assertEqual(table.getLeftTailArea(-6), 0)
+        self.assertEqual(table.getLeftTailArea(6), 1)
+
     def test_getLeftTailArea_whenNone(self):
         """
         Tests that the getLeftTailArea function raises a value exception when given a null argument
@@ -80,6 +210,51 @@ class ApproximateNormalTableTests(unittest.TestCase):
         table: ApproximateNormalTable = ApproximateNormalTable()
         self.assertRaises(ValueError, table.getLeftTailArea, None)
 
+    def test_getLeftTailAreaBatch_whenCalled(self):
+        """
+        Tests that getLeftTailAreaBatch matches getLeftTailArea for each value, including those out of bounds
+        """
+        for table in (ApproximateNormalTable(), ApproximateNormalTable(interpolate=True)):
+            vals: list = [-6, -1.2345, 0, 1.96, 4.9999, 6]
+            self.assertEqual(list(table.getLeftTailAreaBatch(vals)), [table.getLeftTailArea(val) for val in vals])
+
+    def test_getLeftTailAreaBatch_whenHalfway(self):
+        """
+        Tests that getLeftTailAreaBatch matches getLeftTailArea for values halfway between grid points
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        vals: list = [-0.0025, 0.0025, -1.2345, 1.9605, -4.9995, 4.9995, 5.0005, -5.0005]
+        self.assertEqual(list(table.getLeftTailAreaBatch(vals)), [table.getLeftTailArea(val) for val in vals])
+
+    def test_getLeftTailAreaBatch_whenNone(self):
+        """
+        Tests that getLeftTailAreaBatch raises a value exception when given a null argument
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        self.assertRaises(ValueError, table.getLeftTailAreaBatch, None)
+
+    def test_getZPercentileValueBatch_whenCalled(self):
+        """
+        Tests that getZPercentileValueBatch matches getZPercentileValue for each percentile
+        """
+        for table in (ApproximateNormalTable(), ApproximateNormalTable(interpolate=True)):
+            percentiles: list = [0, 0.025, 0.5, 0.9, 0.975, 1]
+            self.assertEqual(list(table.getZPercentileValueBatch(percentiles)), [table.getZPercentileValue(percentile) for percentile in percentiles])
+
+    def test_getZPercentileValueBatch_whenNegative(self):
+        """
+        Tests that getZPercentileValueBatch raises a value exception when any percentile is negative
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        self.assertRaises(ValueError, table.getZPercentileValueBatch, [0.5, -1])
+
+    def test_getZPercentileValueBatch_whenOverOne(self):
+        """
+        Tests that getZPercentileValueBatch raises a value exception when any percentile is over 1
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        self.assertRaises(ValueError, table.getZPercentileValueBatch, [0.5, 2])
+
     def test_getZPercentileValue_whenCalled(self):
         """
         Tests the z value when called normally
@@ -87,6 +262,36 @@ class ApproximateNormalTableTests(unittest.TestCase):
         table: ApproximateNormalTable = ApproximateNormalTable()
         self.assertAlmostEqual(table.getZPercentileValue(0.975), 1.96)
 
+    def test_getZPercentileValue_whenZero(self):
+        """
+        Tests that the z value of a zero percentile is the lower bound of the table
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        self.assertEqual(table.getZPercentileValue(0), -5.0)
+
+    def test_getZPercentileValue_whenOne(self):
+        """
+        Tests that the z value of a percentile of one is the upper bound of the table
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        self.assertEqual(table.getZPercentileValue(1), 5.0)
+
+    def test_getZPercentileValue_matchesLeftTailArea(self):
+        """
+        Tests that the z value found is the smallest one in the table with atleast the target area
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable()
+        zVal: float = table.getZPercentileValue(0.9)
+        self.assertGreaterEqual(table.getLeftTailArea(zVal), 0.9)
+        self.assertLess(table.getLeftTailArea(round(zVal - table.step, table.precision)), 0.9)
+
+    def test_getZPercentileValue_interpolated(self):
+        """
+        Tests that an interpolating table's z value maps back onto the target area
+        """
+        table: ApproximateNormalTable = ApproximateNormalTable(interpolate=True)
+        self.assertAlmostEqual(table.getLeftTailArea(table.getZPercentileValue(0.9)), 0.9, places=12)
+
     def test_getZPercentileValue_whenNegative(self):
         """
         Tests that the getZValue function raises a value exception when given a negative argument
@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+from Utilities.TDistribution.AsymptoticTDistribution import AsymptoticTDistribution
+from Utilities.TDistribution.SciPySpecialTDistribution import SciPySpecialTDistribution
+
+class AsymptoticTDistributionTests(unittest.TestCase):
+    """Unit testing class for the AsymptoticTDistribution"""
+
+    def test_constructor_invalid(self):
+        """Tests that the constructor raises an error with invalid arguments"""
+        self.assertRaises(ValueError, AsymptoticTDistribution, exact=None)
+        self.assertRaises(ValueError, AsymptoticTDistribution, threshold=0)
+        self.assertRaises(ValueError, AsymptoticTDistribution, tolerance=-1)
+        self.assertRaises(ValueError, AsymptoticTDistribution, normalDist=None)
+
+    def test_getTPercentileValue_aboveThreshold(self):
+        """Tests that percentiles for large df come from the expansion to within the tolerance"""
+        exact: mock.Mock = mock.Mock(wraps=SciPySpecialTDistribution())
+        tDist: AsymptoticTDistribution = AsymptoticTDistribution(exact=exact)
+        self.assertEqual(tDist.getMethod(0.975, 2345.6), "asymptotic")
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.975, 2345.6), 1.9609758684977725, delta=1e-10)
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.0005, 1500.5), -3.2970226798490825, delta=1e-10)
+        exact.getTPercentileValue.assert_not_called()
+
+    def test_getTPercentileValue_belowThreshold(self):
+        """Tests that percentiles for df below the threshold are delegated"""
+        exact: mock.Mock = mock.Mock(wraps=SciPySpecialTDistribution())
+        tDist: AsymptoticTDistribution = AsymptoticTDistribution(exact=exact)
+        self.assertEqual(tDist.getMethod(0.975, 500), "exact")
+        self.assertEqual(tDist.getTPercentileValue(0.975, 500), SciPySpecialTDistribution().getTPercentileValue(0.975, 500))
+        exact.getTPercentileValue.assert_called_once_with(0.975, 500)
+
+    def test_getTPercentileValue_boundOverTolerance(self):
+        """Tests that percentiles far into the tail, where the error bound exceeds the tolerance, are delegated"""
+        tDist: AsymptoticTDistribution = AsymptoticTDistribution()
+        self.assertEqual(tDist.getMethod(1e-9, 1000), "exact")
+        self.assertEqual(tDist.getTPercentileValue(1e-9, 1000), SciPySpecialTDistribution().getTPercentileValue(1e-9, 1000))
+        self.assertEqual(AsymptoticTDistribution(tolerance=1e-6).getMethod(1e-9, 1000), "asymptotic")
+
+    def test_getTPercentileValue_atBounds(self):
+        """Tests that the percentiles 0 and 1 are delegated"""
+        tDist: AsymptoticTDistribution = AsymptoticTDistribution()
+        self.assertEqual(tDist.getMethod(0, 5000), "exact")
+        self.assertEqual(tDist.getTPercentileValue(1, 5000), SciPySpecialTDistribution().getTPercentileValue(1, 5000))
+
+    def test_getLeftTailAreaBatch_whenCalled(self):
+        """Tests that a batch of tail areas is delegated to the exact distribution in one call"""
+        exact: mock.Mock = mock.Mock(wraps=SciPySpecialTDistribution())
+        tDist: AsymptoticTDistribution = AsymptoticTDistribution(exact=exact)
+        vals: list = [-1.5, 0, 2.5]
+        dfs: list = [12, 5000, 40]
+        self.assertEqual(list(tDist.getLeftTailAreaBatch(vals, dfs)), list(SciPySpecialTDistribution().getLeftTailAreaBatch(vals, dfs)))
+        exact.getLeftTailAreaBatch.assert_called_once_with(vals, dfs)
+        exact.getLeftTailArea.assert_not_called()
+
+    def test_getTPercentileValue_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        tDist: AsymptoticTDistribution = AsymptoticTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 1.5, 5000)
+        self.assertRaises(ValueError, tDist.getMethod, 0.975, -1)
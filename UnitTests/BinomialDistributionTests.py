@@ -1,5 +1,8 @@
 import unittest
+from unittest import mock
 from Utilities.BinomialDistribution.BinomialDistribution import BinomialDistribution
+from Utilities.BinomialDistribution.IBinomialDistribution import IBinomialDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
 
 class BinomialDistributionTests(unittest.TestCase):
     """Unit testing class for the BinomialDistribution"""
@@ -9,6 +12,65 @@ class BinomialDistributionTests(unittest.TestCase):
         dist: BinomialDistribution = BinomialDistribution()
         self.assertAlmostEqual(dist.getLeftTailArea(3, 15, .2),  0.6481621045739525)
 
+    def test_getLeftTailArea_largeTrials(self):
+        """Tests the value of getLeftTailArea when called with millions of trials"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertAlmostEqual(dist.getLeftTailArea(500000, 1000000, .5), 0.5003989421806654, places=12)
+        self.assertAlmostEqual(dist.getLeftTailArea(2, 1000000, .000001), 0.9196986948985504, places=12)
+
+    def test_getLeftTailArea_withoutSciPy(self):
+        """Tests the value of getLeftTailArea from the continued fraction used when scipy is unavailable"""
+        with mock.patch.object(OptionalDependencies, "load", return_value=None):
+            dist: BinomialDistribution = BinomialDistribution()
+            self.assertAlmostEqual(dist.getLeftTailArea(3, 15, .2), 0.6481621045739525)
+            self.assertAlmostEqual(dist.getLeftTailArea(12, 15, .9), 0.18406106910639092)
+            self.assertAlmostEqual(dist.getLeftTailArea(500000, 1000000, .5), 0.5003989421806654, places=12)
+
+    def test_getLeftTailArea_degenerateLikelihood(self):
+        """Tests the value of getLeftTailArea when the likelihood is 0 or 1"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertEqual(dist.getLeftTailArea(0, 5, 0), 1)
+        self.assertEqual(dist.getLeftTailArea(4, 5, 1), 0)
+        self.assertEqual(dist.getLeftTailArea(5, 5, 1), 1)
+
+    def test_constructor_modeIllegal(self):
+        """Tests that the constructor raises an error with an unknown mode"""
+        self.assertRaises(ValueError, BinomialDistribution, mode="fast")
+
+    def test_constructor_toleranceNegative(self):
+        """Tests that the constructor raises an error with a negative tolerance"""
+        self.assertRaises(ValueError, BinomialDistribution, tolerance=-1)
+
+    def test_constructor_normalDistNone(self):
+        """Tests that the constructor raises an error with a null normalDist"""
+        self.assertRaises(ValueError, BinomialDistribution, normalDist=None)
+
+    def test_getMethod_exactMode(self):
+        """Tests that the exact mode never approximates"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertEqual(dist.getMethod(100000000, .3), "exact")
+
+    def test_getMethod_autoMode(self):
+        """Tests the method chosen in auto mode for small and large numbers of trials"""
+        dist: BinomialDistribution = BinomialDistribution(mode="auto")
+        self.assertEqual(dist.getMethod(15, .2), "exact")
+        self.assertEqual(dist.getMethod(100000000, .3), "normal")
+        self.assertEqual(dist.getMethod(100000000, .000001), "poisson")
+
+    def test_getLeftTailArea_autoMode(self):
+        """Tests that the approximations of auto mode stay within the tolerance of the exact value"""
+        exact: BinomialDistribution = BinomialDistribution()
+        auto: BinomialDistribution = BinomialDistribution(mode="auto", tolerance=.0001)
+        for successes, trials, likelihood in ((3, 15, .2), (30001000, 100000000, .3), (95, 100000000, .000001)):
+            self.assertAlmostEqual(auto.getLeftTailArea(successes, trials, likelihood), exact.getLeftTailArea(successes, trials, likelihood), delta=.0001)
+
+    def test_getLeftTailArea_poissonWithoutSciPy(self):
+        """Tests the value of the Poisson approximation used when scipy is unavailable"""
+        with mock.patch.object(OptionalDependencies, "load", return_value=None):
+            dist: BinomialDistribution = BinomialDistribution(mode="auto")
+            self.assertAlmostEqual(dist.getLeftTailArea(95, 100000000, .000001), 0.3311917340353065, places=12)
+            self.assertAlmostEqual(dist.getLeftTailArea(105, 100000000, .000001), 0.7128078824185414, places=12)
+
     def test_getLeftTailArea_NegativeSuccesses(self):
         """Tests the value of getLeftTailArea when called in normal bounds"""
         dist: BinomialDistribution = BinomialDistribution()
@@ -54,11 +116,87 @@ class BinomialDistributionTests(unittest.TestCase):
         dist: BinomialDistribution = BinomialDistribution()
         self.assertRaises(ValueError, dist.getLeftTailArea, 6, 5, 0.5)
 
+    def test_getPmfValues_whenCalled(self):
+        """Tests that getPmfValues matches pmf for every number of successes"""
+        dist: BinomialDistribution = BinomialDistribution()
+        for trials, likelihood in ((0, .2), (15, .2), (200, .01), (200, .99), (15, 0), (15, 1)):
+            values: list = dist.getPmfValues(trials, likelihood)
+            self.assertEqual(len(values), trials + 1)
+            for successes in range(trials + 1):
+                self.assertAlmostEqual(values[successes], dist.pmf(successes, trials, likelihood), places=14)
+
+    def test_getPmfValues_NegativeTrials(self):
+        """Tests that getPmfValues throws an exception with a negative trial count"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertRaises(ValueError, dist.getPmfValues, -1, 0.5)
+
+    def test_getPmfValues_TooLargeLikelihood(self):
+        """Tests that getPmfValues throws an exception with a likelihood that is over 1"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertRaises(ValueError, dist.getPmfValues, 5, 2)
+
+    def test_getLeftTailAreaValues_whenCalled(self):
+        """Tests that getLeftTailAreaValues matches getLeftTailArea for every number of successes"""
+        dist: BinomialDistribution = BinomialDistribution()
+        areas: list = dist.getLeftTailAreaValues(15, .2)
+        self.assertAlmostEqual(areas[3], 0.6481621045739525)
+        for successes in range(16):
+            self.assertAlmostEqual(areas[successes], dist.getLeftTailArea(successes, 15, .2))
+
+    def test_getSuccessPercentileValue_whenCalled(self):
+        """Tests that getSuccessPercentileValue returns the smallest count whose left tail area reaches the percentile"""
+        dist: BinomialDistribution = BinomialDistribution()
+        for trials, likelihood in ((15, .2), (1000, .01), (100000, .5), (1000000, .999)):
+            for percentile in (.001, .025, .5, .6481621045739525, .975, .999):
+                successes: int = dist.getSuccessPercentileValue(percentile, trials, likelihood)
+                self.assertGreaterEqual(dist.getLeftTailArea(successes, trials, likelihood), percentile)
+                if successes > 0:
+                    self.assertLess(dist.getLeftTailArea(successes - 1, trials, likelihood), percentile)
+
+    def test_getSuccessPercentileValue_matchesBisection(self):
+        """Tests that the search from a normal guess matches the interface's bisection"""
+        dist: BinomialDistribution = BinomialDistribution()
+        for percentile in (0, .05, .5, .95, 1):
+            self.assertEqual(dist.getSuccessPercentileValue(percentile, 40, .3), 
+                IBinomialDistribution.getSuccessPercentileValue(dist, percentile, 40, .3))
+
+    def test_getSuccessPercentileValue_degenerate(self):
+        """Tests the value of getSuccessPercentileValue with degenerate arguments"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertEqual(dist.getSuccessPercentileValue(.5, 0, .5), 0)
+        self.assertEqual(dist.getSuccessPercentileValue(.5, 15, 0), 0)
+        self.assertEqual(dist.getSuccessPercentileValue(.5, 15, 1), 15)
+        self.assertEqual(dist.getSuccessPercentileValue(0, 15, .2), 0)
+        self.assertEqual(dist.getSuccessPercentileValue(1, 15, .2), 15)
+
+    def test_getSuccessPercentileValue_percentileOverOne(self):
+        """Tests that getSuccessPercentileValue throws an exception with a percentile over 1"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertRaises(ValueError, dist.getSuccessPercentileValue, 2, 15, .2)
+
+    def test_getSuccessPercentileValue_NullPercentile(self):
+        """Tests that getSuccessPercentileValue throws an exception with a null percentile"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertRaises(ValueError, dist.getSuccessPercentileValue, None, 15, .2)
+
     def test_pmf_whenCalled(self):
         """Tests the value of pmf when called in normal bounds"""
         dist: BinomialDistribution = BinomialDistribution()
         self.assertAlmostEqual(dist.pmf(3, 15, .2),  0.2501388953190402)
 
+    def test_pmf_largeTrials(self):
+        """Tests that pmf returns a finite value rather than overflowing when called with many trials"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertAlmostEqual(dist.pmf(50000, 100000, .5), 0.0025231262141, places=12)
+
+    def test_pmf_degenerateLikelihood(self):
+        """Tests the value of pmf when the likelihood is 0 or 1"""
+        dist: BinomialDistribution = BinomialDistribution()
+        self.assertEqual(dist.pmf(0, 5, 0), 1)
+        self.assertEqual(dist.pmf(2, 5, 0), 0)
+        self.assertEqual(dist.pmf(5, 5, 1), 1)
+        self.assertEqual(dist.pmf(2, 5, 1), 0)
+
     def test_pmf_NegativeSuccesses(self):
         """Tests the value of pmf when called in normal bounds"""
         dist: BinomialDistribution = BinomialDistribution()
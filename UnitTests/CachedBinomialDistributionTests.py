@@ -0,0 +1,68 @@
+import unittest
+from Utilities.BinomialDistribution.BinomialDistribution import BinomialDistribution
+from Utilities.BinomialDistribution.CachedBinomialDistribution import CachedBinomialDistribution
+
+class CachedBinomialDistributionTests(unittest.TestCase):
+    """Unit testing class for the CachedBinomialDistribution"""
+
+    def test_constructor_binomialDistNone(self):
+        """Tests that the constructor raises an error with a null binomialDist"""
+        self.assertRaises(ValueError, CachedBinomialDistribution, binomialDist=None)
+
+    def test_constructor_maxSizeNonPositive(self):
+        """Tests that the constructor raises an error with a non-positive maxSize"""
+        self.assertRaises(ValueError, CachedBinomialDistribution, maxSize=0)
+
+    def test_getLeftTailArea_whenCalled(self):
+        """Tests that getLeftTailArea matches the wrapped distribution"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution()
+        self.assertEqual(dist.getLeftTailArea(3, 15, .2), BinomialDistribution().getLeftTailArea(3, 15, .2))
+
+    def test_pmf_whenCalled(self):
+        """Tests that pmf matches the wrapped distribution"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution()
+        self.assertEqual(dist.pmf(3, 15, .2), BinomialDistribution().pmf(3, 15, .2))
+
+    def test_getSuccessPercentileValue_whenCalled(self):
+        """Tests that getSuccessPercentileValue is served from the cache on repeated calls"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution()
+        self.assertEqual(dist.getSuccessPercentileValue(.95, 15, .2), BinomialDistribution().getSuccessPercentileValue(.95, 15, .2))
+        dist.getSuccessPercentileValue(.95, 15, .2)
+        self.assertEqual(dist.getHits(), 1)
+
+    def test_getLeftTailArea_countsHitsAndMisses(self):
+        """Tests that repeated calls are served from the cache"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution()
+        dist.getLeftTailArea(3, 15, .2)
+        dist.getLeftTailArea(3, 15, .2)
+        dist.getLeftTailArea(4, 15, .2)
+        self.assertEqual(dist.getHits(), 1)
+        self.assertEqual(dist.getMisses(), 2)
+
+    def test_getLeftTailArea_evictsLeastRecentlyUsed(self):
+        """Tests that the least recently used result is evicted once the cache is full"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution(maxSize=2)
+        dist.getLeftTailArea(1, 15, .2)
+        dist.getLeftTailArea(2, 15, .2)
+        dist.getLeftTailArea(1, 15, .2)
+        dist.getLeftTailArea(3, 15, .2)
+        dist.getLeftTailArea(2, 15, .2)
+        self.assertEqual(dist.getHits(), 1)
+        self.assertEqual(dist.getMisses(), 4)
+
+    def test_getLeftTailArea_invalidNotCached(self):
+        """Tests that invalid arguments still raise an error"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution()
+        self.assertRaises(ValueError, dist.getLeftTailArea, 6, 5, 0.5)
+        self.assertRaises(ValueError, dist.getLeftTailArea, 6, 5, 0.5)
+
+    def test_clearCache_whenCalled(self):
+        """Tests that clearCache empties the cache and resets the counters"""
+        dist: CachedBinomialDistribution = CachedBinomialDistribution()
+        dist.pmf(3, 15, .2)
+        dist.pmf(3, 15, .2)
+        dist.clearCache()
+        self.assertEqual(dist.getHits(), 0)
+        self.assertEqual(dist.getMisses(), 0)
+        dist.pmf(3, 15, .2)
+        self.assertEqual(dist.getMisses(), 1)
@@ -0,0 +1,26 @@
+import unittest
+from Utilities.ChiSquaredDistribution.CachedChiSquared import CachedChiSquared
+from Utilities.ChiSquaredDistribution.SciPySpecialChiSquared import SciPySpecialChiSquared
+
+class CachedChiSquaredTests(unittest.TestCase):
+    """Unit testing class for the CachedChiSquared"""
+
+    def test_constructor_chisquareNone(self):
+        """Tests that the constructor raises an error with a null chisquare"""
+        self.assertRaises(ValueError, CachedChiSquared, chisquare=None)
+
+    def test_getChiSquaredUpperVal_whenCalled(self):
+        """Tests that the critical values match the wrapped distribution and are cached"""
+        chiSquareDist: CachedChiSquared = CachedChiSquared()
+        self.assertEqual(chiSquareDist.getChiSquaredUpperVal(0.99, 8), SciPySpecialChiSquared().getChiSquaredUpperVal(0.99, 8))
+        self.assertEqual(chiSquareDist.getChiSquaredLowerVal(0.99, 8), SciPySpecialChiSquared().getChiSquaredLowerVal(0.99, 8))
+        chiSquareDist.getChiSquaredUpperVal(0.99, 8)
+        chiSquareDist.getChiSquaredLowerVal(0.99, 8)
+        self.assertEqual(chiSquareDist.getHits(), 2)
+        self.assertEqual(chiSquareDist.getMisses(), 2)
+
+    def test_getLeftTailArea_notCached(self):
+        """Tests that getLeftTailArea is forwarded without being cached"""
+        chiSquareDist: CachedChiSquared = CachedChiSquared()
+        self.assertEqual(chiSquareDist.getLeftTailArea(2.2, 8), SciPySpecialChiSquared().getLeftTailArea(2.2, 8))
+        self.assertEqual(chiSquareDist.getMisses(), 0)
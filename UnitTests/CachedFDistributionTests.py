@@ -0,0 +1,29 @@
+import unittest
+from Utilities.FDistribution.CachedFDistribution import CachedFDistribution
+from Utilities.FDistribution.SciPySpecialFDistribution import SciPySpecialFDistribution
+
+class CachedFDistributionTests(unittest.TestCase):
+    """Unit testing class for the CachedFDistribution"""
+
+    def test_constructor_fDistNone(self):
+        """Tests that the constructor raises an error with a null fDist"""
+        self.assertRaises(ValueError, CachedFDistribution, fDist=None)
+
+    def test_getFUpperValue_whenCalled(self):
+        """Tests that the critical values match the wrapped distribution and are cached"""
+        fDist: CachedFDistribution = CachedFDistribution()
+        self.assertEqual(fDist.getFUpperValue(0.95, 39, 39), SciPySpecialFDistribution().getFUpperValue(0.95, 39, 39))
+        self.assertEqual(fDist.getFLowerValue(0.95, 39, 39), SciPySpecialFDistribution().getFLowerValue(0.95, 39, 39))
+        self.assertEqual(fDist.getFPercentileValue(0.975, 10, 7), SciPySpecialFDistribution().getFPercentileValue(0.975, 10, 7))
+        fDist.getFUpperValue(0.95, 39, 39)
+        fDist.getFLowerValue(0.95, 39, 39)
+        self.assertEqual(fDist.getHits(), 2)
+        self.assertEqual(fDist.getMisses(), 3)
+
+    def test_clearCache_whenCalled(self):
+        """Tests that clearCache empties the caches and resets the counters"""
+        fDist: CachedFDistribution = CachedFDistribution()
+        fDist.getFUpperValue(0.95, 39, 39)
+        fDist.clearCache()
+        self.assertEqual(fDist.getHits(), 0)
+        self.assertEqual(fDist.getMisses(), 0)
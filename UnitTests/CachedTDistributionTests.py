@@ -0,0 +1,50 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from Utilities.TDistribution.CachedTDistribution import CachedTDistribution
+from Utilities.TDistribution.SciPySpecialTDistribution import SciPySpecialTDistribution
+
+class CachedTDistributionTests(unittest.TestCase):
+    """Unit testing class for the CachedTDistribution"""
+
+    def test_constructor_tDistNone(self):
+        """Tests that the constructor raises an error with a null tDist"""
+        self.assertRaises(ValueError, CachedTDistribution, tDist=None)
+
+    def test_constructor_maxSizeNonPositive(self):
+        """Tests that the constructor raises an error with a non-positive maxSize"""
+        self.assertRaises(ValueError, CachedTDistribution, maxSize=0)
+
+    def test_getTPercentileValue_whenCalled(self):
+        """Tests that getTPercentileValue matches the wrapped distribution and is cached"""
+        tDist: CachedTDistribution = CachedTDistribution()
+        self.assertEqual(tDist.getTPercentileValue(0.99, 8), SciPySpecialTDistribution().getTPercentileValue(0.99, 8))
+        tDist.getTPercentileValue(0.99, 8)
+        tDist.getTPercentileValue(0.95, 8)
+        self.assertEqual(tDist.getHits(), 1)
+        self.assertEqual(tDist.getMisses(), 2)
+
+    def test_getLeftTailArea_notCached(self):
+        """Tests that getLeftTailArea is forwarded without being cached"""
+        tDist: CachedTDistribution = CachedTDistribution()
+        self.assertEqual(tDist.getLeftTailArea(2.2, 8), SciPySpecialTDistribution().getLeftTailArea(2.2, 8))
+        self.assertEqual(tDist.getMisses(), 0)
+
+    def test_getTPercentileValue_invalid(self):
+        """Tests that invalid arguments still raise an error"""
+        tDist: CachedTDistribution = CachedTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 2, 8)
+
+    def test_getTPercentileValue_concurrently(self):
+        """Tests that the counters stay consistent when the cache is used from several threads"""
+        tDist: CachedTDistribution = CachedTDistribution(maxSize=8)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values: list = list(executor.map(lambda i: tDist.getTPercentileValue(0.9 + ((i % 10) / 100), 8), range(400)))
+        self.assertEqual(values[0], SciPySpecialTDistribution().getTPercentileValue(0.9, 8))
+        self.assertEqual(tDist.getHits() + tDist.getMisses(), 400)
+
+    def test_clearCache_whenCalled(self):
+        """Tests that clearCache empties the cache and resets the counters"""
+        tDist: CachedTDistribution = CachedTDistribution()
+        tDist.getTPercentileValue(0.99, 8)
+        tDist.clearCache()
+        self.assertEqual(tDist.getMisses(), 0)
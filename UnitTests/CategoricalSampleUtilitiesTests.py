@@ -1,4 +1,5 @@
 import unittest
+from array import array
 from Utilities.CategoricalSampleUtilities import CategoricalSampleUtilities
 
 TEST_VALUES = [1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
@@ -10,6 +11,14 @@ class CategoricalSampleUtilitiesTests(unittest.TestCase):
         """Tests the value of estimateLikelihood when called with legal arguments"""
         self.assertEqual(CategoricalSampleUtilities.estimateLikelihood(TEST_VALUES), 4/15)
 
+    def test_estimateLikelihood_array(self):
+        """Tests the value of estimateLikelihood when called with a buffer-protocol array"""
+        self.assertAlmostEqual(CategoricalSampleUtilities.estimateLikelihood(array('b', TEST_VALUES)), 4/15)
+
+    def test_estimateLikelihood_arrayNotBinary(self):
+        """Tests that estimateLikelihood raises an error when an array holds values other than 0 and 1"""
+        self.assertRaises(ValueError, CategoricalSampleUtilities.estimateLikelihood, array('b', [0, 1, 2]))
+
     def test_estimateLikelihood_valuesNull(self):
         """Tests that estimateLikelihood raises an error when called with null values"""
         self.assertRaises(ValueError, CategoricalSampleUtilities.estimateLikelihood, None)
@@ -0,0 +1,103 @@
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from Utilities.CriticalValueTable import CriticalValueTable, LOWER_PERCENTILES, UPPER_PERCENTILES
+
+class CriticalValueTableTests(unittest.TestCase):
+    """Unit testing class for the CriticalValueTable"""
+
+    def test_constructor_sizeMismatch(self):
+        """Tests that the constructor raises an error when the values do not fill the grid"""
+        self.assertRaises(ValueError, CriticalValueTable, [0.95], [1.0, 2.0], [], [1.0])
+
+    def test_constructor_duplicatePercentiles(self):
+        """Tests that the constructor raises an error when two percentiles share a rounded entry"""
+        self.assertRaises(ValueError, CriticalValueTable, [1 - 0.95, (1 - 0.9) / 2], [1.0], [], [1.0, 2.0])
+
+    def test_percentiles_distinct(self):
+        """Tests that the tabulated percentiles hold one entry per rounded value"""
+        for percentiles in (LOWER_PERCENTILES, UPPER_PERCENTILES):
+            self.assertEqual(len({round(percentile, 12) for percentile in percentiles}), len(percentiles))
+
+    def test_lookup_onGrid(self):
+        """Tests that lookup finds values on a one and a two dimensional grid"""
+        oneDim: CriticalValueTable = CriticalValueTable.build([0.9, 0.95], [1.0, 2.0], [], lambda p, df: p + df)
+        self.assertEqual(oneDim.lookup(0.95, 2), 2.95)
+        twoDim: CriticalValueTable = CriticalValueTable.build([0.9, 0.95], [1.0, 2.0], [3.0, 4.0], lambda p, df1, df2: p + (10 * df1) + df2)
+        self.assertEqual(twoDim.lookup(0.9, 1, 4), 14.9)
+
+    def test_lookup_offGrid(self):
+        """Tests that lookup returns None outside the grid"""
+        table: CriticalValueTable = CriticalValueTable.build([0.9, 0.95], [1.0, 2.0], [], lambda p, df: p + df)
+        self.assertIsNone(table.lookup(0.8, 1))
+        self.assertIsNone(table.lookup(0.9, 1.5))
+        self.assertIsNone(table.lookup(0.9, 1, 2))
+
+    def test_lookup_derivedPercentile(self):
+        """Tests that a percentile derived from a confidence level still finds its entry"""
+        table: CriticalValueTable = CriticalValueTable.build([0.975], [1.0], [], lambda p, df: p)
+        self.assertEqual(table.lookup(1 - ((1 - 0.95) / 2), 1), 0.975)
+
+    def test_save_roundTrip(self):
+        """Tests that a saved table loads back with the same grid and values"""
+        table: CriticalValueTable = CriticalValueTable.build([0.9, 0.95], [1.0, 2.0], [3.0, 4.0], lambda p, df1, df2: p * df1 / df2)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "table.bin")
+            table.save(path)
+            loaded: CriticalValueTable = CriticalValueTable.load(path)
+            self.assertEqual(loaded.percentiles, table.percentiles)
+            self.assertEqual(loaded.dfs1, table.dfs1)
+            self.assertEqual(loaded.dfs2, table.dfs2)
+            self.assertEqual(list(loaded.values), list(table.values))
+
+    def test_save_littleEndian(self):
+        """Tests that the header and values are written little endian whatever the platform"""
+        table: CriticalValueTable = CriticalValueTable.build([0.95], [1.0, 2.0], [], lambda p, df: p + df)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "table.bin")
+            table.save(path)
+            with open(path, "rb") as file:
+                contents: bytes = file.read()
+        self.assertEqual(struct.unpack_from("<8sqqq", contents, 0)[1:], (1, 2, 0))
+        self.assertEqual(struct.unpack_from("<5d", contents, 32), (0.95, 1.0, 2.0, 1.95, 2.95))
+
+    def test_save_roundTripBigEndian(self):
+        """Tests that a big endian platform swaps the values on save and back on load"""
+        table: CriticalValueTable = CriticalValueTable.build([0.9, 0.95], [1.0, 2.0], [], lambda p, df: p + df)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "table.bin")
+            with mock.patch.object(sys, "byteorder", "big"):
+                table.save(path)
+                loaded: CriticalValueTable = CriticalValueTable.load(path)
+            self.assertEqual(loaded.percentiles, table.percentiles)
+            self.assertEqual(loaded.dfs1, table.dfs1)
+            self.assertEqual(list(loaded.values), list(table.values))
+
+    def test_load_invalidFile(self):
+        """Tests that load raises an error for a file which is not a saved table"""
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "table.bin")
+            with open(path, "wb") as file:
+                file.write(b"not a table at all, just some bytes")
+            self.assertRaises(ValueError, CriticalValueTable.load, path)
+
+    def test_loadShared_missingFile(self):
+        """Tests that loadShared returns None when the file does not exist"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(CriticalValueTable.loadShared(os.path.join(directory, "missing.bin")))
+
+    def test_loadShared_invalidFile(self):
+        """Tests that loadShared returns None rather than raising when the file is not a readable table"""
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "table.bin")
+            with open(path, "wb") as file:
+                file.write(b"not a table at all, just some bytes")
+            self.assertIsNone(CriticalValueTable.loadShared(path))
+
+    def test_loadShared_directory(self):
+        """Tests that loadShared returns None rather than raising when the path cannot be opened"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(CriticalValueTable.loadShared(directory))
@@ -0,0 +1,48 @@
+import unittest
+from PopulationCentralValueInference.NormalCentralValueAnalyzer import NormalCentralValueAnalyzer
+from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
+from Utilities.NormalDistriution.DefaultNormalDistribution import DefaultNormalDistribution
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+
+TEST_VALUES: list = [0.593, 0.142 ,0.329 ,0.691 ,0.231, 0.793, 0.519, 0.392, 0.418]
+
+class DefaultNormalDistributionTests(unittest.TestCase):
+    """Unit testing class for the DefaultNormalDistribution"""
+
+    def setUp(self):
+        self.previous = DefaultNormalDistribution.getImplementation()
+
+    def tearDown(self):
+        DefaultNormalDistribution.setImplementation(self.previous)
+
+    def test_getImplementation_byDefault(self):
+        """Tests that the approximate normal table is the default implementation"""
+        self.assertIsInstance(DefaultNormalDistribution.getImplementation(), ApproximateNormalTable)
+
+    def test_setImplementation_forwardsCalls(self):
+        """Tests that calls are forwarded to the selected implementation"""
+        DefaultNormalDistribution.setImplementation(ErfNormalDistribution())
+        dist: DefaultNormalDistribution = DefaultNormalDistribution()
+        self.assertEqual(dist.getZPercentileValue(0.975), ErfNormalDistribution().getZPercentileValue(0.975))
+        self.assertEqual(dist.getLeftTailArea(1.5), ErfNormalDistribution().getLeftTailArea(1.5))
+
+    def test_setImplementation_forwardsBatchCalls(self):
+        """Tests that batch calls are forwarded to the selected implementation"""
+        DefaultNormalDistribution.setImplementation(ErfNormalDistribution())
+        dist: DefaultNormalDistribution = DefaultNormalDistribution()
+        self.assertEqual(list(dist.getLeftTailAreaBatch([0, 1.5])), ErfNormalDistribution().getLeftTailAreaBatch([0, 1.5]))
+
+    def test_setImplementation_usedByAnalyzers(self):
+        """Tests that analyzers constructed without a normal distribution use the selected one"""
+        DefaultNormalDistribution.setImplementation(ErfNormalDistribution())
+        analyzer: NormalCentralValueAnalyzer = NormalCentralValueAnalyzer(TEST_VALUES)
+        explicit: NormalCentralValueAnalyzer = NormalCentralValueAnalyzer(TEST_VALUES, ErfNormalDistribution())
+        self.assertEqual(analyzer.getConfidenceInterval(0.95), explicit.getConfidenceInterval(0.95))
+
+    def test_setImplementation_whenNone(self):
+        """Tests that setImplementation raises an error when given a null distribution"""
+        self.assertRaises(ValueError, DefaultNormalDistribution.setImplementation, None)
+
+    def test_setImplementation_whenDefault(self):
+        """Tests that setImplementation raises an error when asked to forward to itself"""
+        self.assertRaises(ValueError, DefaultNormalDistribution.setImplementation, DefaultNormalDistribution())
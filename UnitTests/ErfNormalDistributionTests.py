@@ -0,0 +1,69 @@
+import math
+import unittest
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+
+class ErfNormalDistributionTests(unittest.TestCase):
+    """Unit testing class for the ErfNormalDistribution"""
+
+    def test_getLeftTailArea_whenCalled(self):
+        """Tests the value of getLeftTailArea when called with a legal argument"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertAlmostEqual(dist.getLeftTailArea(1.96), 0.9750021048517795, places=15)
+
+    def test_getLeftTailArea_farTail(self):
+        """Tests that getLeftTailArea is not truncated beyond five standard deviations"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertAlmostEqual(dist.getLeftTailArea(-6) / 9.865876450376981e-10, 1, places=12)
+
+    def test_getLeftTailArea_whenNone(self):
+        """Tests that getLeftTailArea raises an error when given a null argument"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertRaises(ValueError, dist.getLeftTailArea, None)
+
+    def test_getZPercentileValue_whenCalled(self):
+        """Tests the value of getZPercentileValue when called with a legal argument"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertAlmostEqual(dist.getZPercentileValue(0.975), 1.959963984540054, places=14)
+
+    def test_getZPercentileValue_lowerTail(self):
+        """Tests the value of getZPercentileValue in the lower tail region of the approximation"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertAlmostEqual(dist.getZPercentileValue(0.001), -3.090232306167813, places=13)
+
+    def test_getZPercentileValue_inverse(self):
+        """Tests that getZPercentileValue inverts getLeftTailArea"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        for percentile in (1e-12, 0.01, 0.3, 0.5, 0.7, 0.99, 1 - 1e-12):
+            self.assertAlmostEqual(dist.getLeftTailArea(dist.getZPercentileValue(percentile)) / percentile, 1, places=10)
+
+    def test_getZPercentileValue_whenZeroOrOne(self):
+        """Tests that getZPercentileValue returns infinite values at zero and one"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertEqual(dist.getZPercentileValue(0), -math.inf)
+        self.assertEqual(dist.getZPercentileValue(1), math.inf)
+
+    def test_getZPercentileValueBatch_whenCalled(self):
+        """Tests that getZPercentileValueBatch matches getZPercentileValue for each percentile"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        percentiles: list = [0.001, 0.5, 0.975]
+        self.assertEqual(list(dist.getZPercentileValueBatch(percentiles)), [dist.getZPercentileValue(p) for p in percentiles])
+
+    def test_getLeftTailAreaBatch_whenNone(self):
+        """Tests that getLeftTailAreaBatch raises an error when given a null argument"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertRaises(ValueError, dist.getLeftTailAreaBatch, None)
+
+    def test_getZPercentileValue_whenNone(self):
+        """Tests that getZPercentileValue raises an error when given a null argument"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertRaises(ValueError, dist.getZPercentileValue, None)
+
+    def test_getZPercentileValue_whenNegative(self):
+        """Tests that getZPercentileValue raises an error when given a negative argument"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertRaises(ValueError, dist.getZPercentileValue, -1)
+
+    def test_getZPercentileValue_whenOverOne(self):
+        """Tests that getZPercentileValue raises an error when given an argument over 1"""
+        dist: ErfNormalDistribution = ErfNormalDistribution()
+        self.assertRaises(ValueError, dist.getZPercentileValue, 2)
@@ -0,0 +1,23 @@
+import unittest
+from Utilities.FDistribution.IncompleteBetaFDistribution import IncompleteBetaFDistribution
+
+class IncompleteBetaFDistributionTests(unittest.TestCase):
+    """Unit testing class for the IncompleteBetaFDistribution"""
+
+    def test_getFUpperValue_whenCalled(self):
+        """Tests the upper and lower critical values against reference values"""
+        fDist: IncompleteBetaFDistribution = IncompleteBetaFDistribution()
+        self.assertAlmostEqual(fDist.getFUpperValue(0.95, 5, 7), 5.285236851504278, places=10)
+        self.assertAlmostEqual(fDist.getFLowerValue(0.95, 5, 7), 0.14591988388835192, places=12)
+
+    def test_getFPercentileValue_whenCalled(self):
+        """Tests getFPercentileValue against reference values, including far into the tail of a heavy tailed distribution"""
+        fDist: IncompleteBetaFDistribution = IncompleteBetaFDistribution()
+        self.assertAlmostEqual(fDist.getFPercentileValue(0.5, 120, 1000), 0.9951135544852386, places=12)
+        self.assertAlmostEqual(fDist.getFPercentileValue(0.999, 1, 1) / 405284.0679028482, 1, places=11)
+
+    def test_getFPercentileValue_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        fDist: IncompleteBetaFDistribution = IncompleteBetaFDistribution()
+        self.assertRaises(ValueError, fDist.getFPercentileValue, 1.5, 5, 7)
+        self.assertRaises(ValueError, fDist.getFUpperValue, 0.95, 5, 0)
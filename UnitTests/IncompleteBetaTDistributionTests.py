@@ -0,0 +1,34 @@
+import math
+import unittest
+from Utilities.TDistribution.IncompleteBetaTDistribution import IncompleteBetaTDistribution
+
+class IncompleteBetaTDistributionTests(unittest.TestCase):
+    """Unit testing class for the IncompleteBetaTDistribution"""
+
+    def test_getLeftTailArea_whenCalled(self):
+        """Tests getLeftTailArea against reference values on both sides of zero"""
+        tDist: IncompleteBetaTDistribution = IncompleteBetaTDistribution()
+        self.assertAlmostEqual(tDist.getLeftTailArea(2.2, 8), 0.9705030460420883, places=14)
+        self.assertAlmostEqual(tDist.getLeftTailArea(-2.2, 8), 1 - 0.9705030460420883, places=14)
+        self.assertEqual(tDist.getLeftTailArea(0, 8), 0.5)
+
+    def test_getTPercentileValue_whenCalled(self):
+        """Tests getTPercentileValue against reference values, including far into the tail of a heavy tailed distribution"""
+        tDist: IncompleteBetaTDistribution = IncompleteBetaTDistribution()
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.975, 3), 3.1824463052837078, places=11)
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.01, 40.5), -2.422014158905033, places=11)
+        self.assertAlmostEqual(tDist.getTPercentileValue(1e-6, 1) / -318309.8861827435, 1, places=11)
+
+    def test_getTPercentileValue_atBounds(self):
+        """Tests getTPercentileValue at the ends of its range and at the median"""
+        tDist: IncompleteBetaTDistribution = IncompleteBetaTDistribution()
+        self.assertEqual(tDist.getTPercentileValue(0, 5), -math.inf)
+        self.assertEqual(tDist.getTPercentileValue(1, 5), math.inf)
+        self.assertEqual(tDist.getTPercentileValue(0.5, 5), 0)
+
+    def test_getTPercentileValue_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        tDist: IncompleteBetaTDistribution = IncompleteBetaTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 1.5, 5)
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 0.5, 0)
+        self.assertRaises(ValueError, tDist.getLeftTailArea, None, 5)
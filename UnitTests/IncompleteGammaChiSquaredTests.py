@@ -0,0 +1,28 @@
+import unittest
+from Utilities.ChiSquaredDistribution.IncompleteGammaChiSquared import IncompleteGammaChiSquared
+
+class IncompleteGammaChiSquaredTests(unittest.TestCase):
+    """Unit testing class for the IncompleteGammaChiSquared"""
+
+    def test_getLeftTailArea_whenCalled(self):
+        """Tests getLeftTailArea against a reference value"""
+        chisquare: IncompleteGammaChiSquared = IncompleteGammaChiSquared()
+        self.assertAlmostEqual(chisquare.getLeftTailArea(9, 9), 0.5627258110861331, places=14)
+
+    def test_getChiSquaredUpperVal_whenCalled(self):
+        """Tests the upper and lower critical values against reference values"""
+        chisquare: IncompleteGammaChiSquared = IncompleteGammaChiSquared()
+        self.assertAlmostEqual(chisquare.getChiSquaredUpperVal(0.95, 9), 19.022767798641638, places=10)
+        self.assertAlmostEqual(chisquare.getChiSquaredLowerVal(0.95, 9), 2.7003894999803584, places=10)
+
+    def test_getChiSquaredPercentileVal_farIntoTail(self):
+        """Tests getChiSquaredPercentileVal far into the lower tail of a single df"""
+        chisquare: IncompleteGammaChiSquared = IncompleteGammaChiSquared()
+        self.assertAlmostEqual(chisquare.getChiSquaredPercentileVal(1e-8, 1) / 1.5707963267948962e-16, 1, places=11)
+        self.assertEqual(chisquare.getChiSquaredPercentileVal(0, 1), 0)
+
+    def test_getChiSquaredPercentileVal_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        chisquare: IncompleteGammaChiSquared = IncompleteGammaChiSquared()
+        self.assertRaises(ValueError, chisquare.getChiSquaredPercentileVal, 1.5, 9)
+        self.assertRaises(ValueError, chisquare.getChiSquaredUpperVal, 0.95, -1)
@@ -0,0 +1,95 @@
+import json
+import unittest
+from Utilities.MomentSummary import MomentSummary
+from Utilities.SampleUtilities import SampleUtilities
+
+TEST_VALUES: list = [0.593, 0.142 ,0.329 ,0.691 ,0.231, 0.793, 0.519, 0.392, 0.418]
+
+class MomentSummaryTests(unittest.TestCase):
+    """Class for unit testing MomentSummary"""
+
+    def test_constructor_nNone(self):
+        """Tests that the constructor raises an error with a null n"""
+        self.assertRaises(ValueError, MomentSummary, None, 0.5, 1.0)
+
+    def test_constructor_nZero(self):
+        """Tests that the constructor raises an error with a zero n"""
+        self.assertRaises(ValueError, MomentSummary, 0, 0.5, 1.0)
+
+    def test_constructor_meanNone(self):
+        """Tests that the constructor raises an error with a null mean"""
+        self.assertRaises(ValueError, MomentSummary, 3, None, 1.0)
+
+    def test_constructor_m2Negative(self):
+        """Tests that the constructor raises an error with a negative m2"""
+        self.assertRaises(ValueError, MomentSummary, 3, 0.5, -1.0)
+
+    def test_constructor_onlyM3(self):
+        """Tests that the constructor raises an error when only m3 is given"""
+        self.assertRaises(ValueError, MomentSummary, 3, 0.5, 1.0, 0.2)
+
+    def test_fromValues_whenCalled(self):
+        """Tests the fields of fromValues when called with legal arguments"""
+        summary: MomentSummary = MomentSummary.fromValues(TEST_VALUES)
+        self.assertEqual(len(summary), 9)
+        self.assertEqual(summary.getMean(), SampleUtilities.estimateMean(TEST_VALUES))
+        self.assertEqual(summary.getVariance(), SampleUtilities.estimateVariance(TEST_VALUES))
+        self.assertEqual(summary.getStdDev(), SampleUtilities.estimateStdDev(TEST_VALUES))
+
+    def test_fromStatistics_whenCalled(self):
+        """Tests that fromStatistics reproduces the given mean and standard deviation"""
+        summary: MomentSummary = MomentSummary.fromStatistics(9, 0.45644444444444443, 0.21284390472310402)
+        self.assertEqual(len(summary), 9)
+        self.assertEqual(summary.getMean(), 0.45644444444444443)
+        self.assertAlmostEqual(summary.getStdDev(), 0.21284390472310402)
+
+    def test_fromStatistics_stdDevNone(self):
+        """Tests that fromStatistics raises an error with a null standard deviation"""
+        self.assertRaises(ValueError, MomentSummary.fromStatistics, 9, 0.5, None)
+
+    def test_getVariance_singleValue(self):
+        """Tests that getVariance raises an error for a summary of a single value"""
+        self.assertRaises(ValueError, MomentSummary.fromValues([1.0]).getVariance)
+
+    def test_merge_whenCalled(self):
+        """Tests that merging the summaries of two shards matches the summary of the whole sample"""
+        merged: MomentSummary = MomentSummary.fromValues(TEST_VALUES[:4], True).merge(MomentSummary.fromValues(TEST_VALUES[4:], True))
+        whole: MomentSummary = MomentSummary.fromValues(TEST_VALUES, True)
+        self.assertEqual(merged.n, whole.n)
+        self.assertAlmostEqual(merged.mean, whole.mean)
+        self.assertAlmostEqual(merged.m2, whole.m2)
+        self.assertAlmostEqual(merged.m3, whole.m3)
+        self.assertAlmostEqual(merged.m4, whole.m4)
+
+    def test_merge_withoutHigherMoments(self):
+        """Tests that merging drops the higher moments when only one shard tracks them"""
+        merged: MomentSummary = MomentSummary.fromValues(TEST_VALUES[:4], True).merge(MomentSummary.fromValues(TEST_VALUES[4:]))
+        self.assertAlmostEqual(merged.getVariance(), SampleUtilities.estimateVariance(TEST_VALUES))
+        self.assertIsNone(merged.m3)
+        self.assertIsNone(merged.m4)
+
+    def test_merge_otherNone(self):
+        """Tests that merge raises an error when given a null summary"""
+        self.assertRaises(ValueError, MomentSummary.fromValues(TEST_VALUES).merge, None)
+
+    def test_combine_whenCalled(self):
+        """Tests that combining the summaries of many shards matches the summary of the whole sample"""
+        shards: list = [MomentSummary.fromValues(TEST_VALUES[i:i+3]) for i in range(0, 9, 3)]
+        combined: MomentSummary = MomentSummary.combine(shards)
+        self.assertEqual(combined.n, 9)
+        self.assertAlmostEqual(combined.getMean(), SampleUtilities.estimateMean(TEST_VALUES))
+        self.assertAlmostEqual(combined.getVariance(), SampleUtilities.estimateVariance(TEST_VALUES))
+
+    def test_combine_summariesEmpty(self):
+        """Tests that combine raises an error when given no summaries"""
+        self.assertRaises(ValueError, MomentSummary.combine, [])
+
+    def test_toDict_roundTrip(self):
+        """Tests that a summary survives a round trip through json"""
+        summary: MomentSummary = MomentSummary.fromValues(TEST_VALUES, True)
+        restored: MomentSummary = MomentSummary.fromDict(json.loads(json.dumps(summary.toDict())))
+        self.assertEqual(restored.toDict(), summary.toDict())
+
+    def test_fromDict_fieldsNone(self):
+        """Tests that fromDict raises an error when given null fields"""
+        self.assertRaises(ValueError, MomentSummary.fromDict, None)
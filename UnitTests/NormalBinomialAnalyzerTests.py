@@ -73,6 +73,64 @@ class NormalBinomialAnalyzerTests(unittest.TestCase):
         analyzer: NormalBinomialAnalyzer = NormalBinomialAnalyzer(TEST_VALUES)
         self.assertRaises(ValueError, analyzer.getConfidenceInterval, 2)
 
+    def test_constructor_betaDistNone(self):
+        """Tests that the constructor raises an error with a null betaDist"""
+        self.assertRaises(ValueError, NormalBinomialAnalyzer, values=TEST_VALUES, betaDist=None)
+
+    def test_getClopperPearsonInterval_whenCalled(self):
+        """Tests the value of getClopperPearsonInterval when called with legal arguments"""
+        analyzer: NormalBinomialAnalyzer = NormalBinomialAnalyzer(TEST_VALUES)
+        interval: tuple = analyzer.getClopperPearsonInterval(0.95)
+        self.assertAlmostEqual(interval[0], 0.077871546291031)
+        self.assertAlmostEqual(interval[1], 0.5510032410369711)
+
+    def test_getJeffreysInterval_whenCalled(self):
+        """Tests the value of getJeffreysInterval when called with legal arguments"""
+        analyzer: NormalBinomialAnalyzer = NormalBinomialAnalyzer(TEST_VALUES)
+        interval: tuple = analyzer.getJeffreysInterval(0.95)
+        self.assertAlmostEqual(interval[0], 0.0974109258026848)
+        self.assertAlmostEqual(interval[1], 0.5166215050118854)
+
+    def test_clopperPearsonInterval_extremeCounts(self):
+        """Tests that the Clopper-Pearson bounds are fixed at 0 and 1 when no trial or every trial succeeded"""
+        self.assertEqual(NormalBinomialAnalyzer.clopperPearsonInterval(0, 5, 0.95)[0], 0)
+        self.assertAlmostEqual(NormalBinomialAnalyzer.clopperPearsonInterval(0, 5, 0.95)[1], 0.5218237501049814)
+        self.assertAlmostEqual(NormalBinomialAnalyzer.clopperPearsonInterval(5, 5, 0.95)[0], 0.47817624989501856)
+        self.assertEqual(NormalBinomialAnalyzer.clopperPearsonInterval(5, 5, 0.95)[1], 1)
+
+    def test_jeffreysInterval_extremeCounts(self):
+        """Tests that the Jeffreys bounds are fixed at 0 and 1 when no trial or every trial succeeded"""
+        self.assertEqual(NormalBinomialAnalyzer.jeffreysInterval(0, 5, 0.95)[0], 0)
+        self.assertEqual(NormalBinomialAnalyzer.jeffreysInterval(5, 5, 0.95)[1], 1)
+
+    def test_clopperPearsonIntervals_whenCalled(self):
+        """Tests that the batch Clopper-Pearson intervals match the single intervals"""
+        successes: list = [0, 4, 15, 1]
+        trials: list = [5, 15, 15, 1000]
+        intervals: list = NormalBinomialAnalyzer.clopperPearsonIntervals(successes, trials, 0.95)
+        for i in range(len(successes)):
+            self.assertEqual(intervals[i], NormalBinomialAnalyzer.clopperPearsonInterval(successes[i], trials[i], 0.95))
+
+    def test_jeffreysIntervals_whenCalled(self):
+        """Tests that the batch Jeffreys intervals match the single intervals"""
+        successes: list = [0, 4, 15, 1]
+        trials: list = [5, 15, 15, 1000]
+        intervals: list = NormalBinomialAnalyzer.jeffreysIntervals(successes, trials, 0.95)
+        for i in range(len(successes)):
+            self.assertEqual(intervals[i], NormalBinomialAnalyzer.jeffreysInterval(successes[i], trials[i], 0.95))
+
+    def test_clopperPearsonIntervals_moreSuccessesThanTrials(self):
+        """Tests that the batch intervals raise an error when a segment has more successes than trials"""
+        self.assertRaises(ValueError, NormalBinomialAnalyzer.clopperPearsonIntervals, [6], [5], 0.95)
+
+    def test_clopperPearsonIntervals_lengthsDiffer(self):
+        """Tests that the batch intervals raise an error when the counts differ in length"""
+        self.assertRaises(ValueError, NormalBinomialAnalyzer.clopperPearsonIntervals, [1, 2], [5], 0.95)
+
+    def test_jeffreysInterval_confidenceLevelTooLarge(self):
+        """Tests that the Jeffreys interval raises an error with a confidence level over 1"""
+        self.assertRaises(ValueError, NormalBinomialAnalyzer.jeffreysInterval, 1, 5, 2)
+
     def test_sampleSizeForConfidenceInterval_whenCalled(self):
         """Tests the valye of sampleSizeForConfidenceInterval when called"""
         analyzer: NormalBinomialAnalyzer = NormalBinomialAnalyzer(TEST_VALUES)
@@ -18,6 +18,25 @@ class NormalCentralValueAnalyzerTests(unittest.TestCase):
         """Tests that the constructor raises an error with null normalDist"""
         self.assertRaises(ValueError, NormalCentralValueAnalyzer, values = TEST_VALUES, normalDist=None)
 
+    def test_constructor_retainSampleFalse(self):
+        """Tests that the constructor releases the sample when retainSample is False"""
+        analyzer: NormalCentralValueAnalyzer = NormalCentralValueAnalyzer(TEST_VALUES, retainSample=False)
+        self.assertIsNone(analyzer.sample)
+        self.assertEqual(analyzer.getMean(), NormalCentralValueAnalyzer(TEST_VALUES).getMean())
+
+    def test_fromSummary_whenCalled(self):
+        """Tests that fromSummary gives the same confidence interval as the raw sample"""
+        analyzer: NormalCentralValueAnalyzer = NormalCentralValueAnalyzer(TEST_VALUES)
+        summarized: NormalCentralValueAnalyzer = NormalCentralValueAnalyzer.fromSummary(analyzer.n, analyzer.mean, analyzer.stdDev)
+        self.assertIsNone(summarized.sample)
+        self.assertEqual(summarized.n, 9)
+        self.assertAlmostEqual(summarized.getConfidenceInterval(0.95)[0], analyzer.getConfidenceInterval(0.95)[0])
+        self.assertAlmostEqual(summarized.getConfidenceInterval(0.95)[1], analyzer.getConfidenceInterval(0.95)[1])
+
+    def test_fromSummary_stdDevNegative(self):
+        """Tests that fromSummary raises an error with a negative standard deviation"""
+        self.assertRaises(ValueError, NormalCentralValueAnalyzer.fromSummary, 9, 0.5, -1)
+
     def test_getMean_whenCalled(self):
         """Tests the value of getMean when called"""
         analyzer: NormalCentralValueAnalyzer = NormalCentralValueAnalyzer(TEST_VALUES)
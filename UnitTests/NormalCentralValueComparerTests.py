@@ -1,5 +1,6 @@
 import unittest
 from PopulationComparisonInference.CentralValue.NormalCentralValueComparer import NormalCentralValueComparer
+from Utilities.MomentSummary import MomentSummary
 
 class NormalCentralValueComparerTests(unittest.TestCase):
     """Unit testing class for the NormalCentralValueComparer"""
@@ -24,6 +25,30 @@ class NormalCentralValueComparerTests(unittest.TestCase):
         """Tests that the constructor raises an error with null tDist"""
         self.assertRaises(ValueError, NormalCentralValueComparer, sample1 = [1, 2], sample2 = [1, 2], tDist=None)
 
+    def test_constructor_summaries(self):
+        """Tests that the constructor gives the same estimates from merged shard summaries as from the raw samples"""
+        sample1: list = [1.2, 3.4, 2.2, 5.1, 4.4, 2.9]
+        sample2: list = [2.5, 1.1, 0.7, 3.3]
+        summary1: MomentSummary = MomentSummary.fromValues(sample1[:3]).merge(MomentSummary.fromValues(sample1[3:]))
+        fromSummaries: NormalCentralValueComparer = NormalCentralValueComparer(summary1, MomentSummary.fromValues(sample2))
+        fromSamples: NormalCentralValueComparer = NormalCentralValueComparer(sample1, sample2)
+        self.assertIsNone(fromSummaries.sample1)
+        self.assertEqual(fromSummaries.n1, fromSamples.n1)
+        self.assertAlmostEqual(fromSummaries.mean1, fromSamples.mean1)
+        self.assertAlmostEqual(fromSummaries.var1, fromSamples.var1)
+        self.assertAlmostEqual(fromSummaries.df, fromSamples.df)
+
+    def test_fromSummary_whenCalled(self):
+        """Tests that fromSummary sets the sample statistics of both populations"""
+        comparer: NormalCentralValueComparer = NormalCentralValueComparer.fromSummary(33, 25.2, 8.6, 12, 33.9, 17.4)
+        self.assertIsNone(comparer.sample1)
+        self.assertIsNone(comparer.sample2)
+        self.assertEqual(comparer.n1, 33)
+        self.assertAlmostEqual(comparer.var1, 8.6 ** 2)
+        self.assertEqual(comparer.n2, 12)
+        self.assertAlmostEqual(comparer.mean2, 33.9)
+        self.assertAlmostEqual(comparer.var2, 17.4 ** 2)
+
     def test_getConfidenceInterval_whenCalled(self):
         """Tests the value of getConfidenceInterval when called"""
         comparer: NormalCentralValueComparer = NormalCentralValueComparer([1, 2], [1, 2])
@@ -19,6 +19,12 @@ class NormalVarianceAnalyzerTests(unittest.TestCase):
         """Tests that the constructor raises an error with null chisquare"""
         self.assertRaises(ValueError, NormalVarianceAnalyzer, values = TEST_VALUES_A, chisquare=None)
 
+    def test_fromSummary_whenCalled(self):
+        """Tests that fromSummary gives the same sample variance as the raw sample"""
+        analyzer: NormalVarianceAnalyzer = NormalVarianceAnalyzer.fromSummary(30, 500.453, 11.788781609195413 ** 0.5)
+        self.assertIsNone(analyzer.values)
+        self.assertAlmostEqual(analyzer.getSampleVariance(), 11.788781609195413)
+
     def test_getSampleVariance_whenCalled(self):
         """Tests the value of getSampleVariance when called"""
         analyzer: NormalVarianceAnalyzer = NormalVarianceAnalyzer(TEST_VALUES_A)
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import unittest
+from Utilities.OptionalDependencies import OptionalDependencies
+
+class OptionalDependenciesTests(unittest.TestCase):
+    """Unit testing class for the OptionalDependencies"""
+
+    def test_load_whenInstalled(self):
+        """Tests that load returns the same installed module on every call"""
+        self.assertIs(OptionalDependencies.load("statistics"), sys.modules["statistics"])
+        self.assertIs(OptionalDependencies.load("statistics"), OptionalDependencies.load("statistics"))
+
+    def test_load_whenMissing(self):
+        """Tests that load returns None for a module which is not installed"""
+        self.assertIsNone(OptionalDependencies.load("notAnInstalledModule"))
+
+    def test_require_whenInstalled(self):
+        """Tests that require returns the same module as load"""
+        self.assertIs(OptionalDependencies.require("statistics"), OptionalDependencies.load("statistics"))
+
+    def test_require_whenMissing(self):
+        """Tests that require raises an import error for a module which is not installed"""
+        self.assertRaises(ImportError, OptionalDependencies.require, "notAnInstalledModule")
+
+    def test_import_doesNotLoadDependencies(self):
+        """Tests that importing the analyzers and comparers does not import numpy or scipy"""
+        script: str = "\n".join([
+            "import sys",
+            "import CategoricalPopulationInference.NormalBinomialAnalyzer",
+            "import PopulationCentralValueInference.TDistributionCentralValueAnalyzer",
+            "import PopulationVarianceInference.NormalVarianceAnalyzer",
+            "print(sorted(name for name in ('numpy', 'scipy') if name in sys.modules))"])
+        root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output: str = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
@@ -1,7 +1,13 @@
 import unittest
 import random
+from array import array
 from Utilities.SampleUtilities import SampleUtilities
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 TEST_VALUES: list = [0.593, 0.142 ,0.329 ,0.691 ,0.231, 0.793, 0.519, 0.392, 0.418]
 
 class SampleUtilitiesTests(unittest.TestCase):
@@ -43,6 +49,84 @@ class SampleUtilitiesTests(unittest.TestCase):
         """Tests that estimateVariance raises an error when called with empty values"""
         self.assertRaises(ValueError, SampleUtilities.estimateVariance, [])
 
+    def test_estimateMeanAndVariance_whenCalled(self):
+        """Tests the value of estimateMeanAndVariance when called with legal arguments"""
+        mean, variance = SampleUtilities.estimateMeanAndVariance(TEST_VALUES)
+        self.assertEqual(mean, SampleUtilities.estimateMean(TEST_VALUES))
+        self.assertEqual(variance, SampleUtilities.estimateVariance(TEST_VALUES))
+
+    def test_estimateMeanAndVariance_valuesNull(self):
+        """Tests that estimateMeanAndVariance raises an error when called with null values"""
+        self.assertRaises(ValueError, SampleUtilities.estimateMeanAndVariance, None)
+
+    def test_estimateMeanAndVariance_singleValue(self):
+        """Tests that estimateMeanAndVariance raises an error when called with a single value"""
+        self.assertRaises(ValueError, SampleUtilities.estimateMeanAndVariance, [1.0])
+
+    def test_estimateMoments_whenCalled(self):
+        """Tests the value of estimateMoments when called with legal arguments"""
+        n, mean, m2, m3, m4 = SampleUtilities.estimateMoments(TEST_VALUES)
+        self.assertEqual(n, 9)
+        self.assertEqual(mean, 0.45644444444444443)
+        self.assertAlmostEqual(m2, 0.36242022222222225)
+        self.assertIsNone(m3)
+        self.assertIsNone(m4)
+
+    def test_estimateMoments_higherMoments(self):
+        """Tests the value of estimateMoments when the higher moments are requested"""
+        n, mean, m2, m3, m4 = SampleUtilities.estimateMoments(TEST_VALUES, higherMoments=True)
+        self.assertEqual(n, 9)
+        self.assertEqual(mean, 0.45644444444444443)
+        self.assertAlmostEqual(m2, 0.36242022222222225)
+        self.assertAlmostEqual(m3, 0.008873632246913607)
+        self.assertAlmostEqual(m4, 0.02886261066035391)
+
+    def test_estimateMoments_valuesEmpty(self):
+        """Tests that estimateMoments raises an error when called with empty values"""
+        self.assertRaises(ValueError, SampleUtilities.estimateMoments, [])
+
+    def test_estimateMeanAndVariance_array(self):
+        """Tests the value of estimateMeanAndVariance when called with a buffer-protocol array"""
+        mean, variance = SampleUtilities.estimateMeanAndVariance(array('d', TEST_VALUES))
+        self.assertAlmostEqual(mean, 0.45644444444444443)
+        self.assertAlmostEqual(variance, 0.04530252777777778)
+
+    def test_estimateMoments_array(self):
+        """Tests the value of estimateMoments when called with a buffer-protocol array"""
+        n, mean, m2, m3, m4 = SampleUtilities.estimateMoments(array('d', TEST_VALUES), higherMoments=True)
+        self.assertEqual(n, 9)
+        self.assertAlmostEqual(mean, 0.45644444444444443)
+        self.assertAlmostEqual(m2, 0.36242022222222225)
+        self.assertAlmostEqual(m3, 0.008873632246913607)
+        self.assertAlmostEqual(m4, 0.02886261066035391)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_estimateStdDev_ndarray(self):
+        """Tests the value of estimateStdDev when called with a numpy array"""
+        self.assertAlmostEqual(SampleUtilities.estimateStdDev(numpy.array(TEST_VALUES)), 0.21284390472310402)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_asArray_sharesMemory(self):
+        """Tests that asArray views a float array without copying it"""
+        values: array = array('d', TEST_VALUES)
+        self.assertTrue(numpy.shares_memory(SampleUtilities.asArray(values), values))
+
+    def test_asArray_list(self):
+        """Tests that asArray leaves lists to the pure python path"""
+        self.assertIsNone(SampleUtilities.asArray(TEST_VALUES))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_asArray_multidimensional(self):
+        """Tests that asArray rejects arrays which are not one dimensional"""
+        self.assertRaises(ValueError, SampleUtilities.asArray, numpy.ones((2, 3)))
+        self.assertRaises(ValueError, SampleUtilities.estimateMean, numpy.ones((2, 3)))
+        self.assertRaises(ValueError, SampleUtilities.estimateVariance, numpy.ones((3, 2)))
+
+    def test_asArray_bytes(self):
+        """Tests that asArray rejects bytes rather than reading them as samples"""
+        self.assertRaises(ValueError, SampleUtilities.asArray, b"\x01\x02")
+        self.assertRaises(ValueError, SampleUtilities.estimateMean, bytearray(b"\x01\x02"))
+
     def test_bootstrap_whenCalled(self):
         """Tests the value of bootstrap when called with legal arguments"""
         random.seed(1)
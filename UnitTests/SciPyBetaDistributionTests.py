@@ -0,0 +1,51 @@
+import unittest
+from Utilities.BetaDistribution.SciPyBetaDistribution import SciPyBetaDistribution
+
+class SciPyBetaDistributionTests(unittest.TestCase):
+    """Unit testing class for the SciPyBetaDistribution"""
+
+    def test_getLeftTailArea_whenCalled(self):
+        """Tests the value of getLeftTailArea when called with legal arguments"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertAlmostEqual(betaDist.getLeftTailArea(0.5, 2, 3), 0.6875)
+
+    def test_getLeftTailArea_whenValNone(self):
+        """Tests that getLeftTailArea raises a value exception when given a null value"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertRaises(ValueError, betaDist.getLeftTailArea, None, 2, 3)
+
+    def test_getLeftTailArea_whenShapeNonPositive(self):
+        """Tests that getLeftTailArea raises a value exception when given a non-positive shape parameter"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertRaises(ValueError, betaDist.getLeftTailArea, 0.5, 0, 3)
+        self.assertRaises(ValueError, betaDist.getLeftTailArea, 0.5, 2, -1)
+
+    def test_getBetaPercentileValue_whenCalled(self):
+        """Tests that getBetaPercentileValue inverts getLeftTailArea"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertAlmostEqual(betaDist.getBetaPercentileValue(0.6875, 2, 3), 0.5)
+
+    def test_getBetaPercentileValue_whenPercentileOverOne(self):
+        """Tests that getBetaPercentileValue raises a value exception when given a percentile over 1"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertRaises(ValueError, betaDist.getBetaPercentileValue, 2, 2, 3)
+
+    def test_getBetaPercentileValueBatch_whenCalled(self):
+        """Tests that getBetaPercentileValueBatch matches getBetaPercentileValue for each percentile"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        percentiles: list = [0.025, 0.5, 0.975]
+        a: list = [1, 2, 4.5]
+        b: list = [10, 3, 0.5]
+        values: list = betaDist.getBetaPercentileValueBatch(percentiles, a, b)
+        for i in range(3):
+            self.assertAlmostEqual(values[i], betaDist.getBetaPercentileValue(percentiles[i], a[i], b[i]))
+
+    def test_getBetaPercentileValueBatch_whenLengthsDiffer(self):
+        """Tests that getBetaPercentileValueBatch raises a value exception when its arguments differ in length"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertRaises(ValueError, betaDist.getBetaPercentileValueBatch, [0.5], [1, 2], [1, 2])
+
+    def test_getBetaPercentileValueBatch_whenShapeNonPositive(self):
+        """Tests that getBetaPercentileValueBatch raises a value exception when given a non-positive shape parameter"""
+        betaDist: SciPyBetaDistribution = SciPyBetaDistribution()
+        self.assertRaises(ValueError, betaDist.getBetaPercentileValueBatch, [0.5, 0.5], [1, 0], [1, 2])
@@ -0,0 +1,95 @@
+import unittest
+from unittest import mock
+from Utilities.ChiSquaredDistribution.SciPySpecialChiSquared import SciPySpecialChiSquared
+from Utilities.ChiSquaredDistribution.SciPyChiSquared import SciPyChiSquared
+from Utilities.OptionalDependencies import OptionalDependencies
+
+class SciPySpecialChiSquaredTests(unittest.TestCase):
+    """Unit testing class for the SciPySpecialChiSquared"""
+
+    def test_getLeftTailArea_whenCalled(self):
+        """
+        Tests the value of getLeftTailArea when the given chi val within range of the bounds
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertAlmostEqual(chiSquareDist.getLeftTailArea(2.2, 8), 0.02574181652967084)
+
+    def test_getLeftTailArea_whenChiValNone(self):
+        """
+        Tests that the getLeftTailArea function raises a value exception when given a null chi val argument
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertRaises(ValueError, chiSquareDist.getLeftTailArea, None, 8)
+
+    def test_getChiSquaredPercentileVal_whenCalled(self):
+        """
+        Tests the value of getChiSquaredPercentileVal when the given arguments within range of the bounds
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertAlmostEqual(chiSquareDist.getChiSquaredPercentileVal(0.99, 8), 20.090235029663233)
+
+    def test_getChiSquaredPercentileVal_whenAreaOverOne(self):
+        """
+        Tests that the getChiSquaredPercentileVal function raises a value exception when given a too large area
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertRaises(ValueError, chiSquareDist.getChiSquaredPercentileVal, 2, 8)
+
+    def test_getChiSquaredUpperVal_whenCalled(self):
+        """
+        Tests the value of getChiSquaredUpperVal when the given arguments within range of the bounds
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertAlmostEqual(chiSquareDist.getChiSquaredUpperVal(0.99, 8), 21.954954990659534)
+
+    def test_getChiSquaredUpperVal_whenDFNone(self):
+        """
+        Tests that the getChiSquaredUpperVal function raises a value exception when given a null df argument
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertRaises(ValueError, chiSquareDist.getChiSquaredUpperVal, 0.99, None)
+
+    def test_getChiSquaredLowerVal_whenCalled(self):
+        """
+        Tests the value of getChiSquaredLowerVal when the given arguments within range of the bounds
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertAlmostEqual(chiSquareDist.getChiSquaredLowerVal(0.99, 8), 1.3444130870148103)
+
+    def test_getChiSquaredLowerVal_type1ConfidenceTooLarge(self):
+        """
+        Tests that the getChiSquaredLowerVal function raises a value exception when given a confidence level over 1
+        """
+        chiSquareDist: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertRaises(ValueError, chiSquareDist.getChiSquaredLowerVal, 2, 8)
+
+    def test_getLeftTailAreaBatch_whenCalled(self):
+        """Tests that getLeftTailAreaBatch matches getLeftTailArea for each value"""
+        chisquare: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        vals: list = [0.5, 9, 30]
+        dfs: list = [1, 9, 25]
+        self.assertEqual(list(chisquare.getLeftTailAreaBatch(vals, dfs)), [chisquare.getLeftTailArea(val, df) for val, df in zip(vals, dfs)])
+
+    def test_getChiSquaredPercentileValBatch_whenCalled(self):
+        """Tests that getChiSquaredPercentileValBatch matches getChiSquaredPercentileVal and SciPyChiSquared for each percentile"""
+        chisquare: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        percentiles: list = [0.025, 0.5, 0.975]
+        dfs: list = [1, 9, 25]
+        batch: list = list(chisquare.getChiSquaredPercentileValBatch(percentiles, dfs))
+        self.assertEqual(batch, [chisquare.getChiSquaredPercentileVal(p, df) for p, df in zip(percentiles, dfs)])
+        for value, expected in zip(batch, SciPyChiSquared().getChiSquaredPercentileValBatch(percentiles, dfs)):
+            self.assertAlmostEqual(value, expected, places=8)
+
+    def test_getChiSquaredPercentileValBatch_invalid(self):
+        """Tests that getChiSquaredPercentileValBatch raises an error for mismatched lengths or invalid entries"""
+        chisquare: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        self.assertRaises(ValueError, chisquare.getChiSquaredPercentileValBatch, [0.5, 0.9], [3])
+        self.assertRaises(ValueError, chisquare.getChiSquaredPercentileValBatch, [0.5, 1.5], [3, 3])
+        self.assertRaises(ValueError, chisquare.getLeftTailAreaBatch, [1, 2], [3, -3])
+
+    def test_getChiSquaredUpperVal_withoutSciPy(self):
+        """Tests that the pure Python fallback used when scipy is unavailable matches scipy"""
+        chisquare: SciPySpecialChiSquared = SciPySpecialChiSquared()
+        expected: float = chisquare.getChiSquaredUpperVal(0.95, 9)
+        with mock.patch.object(OptionalDependencies, "load", return_value=None):
+            self.assertAlmostEqual(chisquare.getChiSquaredUpperVal(0.95, 9), expected, places=10)
@@ -0,0 +1,92 @@
+import math
+import unittest
+from unittest import mock
+from Utilities.FDistribution.SciPySpecialFDistribution import SciPySpecialFDistribution
+from Utilities.FDistribution.SciPyFDistribution import SciPyFDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+
+class SciPySpecialFDistributionTests(unittest.TestCase):
+    """Unit testing class for the SciPySpecialFDistribution"""
+
+    def test_getFPercentileValue_whenCalled(self):
+        """
+        Tests the value of getFPercentileValue when the given arguments within range of the bounds
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertAlmostEqual(fDist.getFPercentileValue(0.975, 10, 7), 4.761116434996814)
+
+    def test_getFPercentileValue_whenDF1Negative(self):
+        """
+        Tests that the getFPercentileValue function raises a value exception when given a negative df1 argument
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertRaises(ValueError, fDist.getFPercentileValue, 0.5, -1, 7)
+
+    def test_getFPercentileValue_whenPercentileOverOne(self):
+        """
+        Tests that the getFPercentileValue function raises a value exception when given a too large percentile argument
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertRaises(ValueError, fDist.getFPercentileValue, 2, 10, 7)
+
+    def test_getFLowerValue_whenCalled(self):
+        """
+        Tests the value of getFLowerValue when the given arguments within range of the bounds
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertAlmostEqual(fDist.getFLowerValue(0.95, 39, 39), 0.5288993273080331)
+
+    def test_getFLowerValue_whenDF2None(self):
+        """
+        Tests that the getFLowerValue function raises a value exception when given a null df2 argument
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertRaises(ValueError, fDist.getFLowerValue, 0.95, 39, None)
+
+    def test_getFUpperValue_whenCalled(self):
+        """
+        Tests the value of getFUpperValue when the given arguments within range of the bounds
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertAlmostEqual(fDist.getFUpperValue(0.95, 39, 39), 1.8907189863329057)
+        self.assertAlmostEqual(fDist.getFUpperValue(0.95, 10, 7), 4.761116434996814)
+
+    def test_getFUpperValue_whenConfidenceLevelOne(self):
+        """
+        Tests that getFUpperValue returns infinity at a confidence level of one, as SciPyFDistribution does
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertEqual(fDist.getFUpperValue(1, 5, 7), math.inf)
+        self.assertEqual(fDist.getFUpperValue(1, 5, 7), SciPyFDistribution().getFUpperValue(1, 5, 7))
+
+    def test_getFUpperValue_whenConfidenceLevelNegative(self):
+        """
+        Tests that the getFUpperValue function raises a value exception when given a negative confidence level
+        """
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertRaises(ValueError, fDist.getFUpperValue, -0.95, 39, 39)
+
+    def test_getFPercentileValueBatch_whenCalled(self):
+        """Tests that getFPercentileValueBatch matches getFPercentileValue and SciPyFDistribution for each percentile"""
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        percentiles: list = [0.025, 0.5, 0.975]
+        dfs1: list = [3, 10, 39]
+        dfs2: list = [7, 10, 120]
+        batch: list = list(fDist.getFPercentileValueBatch(percentiles, dfs1, dfs2))
+        self.assertEqual(batch, [fDist.getFPercentileValue(p, df1, df2) for p, df1, df2 in zip(percentiles, dfs1, dfs2)])
+        for value, expected in zip(batch, SciPyFDistribution().getFPercentileValueBatch(percentiles, dfs1, dfs2)):
+            self.assertAlmostEqual(value, expected, places=10)
+
+    def test_getFPercentileValueBatch_invalid(self):
+        """Tests that getFPercentileValueBatch raises an error for mismatched lengths or invalid entries"""
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        self.assertRaises(ValueError, fDist.getFPercentileValueBatch, [0.5, 0.9], [3, 3], [7])
+        self.assertRaises(ValueError, fDist.getFPercentileValueBatch, [0.5, -0.1], [3, 3], [7, 7])
+        self.assertRaises(ValueError, fDist.getFPercentileValueBatch, [0.5, 0.9], [3, 3], [7, None])
+
+    def test_getFUpperValue_withoutSciPy(self):
+        """Tests that the pure Python fallback used when scipy is unavailable matches scipy"""
+        fDist: SciPySpecialFDistribution = SciPySpecialFDistribution()
+        expected: float = fDist.getFUpperValue(0.95, 39, 39)
+        with mock.patch.object(OptionalDependencies, "load", return_value=None):
+            self.assertAlmostEqual(fDist.getFUpperValue(0.95, 39, 39), expected, places=12)
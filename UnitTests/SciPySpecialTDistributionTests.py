@@ -0,0 +1,98 @@
+import unittest
+from unittest import mock
+from Utilities.TDistribution.SciPySpecialTDistribution import SciPySpecialTDistribution
+from Utilities.TDistribution.SciPyTDistribution import SciPyTDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+
+class SciPySpecialTDistributionTests(unittest.TestCase):
+    """Unit testing class for the SciPySpecialTDistribution"""
+
+    def test_getLeftTailArea_whenCalled(self):
+        """
+        Tests the value of getLeftTailArea when the given t val within range of the bounds
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertAlmostEqual(tDist.getLeftTailArea(2.2, 8), 0.9705030460420883)
+
+    def test_getLeftTailArea_matchesSciPyTDistribution(self):
+        """
+        Tests that getLeftTailArea matches the rv_continuous based implementation
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        for val, df in ((-3.1, 2), (0.4, 30), (2.2, 8)):
+            self.assertAlmostEqual(tDist.getLeftTailArea(val, df), SciPyTDistribution().getLeftTailArea(val, df), places=14)
+
+    def test_getLeftTailArea_whenTValNone(self):
+        """
+        Tests that the getLeftTailArea function raises a value exception when given a null t val argument
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertRaises(ValueError, tDist.getLeftTailArea, None, 8)
+
+    def test_getLeftTailArea_whenDFNegative(self):
+        """
+        Tests that the getLeftTailArea function raises a value exception when given a negative df argument
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertRaises(ValueError, tDist.getLeftTailArea, 1.96, -1)
+
+    def test_getTValue_whenCalled(self):
+        """
+        Tests the value of getTValue when the given arguments within range of the bounds
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.99, 8), 2.896459442760522)
+
+    def test_getTValue_whenDFNone(self):
+        """
+        Tests that the getTValue function raises a value exception when given a null df argument
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 0.5, None)
+
+    def test_getTValue_whenAreaOverOne(self):
+        """
+        Tests that the getTValue function raises a value exception when given a too large Area argument
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 2, 5)
+
+    def test_getTValue_whenAreaNone(self):
+        """
+        Tests that the getTValue function raises a value exception when given a null Area argument
+        """
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, None, 5)
+
+    def test_getLeftTailAreaBatch_whenCalled(self):
+        """Tests that getLeftTailAreaBatch matches getLeftTailArea for each value"""
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        vals: list = [-1.5, 0, 2.2]
+        dfs: list = [3, 8, 40.5]
+        self.assertEqual(list(tDist.getLeftTailAreaBatch(vals, dfs)), [tDist.getLeftTailArea(val, df) for val, df in zip(vals, dfs)])
+
+    def test_getTPercentileValueBatch_whenCalled(self):
+        """Tests that getTPercentileValueBatch matches getTPercentileValue and SciPyTDistribution for each percentile"""
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        percentiles: list = [0.025, 0.5, 0.975]
+        dfs: list = [3, 8, 40.5]
+        batch: list = list(tDist.getTPercentileValueBatch(percentiles, dfs))
+        self.assertEqual(batch, [tDist.getTPercentileValue(p, df) for p, df in zip(percentiles, dfs)])
+        for value, expected in zip(batch, SciPyTDistribution().getTPercentileValueBatch(percentiles, dfs)):
+            self.assertAlmostEqual(value, expected, places=10)
+
+    def test_getTPercentileValueBatch_invalid(self):
+        """Tests that getTPercentileValueBatch raises an error for mismatched lengths or invalid entries"""
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValueBatch, [0.5, 0.9], [3])
+        self.assertRaises(ValueError, tDist.getTPercentileValueBatch, [0.5, 1.5], [3, 3])
+        self.assertRaises(ValueError, tDist.getTPercentileValueBatch, [0.5, 0.9], [3, -1])
+        self.assertRaises(ValueError, tDist.getLeftTailAreaBatch, None, [3])
+
+    def test_getTPercentileValue_withoutSciPy(self):
+        """Tests that the pure Python fallback used when scipy is unavailable matches scipy"""
+        tDist: SciPySpecialTDistribution = SciPySpecialTDistribution()
+        expected: float = tDist.getTPercentileValue(0.975, 12)
+        with mock.patch.object(OptionalDependencies, "load", return_value=None):
+            self.assertAlmostEqual(tDist.getTPercentileValue(0.975, 12), expected, places=12)
+            self.assertEqual(len(tDist.getTPercentileValueBatch([0.975, 0.5], [12, 3])), 2)
@@ -0,0 +1,36 @@
+import math
+import unittest
+from Utilities.SpecialFunctions import SpecialFunctions
+
+class SpecialFunctionsTests(unittest.TestCase):
+    """Unit testing class for the SpecialFunctions"""
+
+    def test_incompleteBeta_whenCalled(self):
+        """Tests the incomplete beta function and its complement against reference values"""
+        lower, upper = SpecialFunctions.incompleteBeta(2.5, 4, 0.3)
+        self.assertAlmostEqual(lower, 0.3521975859067672, places=14)
+        self.assertAlmostEqual(upper, 1 - 0.3521975859067672, places=14)
+        self.assertAlmostEqual(SpecialFunctions.incompleteBeta(200, 300, 0.5)[1] / 3.543480264392538e-06, 1, places=11)
+
+    def test_incompleteBeta_atBounds(self):
+        """Tests the incomplete beta function at the ends of its range"""
+        self.assertEqual(SpecialFunctions.incompleteBeta(2, 3, 0), (0.0, 1.0))
+        self.assertEqual(SpecialFunctions.incompleteBeta(2, 3, 1), (1.0, 0.0))
+
+    def test_incompleteGamma_whenCalled(self):
+        """Tests the incomplete gamma function and its complement against reference values"""
+        self.assertAlmostEqual(SpecialFunctions.incompleteGamma(3, 2.0)[0], 0.32332358381693654, places=14)
+        self.assertAlmostEqual(SpecialFunctions.incompleteGamma(50, 80.0)[1] / 0.0001307839765914092, 1, places=11)
+        self.assertEqual(SpecialFunctions.incompleteGamma(3, 0), (0.0, 1.0))
+
+    def test_inverseIncompleteGamma_fromPoorGuess(self):
+        """Tests that the inverse recovers the argument from a guess many orders of magnitude off"""
+        lower, upper = SpecialFunctions.incompleteGamma(500, 481.0)
+        logX: float = SpecialFunctions.inverseIncompleteGamma(500, lower, upper, math.log(5))
+        self.assertAlmostEqual(math.exp(logX), 481.0, places=9)
+
+    def test_inverseIncompleteBeta_fromPoorGuess(self):
+        """Tests that the inverse recovers the log odds from a guess many orders of magnitude off"""
+        lower, upper = SpecialFunctions.incompleteBeta(0.25, 5000, 1e-40)
+        logOdds: float = SpecialFunctions.inverseIncompleteBeta(0.25, 5000, lower, upper, 0)
+        self.assertAlmostEqual(logOdds, math.log(1e-40 / (1 - 1e-40)), places=9)
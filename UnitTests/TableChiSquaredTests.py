@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from Utilities.ChiSquaredDistribution.SciPySpecialChiSquared import SciPySpecialChiSquared
+from Utilities.ChiSquaredDistribution.TableChiSquared import DEFAULT_PATH, TableChiSquared
+
+class TableChiSquaredTests(unittest.TestCase):
+    """Unit testing class for the TableChiSquared"""
+
+    def test_constructor_exactNone(self):
+        """Tests that the constructor raises an error with a null exact"""
+        self.assertRaises(ValueError, TableChiSquared, exact=None)
+
+    def test_getChiSquaredUpperVal_onGrid(self):
+        """Tests that tabulated critical values match the exact values without computing them"""
+        exact: mock.Mock = mock.Mock(wraps=SciPySpecialChiSquared())
+        chisquare: TableChiSquared = TableChiSquared(exact=exact)
+        self.assertEqual(chisquare.getChiSquaredUpperVal(0.95, 9), SciPySpecialChiSquared().getChiSquaredUpperVal(0.95, 9))
+        self.assertEqual(chisquare.getChiSquaredLowerVal(0.95, 9), SciPySpecialChiSquared().getChiSquaredLowerVal(0.95, 9))
+        self.assertEqual(chisquare.getChiSquaredPercentileVal(0.99, 10000), SciPySpecialChiSquared().getChiSquaredPercentileVal(0.99, 10000))
+        exact.getChiSquaredPercentileVal.assert_not_called()
+
+    def test_getChiSquaredPercentileVal_offGrid(self):
+        """Tests that percentiles and df outside the table fall back to the exact distribution"""
+        chisquare: TableChiSquared = TableChiSquared()
+        self.assertAlmostEqual(chisquare.getChiSquaredPercentileVal(0.5, 9), SciPySpecialChiSquared().getChiSquaredPercentileVal(0.5, 9), places=10)
+        self.assertAlmostEqual(chisquare.getChiSquaredPercentileVal(0.95, 20000), SciPySpecialChiSquared().getChiSquaredPercentileVal(0.95, 20000), places=8)
+
+    def test_getChiSquaredUpperVal_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        chisquare: TableChiSquared = TableChiSquared()
+        self.assertRaises(ValueError, chisquare.getChiSquaredUpperVal, 1.5, 9)
+        self.assertRaises(ValueError, chisquare.getChiSquaredLowerVal, 0.95, -1)
+
+    def test_getChiSquaredPercentileVal_unreadableTable(self):
+        """Tests that a table file which cannot be loaded falls back to the exact distribution"""
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "truncated.bin")
+            with open(DEFAULT_PATH, "rb") as source, open(path, "wb") as file:
+                file.write(source.read(100))
+            chisquare: TableChiSquared = TableChiSquared(path=path)
+            self.assertAlmostEqual(chisquare.getChiSquaredUpperVal(0.95, 9), SciPySpecialChiSquared().getChiSquaredUpperVal(0.95, 9), places=10)
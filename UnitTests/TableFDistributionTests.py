@@ -0,0 +1,41 @@
+import unittest
+from unittest import mock
+from Utilities.FDistribution.SciPySpecialFDistribution import SciPySpecialFDistribution
+from Utilities.FDistribution.TableFDistribution import TableFDistribution
+
+class TableFDistributionTests(unittest.TestCase):
+    """Unit testing class for the TableFDistribution"""
+
+    def test_constructor_exactNone(self):
+        """Tests that the constructor raises an error with a null exact"""
+        self.assertRaises(ValueError, TableFDistribution, exact=None)
+
+    def test_getFUpperValue_onGrid(self):
+        """Tests that tabulated critical values match the exact values without computing them"""
+        exact: mock.Mock = mock.Mock(wraps=SciPySpecialFDistribution())
+        fDist: TableFDistribution = TableFDistribution(exact=exact)
+        self.assertEqual(fDist.getFUpperValue(0.95, 5, 7), SciPySpecialFDistribution().getFUpperValue(0.95, 5, 7))
+        self.assertEqual(fDist.getFPercentileValue(0.99, 120, 1000), SciPySpecialFDistribution().getFPercentileValue(0.99, 120, 1000))
+        self.assertAlmostEqual(fDist.getFLowerValue(0.95, 5, 7), SciPySpecialFDistribution().getFLowerValue(0.95, 5, 7), places=12)
+        exact.getFPercentileValue.assert_not_called()
+
+    def test_getFUpperValue_repeated(self):
+        """Tests that repeated critical values match the first lookup and the percentile they derive from"""
+        fDist: TableFDistribution = TableFDistribution()
+        upper: float = fDist.getFUpperValue(0.95, 12, 20)
+        self.assertEqual(fDist.getFUpperValue(0.95, 12, 20), upper)
+        self.assertEqual(fDist.getFPercentileValue(0.975, 12, 20), upper)
+        self.assertEqual(fDist.getFLowerValue(0.95, 12, 20), fDist.getFLowerValue(0.95, 12, 20))
+        self.assertRaises(ValueError, fDist.getFUpperValue, 1.5, 12, 20)
+
+    def test_getFPercentileValue_offGrid(self):
+        """Tests that percentiles and df outside the table fall back to the exact distribution"""
+        fDist: TableFDistribution = TableFDistribution()
+        self.assertAlmostEqual(fDist.getFPercentileValue(0.8, 5, 7), SciPySpecialFDistribution().getFPercentileValue(0.8, 5, 7), places=12)
+        self.assertAlmostEqual(fDist.getFPercentileValue(0.95, 65, 7), SciPySpecialFDistribution().getFPercentileValue(0.95, 65, 7), places=12)
+
+    def test_getFUpperValue_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        fDist: TableFDistribution = TableFDistribution()
+        self.assertRaises(ValueError, fDist.getFUpperValue, 1.5, 5, 7)
+        self.assertRaises(ValueError, fDist.getFPercentileValue, 0.95, -1, 7)
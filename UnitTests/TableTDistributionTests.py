@@ -0,0 +1,57 @@
+import os
+import unittest
+from unittest import mock
+from Utilities.CriticalValueTable import CriticalValueTable
+from Utilities.TDistribution.SciPySpecialTDistribution import SciPySpecialTDistribution
+from Utilities.TDistribution.TableTDistribution import TableTDistribution
+
+class TableTDistributionTests(unittest.TestCase):
+    """Unit testing class for the TableTDistribution"""
+
+    def test_constructor_exactNone(self):
+        """Tests that the constructor raises an error with a null exact"""
+        self.assertRaises(ValueError, TableTDistribution, exact=None)
+
+    def test_getTPercentileValue_onGrid(self):
+        """Tests that tabulated percentiles match the exact values without computing them"""
+        exact: mock.Mock = mock.Mock(wraps=SciPySpecialTDistribution())
+        tDist: TableTDistribution = TableTDistribution(exact=exact)
+        self.assertEqual(tDist.getTPercentileValue(0.975, 12), SciPySpecialTDistribution().getTPercentileValue(0.975, 12))
+        self.assertEqual(tDist.getTPercentileValue(0.95, 10000), SciPySpecialTDistribution().getTPercentileValue(0.95, 10000))
+        self.assertEqual(tDist.getTPercentileValue(0.025, 12), -SciPySpecialTDistribution().getTPercentileValue(0.975, 12))
+        exact.getTPercentileValue.assert_not_called()
+
+    def test_getTPercentileValue_repeated(self):
+        """Tests that the table is fetched once per instance and that repeated values still validate new arguments"""
+        tDist: TableTDistribution = TableTDistribution()
+        with mock.patch.object(CriticalValueTable, "loadShared", wraps=CriticalValueTable.loadShared) as loadShared:
+            first: float = tDist.getTPercentileValue(0.975, 12)
+            self.assertEqual(tDist.getTPercentileValue(0.975, 12), first)
+            self.assertEqual(tDist.getTPercentileValue(0.025, 12), -first)
+            loadShared.assert_called_once()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 0.975, -12)
+
+    def test_getTPercentileValue_offGrid(self):
+        """Tests that percentiles and df outside the table fall back to the exact distribution"""
+        tDist: TableTDistribution = TableTDistribution()
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.8, 12), SciPySpecialTDistribution().getTPercentileValue(0.8, 12), places=12)
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.975, 12.5), SciPySpecialTDistribution().getTPercentileValue(0.975, 12.5), places=12)
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.975, 20000), SciPySpecialTDistribution().getTPercentileValue(0.975, 20000), places=12)
+
+    def test_getTPercentileValue_missingTable(self):
+        """Tests that a missing table falls back to the exact distribution"""
+        tDist: TableTDistribution = TableTDistribution(path=os.path.join(os.path.dirname(__file__), "missing.bin"))
+        self.assertAlmostEqual(tDist.getTPercentileValue(0.975, 12), 2.178812829667228, places=12)
+
+    def test_getTPercentileValue_invalid(self):
+        """Tests that invalid arguments raise an error"""
+        tDist: TableTDistribution = TableTDistribution()
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 1.5, 12)
+        self.assertRaises(ValueError, tDist.getTPercentileValue, 0.975, -1)
+
+    def test_getTPercentileValueBatch_whenCalled(self):
+        """Tests that getTPercentileValueBatch matches getTPercentileValue for each percentile"""
+        tDist: TableTDistribution = TableTDistribution()
+        batch: list = list(tDist.getTPercentileValueBatch([0.975, 0.8], [12, 12.5]))
+        self.assertAlmostEqual(batch[0], tDist.getTPercentileValue(0.975, 12), places=12)
+        self.assertAlmostEqual(batch[1], tDist.getTPercentileValue(0.8, 12.5), places=12)
@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+
+class IBetaDistribution(ABC):
+    """Interface for the beta distribution"""
+
+    @abstractmethod
+    def getLeftTailArea(self, val: float, a: float, b: float) -> float:
+        """
+        Description
+        ----------
+        Finds the left tail area value of a given value and shape parameters
+
+        Parameters
+        ----------
+        val : float
+            A candidate value between 0 and 1
+
+        a: float
+            The first shape parameter
+
+        b: float
+            The second shape parameter
+
+        Returns
+        -------
+        float
+            The area under the appropriate beta distribution
+        """
+        pass
+
+    @abstractmethod
+    def getBetaPercentileValue(self, percentile: float, a: float, b: float) -> float:
+        """
+        Description
+        ----------
+        Finds the value of the beta distribution with the given shape parameters
+        which has the target area under the curve
+
+        Parameters
+        ----------
+        percentile : float
+            The desired area under the curve
+
+        a: float
+            The first shape parameter
+
+        b: float
+            The second shape parameter
+
+        Returns
+        -------
+        float
+            The corresponding value for that area under the curve
+        """
+        pass
+
+    def getBetaPercentileValueBatch(self, percentiles: list, a: list, b: list) -> list:
+        """
+        Description
+        ----------
+        Finds the value of each percentile of the beta distribution with the
+        matching shape parameters. Implementations may override this to evaluate
+        the whole batch at once
+
+        Parameters
+        ----------
+        percentiles : list
+            The desired areas under the curve
+
+        a: list
+            The first shape parameter of each distribution
+
+        b: list
+            The second shape parameter of each distribution
+
+        Returns
+        -------
+        list
+            The corresponding value for each area, as a list or as a numpy array
+            when evaluated vectorized
+        """
+        if percentiles is None or a is None or b is None:
+            raise ValueError("Cannot pass null percentiles or shape parameters")
+        if not len(percentiles) == len(a) == len(b):
+            raise ValueError("Percentiles and shape parameters must have the same length")
+        return [self.getBetaPercentileValue(percentile, aVal, bVal) for percentile, aVal, bVal in zip(percentiles, a, b)]
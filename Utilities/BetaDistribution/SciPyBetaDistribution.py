@@ -0,0 +1,46 @@
+from Utilities.BetaDistribution.IBetaDistribution import IBetaDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+
+class SciPyBetaDistribution(IBetaDistribution):
+    """Class implementing the IBetaDistribution interface using scipy"""
+
+    def getLeftTailArea(self, val: float, a: float, b: float) -> float:
+        if val == None:
+            raise ValueError("Cannot pass a null value")
+        if a == None or a <= 0:
+            raise ValueError("Cannot pass a non-positive or null a value")
+        if b == None or b <= 0:
+            raise ValueError("Cannot pass a non-positive or null b value")
+        stats = OptionalDependencies.require("scipy.stats")
+        return float(stats.beta.cdf(val, a, b))
+
+    def getBetaPercentileValue(self, percentile: float, a: float, b: float) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+        if a == None or a <= 0:
+            raise ValueError("Cannot pass a non-positive or null a value")
+        if b == None or b <= 0:
+            raise ValueError("Cannot pass a non-positive or null b value")
+        stats = OptionalDependencies.require("scipy.stats")
+        return float(stats.beta.ppf(percentile, a, b))
+
+    def getBetaPercentileValueBatch(self, percentiles: list, a: list, b: list) -> list:
+        if percentiles is None or a is None or b is None:
+            raise ValueError("Cannot pass null percentiles or shape parameters")
+        if not len(percentiles) == len(a) == len(b):
+            raise ValueError("Percentiles and shape parameters must have the same length")
+
+        numpy = OptionalDependencies.require("numpy")
+        stats = OptionalDependencies.require("scipy.stats")
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        a = numpy.asarray(a, dtype=float)
+        b = numpy.asarray(b, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Target area cannot be greater than one")
+        if numpy.any(~(a > 0)) or numpy.any(~(b > 0)):
+            raise ValueError("Cannot pass non-positive or null shape parameters")
+        return stats.beta.ppf(percentiles, a, b)
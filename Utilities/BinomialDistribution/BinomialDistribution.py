@@ -1,11 +1,71 @@
 import math
+
 from Utilities.BinomialDistribution.IBinomialDistribution import IBinomialDistribution
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+from Utilities.SpecialFunctions import SpecialFunctions
+
+_MODES: tuple = ("exact", "auto")
+
+# Shevtsova's constant for the Berry-Esseen bound on the normal approximation
+_BERRY_ESSEEN_CONSTANT: float = 0.4748
 
 class BinomialDistribution(IBinomialDistribution):
     """Class which approximates a discrete binomial distribution"""
 
-    def __choose(self, total: int, chosen: int) -> float:
-        return math.factorial(total) / (math.factorial(chosen) * math.factorial(total-chosen))
+    def __init__(self, 
+        mode: str = "exact", 
+        tolerance: float = 0.0001, 
+        normalDist: INormalDistribution = ErfNormalDistribution()) -> None:
+        """
+        Description
+        ----------
+        Constructor for the BinomialDistribution
+
+        Parameters
+        ----------
+        mode: str
+            How left tail areas are computed. "exact" always computes the binomial
+            cdf, while "auto" switches to a continuity corrected normal or a Poisson
+            approximation whenever its error bound is within the tolerance
+
+        tolerance: float
+            The largest error bound on the left tail area accepted from an
+            approximation in "auto" mode
+
+        normalDist: INormalDistribution
+            Normal distribution utility used by the normal approximation
+        """
+        if mode not in _MODES:
+            raise ValueError("Mode must be one of " + ", ".join(_MODES))
+        if tolerance == None or tolerance < 0:
+            raise ValueError("Cannot have negative or null tolerance")
+        if normalDist == None:
+            raise ValueError("Cannot have null normalDist")
+
+        self.mode: str = mode
+        self.tolerance: float = tolerance
+        self.normalDist: INormalDistribution = normalDist
+
+    def __pmf(self, successes: int, trials: int, likelihood: float) -> float:
+        # The degenerate likelihoods put all of their mass on a single outcome,
+        # and would otherwise need the log of zero below
+        if likelihood == 0:
+            return 1.0 if successes == 0 else 0.0
+        if likelihood == 1:
+            return 1.0 if successes == trials else 0.0
+        if successes == 0:
+            return math.exp(trials * math.log1p(-likelihood))
+        if successes == trials:
+            return math.exp(trials * math.log(likelihood))
+
+        # Loader's saddle point form works in log space, keeping every call O(1)
+        # without big integer factorials, and stays accurate for millions of trials
+        failures: int = trials - successes
+        logPmf: float = SpecialFunctions.stirlingError(trials) - SpecialFunctions.stirlingError(successes) - SpecialFunctions.stirlingError(failures) \
+            - SpecialFunctions.deviance(successes, trials * likelihood) - SpecialFunctions.deviance(failures, trials * (1 - likelihood))
+        return math.exp(logPmf) * math.sqrt(trials / (2 * math.pi * successes * failures))
 
     def pmf(self, successes: int, trials: int, likelihood: float) -> float:
         if successes == None or successes < 0:
@@ -18,7 +78,29 @@ class BinomialDistribution(IBinomialDistribution):
             raise ValueError("Cannot have likelihood greater than 1")
         if successes > trials:
             raise ValueError("Cannot have more successes than trials")
-        return self.__choose(trials, successes) * (likelihood ** successes) * ((1 - likelihood) ** (trials - successes))
+        return self.__pmf(successes, trials, likelihood)
+
+    def getPmfValues(self, trials: int, likelihood: float) -> list:
+        if trials == None or trials < 0:
+            raise ValueError("Cannot have negative or null trials")
+        if likelihood == None or likelihood < 0:
+            raise ValueError("Cannot have negative or null likelihood")
+        if likelihood > 1:
+            raise ValueError("Cannot have likelihood greater than 1")
+        if likelihood == 0 or likelihood == 1:
+            return [self.__pmf(successes, trials, likelihood) for successes in range(trials + 1)]
+
+        # Anchor at the mode and walk outwards with the ratio of neighbouring
+        # terms, so each step is one multiplication and the terms only shrink
+        mode: int = min(math.floor((trials + 1) * likelihood), trials)
+        odds: float = likelihood / (1 - likelihood)
+        values: list = [0.0] * (trials + 1)
+        values[mode] = self.__pmf(mode, trials, likelihood)
+        for successes in range(mode, trials):
+            values[successes + 1] = values[successes] * odds * (trials - successes) / (successes + 1)
+        for successes in range(mode, 0, -1):
+            values[successes - 1] = values[successes] * successes / (odds * (trials - successes + 1))
+        return values
 
     def getLeftTailArea(self, successes: int, trials: int, likelihood: float) -> float:
         if successes == None or successes < 0:
@@ -31,7 +113,128 @@ class BinomialDistribution(IBinomialDistribution):
             raise ValueError("Cannot have likelihood greater than 1")
         if successes > trials:
             raise ValueError("Cannot have more successes than trials")
-        sum: float = 0
-        for i in range(successes + 1):
-            sum += self.pmf(i, trials, likelihood)
-        return sum
+
+        if successes == trials or likelihood == 0:
+            return 1.0
+        if likelihood == 1:
+            return 0.0
+
+        method: str = self.getMethod(trials, likelihood)
+        if method == "normal":
+            mean: float = trials * likelihood
+            stdDev: float = math.sqrt(mean * (1 - likelihood))
+            return self.normalDist.getLeftTailArea((successes + 0.5 - mean) / stdDev)
+        if method == "poisson":
+            return self.__poissonLeftTailArea(successes, trials * likelihood)
+        stats = OptionalDependencies.load("scipy.stats")
+        if stats != None:
+            return float(stats.binom.cdf(successes, trials, likelihood))
+
+        # P(X <= k) = I_{1-p}(n - k, k + 1), evaluated from whichever side of the
+        # beta distribution's mean its continued fraction converges quickly on.
+        # The prefactor of the fraction reduces to a scaled binomial pmf
+        a: int = trials - successes
+        b: int = successes + 1
+        if (1 - likelihood) < (a + 1) / (a + b + 2):
+            fraction: float = SpecialFunctions.incompleteBetaFraction(a, b, 1 - likelihood)
+            return likelihood * self.__pmf(successes, trials, likelihood) * fraction
+        fraction: float = SpecialFunctions.incompleteBetaFraction(b, a, likelihood)
+        return 1 - ((1 - likelihood) * self.__pmf(successes + 1, trials, likelihood) * fraction)
+
+    def getSuccessPercentileValue(self, percentile: float, trials: int, likelihood: float) -> int:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+        if trials == None or trials < 0:
+            raise ValueError("Cannot have negative or null trials")
+        if likelihood == None or likelihood < 0:
+            raise ValueError("Cannot have negative or null likelihood")
+        if likelihood > 1:
+            raise ValueError("Cannot have likelihood greater than 1")
+        if percentile == 0 or trials == 0 or likelihood == 0:
+            return 0
+        if likelihood == 1:
+            return trials
+
+        # Start from the continuity corrected normal quantile with a Cornish-Fisher
+        # skewness correction, which is usually within a count or two of the answer
+        mean: float = trials * likelihood
+        stdDev: float = math.sqrt(mean * (1 - likelihood))
+        zVal: float = self.normalDist.getZPercentileValue(min(max(percentile, 1e-300), 1 - 1e-16))
+        skew: float = (1 - (2 * likelihood)) / stdDev
+        guess: float = mean + (stdDev * (zVal + (((zVal ** 2) - 1) * skew / 6))) - 0.5
+        start: int = min(max(math.ceil(guess), 0), trials)
+
+        # Gallop away from the guess until the answer is bracketed, with the left
+        # tail area of lower under the target and that of upper reaching it,
+        # then bisect the bracket
+        step: int = 1
+        if self.getLeftTailArea(start, trials, likelihood) >= percentile:
+            upper: int = start
+            lower: int = start - 1
+            while lower >= 0 and self.getLeftTailArea(lower, trials, likelihood) >= percentile:
+                upper = lower
+                step *= 2
+                lower = max(upper - step, -1)
+        else:
+            lower: int = start
+            upper: int = min(start + 1, trials)
+            while upper < trials and self.getLeftTailArea(upper, trials, likelihood) < percentile:
+                lower = upper
+                step *= 2
+                upper = min(lower + step, trials)
+        while upper - lower > 1:
+            middle: int = (lower + upper) // 2
+            if self.getLeftTailArea(middle, trials, likelihood) >= percentile:
+                upper = middle
+            else:
+                lower = middle
+        return upper
+
+    def getMethod(self, trials: int, likelihood: float) -> str:
+        """
+        Description
+        ----------
+        Reports how getLeftTailArea computes the left tail areas of the given
+        number of trials and likelihood of success, for auditing results
+
+        Parameters
+        ----------
+        trials: int
+            The number of total trials
+
+        likelihood: float
+            The likelihood of a given trial succeeding
+
+        Returns
+        -------
+        str
+            "exact", "normal" or "poisson"
+        """
+        if trials == None or trials < 0:
+            raise ValueError("Cannot have negative or null trials")
+        if likelihood == None or likelihood < 0:
+            raise ValueError("Cannot have negative or null likelihood")
+        if likelihood > 1:
+            raise ValueError("Cannot have likelihood greater than 1")
+        if self.mode == "exact" or trials == 0 or likelihood == 0 or likelihood == 1:
+            return "exact"
+
+        # Berry-Esseen bounds the error of the normal approximation to the cdf,
+        # and Barbour and Hall bound the total variation distance to the Poisson
+        mean: float = trials * likelihood
+        variance: float = mean * (1 - likelihood)
+        normalBound: float = _BERRY_ESSEEN_CONSTANT * ((likelihood ** 2) + ((1 - likelihood) ** 2)) / math.sqrt(variance)
+        poissonBound: float = -math.expm1(-mean) * likelihood
+        if min(normalBound, poissonBound) > self.tolerance:
+            return "exact"
+        return "normal" if normalBound <= poissonBound else "poisson"
+
+    def __poissonLeftTailArea(self, successes: int, mean: float) -> float:
+        stats = OptionalDependencies.load("scipy.stats")
+        if stats != None:
+            return float(stats.poisson.cdf(successes, mean))
+
+        # P(X <= k) is the regularized upper incomplete gamma Q(k + 1, mean)
+        return SpecialFunctions.incompleteGamma(successes + 1, mean)[1]
@@ -0,0 +1,86 @@
+from functools import lru_cache
+
+from Utilities.BinomialDistribution.BinomialDistribution import BinomialDistribution
+from Utilities.BinomialDistribution.IBinomialDistribution import IBinomialDistribution
+
+class CachedBinomialDistribution(IBinomialDistribution):
+    """Class which memoizes the pmf, left tail areas and percentiles of another binomial distribution in bounded LRU caches"""
+
+    def __init__(self, binomialDist: IBinomialDistribution = BinomialDistribution(), maxSize: int = 1024) -> None:
+        """
+        Description
+        ----------
+        Constructor for the CachedBinomialDistribution
+
+        Parameters
+        ----------
+        binomialDist: IBinomialDistribution
+            The binomial distribution whose results are cached
+
+        maxSize: int
+            The number of results kept by each of the pmf, left tail area and
+            percentile caches before the least recently used is evicted
+        """
+        if binomialDist == None:
+            raise ValueError("Cannot have null binomialDist")
+        if maxSize == None or maxSize <= 0:
+            raise ValueError("Cannot have a non-positive or null maxSize")
+
+        self.binomialDist: IBinomialDistribution = binomialDist
+        self.maxSize: int = maxSize
+        self.__cachedPmf = lru_cache(maxsize=maxSize)(binomialDist.pmf)
+        self.__cachedLeftTailArea = lru_cache(maxsize=maxSize)(binomialDist.getLeftTailArea)
+        self.__cachedSuccessPercentileValue = lru_cache(maxsize=maxSize)(binomialDist.getSuccessPercentileValue)
+
+    def pmf(self, successes: int, trials: int, likelihood: float) -> float:
+        return self.__cachedPmf(successes, trials, likelihood)
+
+    def getLeftTailArea(self, successes: int, trials: int, likelihood: float) -> float:
+        return self.__cachedLeftTailArea(successes, trials, likelihood)
+
+    def getSuccessPercentileValue(self, percentile: float, trials: int, likelihood: float) -> int:
+        return self.__cachedSuccessPercentileValue(percentile, trials, likelihood)
+
+    def getPmfValues(self, trials: int, likelihood: float) -> list:
+        return self.binomialDist.getPmfValues(trials, likelihood)
+
+    def getLeftTailAreaValues(self, trials: int, likelihood: float) -> list:
+        return self.binomialDist.getLeftTailAreaValues(trials, likelihood)
+
+    def getHits(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of calls served from the caches
+
+        Returns
+        -------
+        int
+            The number of cache hits
+        """
+        return sum(cache.cache_info().hits for cache in self.__caches())
+
+    def getMisses(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of calls forwarded to the wrapped distribution
+
+        Returns
+        -------
+        int
+            The number of cache misses
+        """
+        return sum(cache.cache_info().misses for cache in self.__caches())
+
+    def clearCache(self) -> None:
+        """
+        Description
+        ----------
+        Empties the caches and resets the hit and miss counters
+        """
+        for cache in self.__caches():
+            cache.cache_clear()
+
+    def __caches(self) -> tuple:
+        return (self.__cachedPmf, self.__cachedLeftTailArea, self.__cachedSuccessPercentileValue)
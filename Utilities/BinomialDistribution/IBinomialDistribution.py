@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from itertools import accumulate
 
 class IBinomialDistribution(ABC):
     """Interface for Binomial distribution"""
@@ -54,3 +55,96 @@ class IBinomialDistribution(ABC):
             The approximate area under the curve
         """
         pass
+
+    def getSuccessPercentileValue(self, percentile: float, trials: int, likelihood: float) -> int:
+        """
+        Description
+        ----------
+        Finds the smallest number of successes whose left tail area reaches the
+        target area, given the number of trials and likelihood of success.
+        Implementations may override this to start the search from a closer guess
+
+        Parameters
+        ----------
+        percentile: float
+            The desired left tail area
+
+        trials: int
+            The number of total trials
+
+        likelihood: float
+            The likelihood of a given trial succeeding
+
+        Returns
+        -------
+        int
+            The corresponding number of successes
+        """
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+        if trials == None or trials < 0:
+            raise ValueError("Cannot have negative or null trials")
+
+        # Bisect while the left tail area of lower stays under the target and
+        # that of upper reaches it
+        lower: int = -1
+        upper: int = trials
+        while upper - lower > 1:
+            middle: int = (lower + upper) // 2
+            if self.getLeftTailArea(middle, trials, likelihood) >= percentile:
+                upper = middle
+            else:
+                lower = middle
+        return upper
+
+    def getPmfValues(self, trials: int, likelihood: float) -> list:
+        """
+        Description
+        ----------
+        Finds the probability of every possible number of successes given the
+        number of trials and likelihood of success. Implementations may override
+        this to sweep the whole distribution at once
+
+        Parameters
+        ----------
+        trials: int
+            The number of total trials
+
+        likelihood: float
+            The likelihood of a given trial succeeding
+
+        Returns
+        -------
+        list
+            The likelihood of each result, indexed by the number of successes
+        """
+        if trials == None or trials < 0:
+            raise ValueError("Cannot have negative or null trials")
+        return [self.pmf(successes, trials, likelihood) for successes in range(trials + 1)]
+
+    def getLeftTailAreaValues(self, trials: int, likelihood: float) -> list:
+        """
+        Description
+        ----------
+        Finds the left tail area of every possible number of successes given the
+        number of trials and likelihood of success, in one pass over the pmf values.
+        This is cheaper than separate getLeftTailArea calls when many observed
+        counts are tested against the same null likelihood
+
+        Parameters
+        ----------
+        trials: int
+            The number of total trials
+
+        likelihood: float
+            The likelihood of a given trial succeeding
+
+        Returns
+        -------
+        list
+            The area under the curve up to and including each result, indexed by
+            the number of successes
+        """
+        return [min(area, 1.0) for area in accumulate(self.getPmfValues(trials, likelihood))]
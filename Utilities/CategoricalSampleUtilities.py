@@ -1,4 +1,5 @@
 import math
+from Utilities.SampleUtilities import SampleUtilities
 
 class CategoricalSampleUtilities:
     """Class for reusable sample measurement methods"""
@@ -13,15 +14,22 @@ class CategoricalSampleUtilities:
         Parameters
         ----------
         values : list
-            A population sample of 1's and 0's with 1's denoting the positive class
+            A population sample of 1's and 0's with 1's denoting the positive class, either
+            as a list or as any buffer-protocol array such as numpy.ndarray or array.array
 
         Returns
         -------
         float
             The number of 1's over the total
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null sample")
+        array = SampleUtilities.asArray(values)
+        if array is not None:
+            if not ((array == 0) | (array == 1)).all():
+                raise ValueError("All elements must be either 0 or 1")
+            return float(array.sum()) / len(array)
+
         cntr: int = 0
         for item in values:
             if item != 0 and item != 1:
@@ -40,14 +48,15 @@ class CategoricalSampleUtilities:
         Parameters
         ----------
         values : list
-            A population sample of 1's and 0's with 1's denoting the positive class
+            A population sample of 1's and 0's with 1's denoting the positive class, either
+            as a list or as any buffer-protocol array such as numpy.ndarray or array.array
 
         Returns
         -------
         float
             The variance of the provided values
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null sample")
         likelihood: float = CategoricalSampleUtilities.estimateLikelihood(values)
         return math.sqrt( (likelihood * (1 - likelihood)) / len(values) )
\ No newline at end of file
@@ -0,0 +1,89 @@
+from functools import lru_cache
+
+from Utilities.ChiSquaredDistribution.IChiSquaredDistribution import IChiSquaredDistribution
+from Utilities.ChiSquaredDistribution.SciPySpecialChiSquared import SciPySpecialChiSquared
+
+class CachedChiSquared(IChiSquaredDistribution):
+    """Class which memoizes the percentiles and critical values of another chi squared distribution in bounded LRU caches"""
+
+    def __init__(self, chisquare: IChiSquaredDistribution = SciPySpecialChiSquared(), maxSize: int = 1024) -> None:
+        """
+        Description
+        ----------
+        Constructor for the CachedChiSquared
+
+        Parameters
+        ----------
+        chisquare: IChiSquaredDistribution
+            The chi squared distribution whose percentiles are cached
+
+        maxSize: int
+            The number of results kept by each of the percentile, upper and lower
+            value caches before the least recently used is evicted
+        """
+        if chisquare == None:
+            raise ValueError("Cannot have null chisquare")
+        if maxSize == None or maxSize <= 0:
+            raise ValueError("Cannot have a non-positive or null maxSize")
+
+        self.chisquare: IChiSquaredDistribution = chisquare
+        self.maxSize: int = maxSize
+        self.__cachedChiSquaredPercentileVal = lru_cache(maxsize=maxSize)(chisquare.getChiSquaredPercentileVal)
+        self.__cachedChiSquaredUpperVal = lru_cache(maxsize=maxSize)(chisquare.getChiSquaredUpperVal)
+        self.__cachedChiSquaredLowerVal = lru_cache(maxsize=maxSize)(chisquare.getChiSquaredLowerVal)
+
+    def getLeftTailArea(self, val: float, df: int) -> float:
+        return self.chisquare.getLeftTailArea(val, df)
+
+    def getChiSquaredPercentileVal(self, percentile: float, df: int) -> float:
+        return self.__cachedChiSquaredPercentileVal(percentile, df)
+
+    def getChiSquaredUpperVal(self, confidenceLevel: float, df: int) -> float:
+        return self.__cachedChiSquaredUpperVal(confidenceLevel, df)
+
+    def getChiSquaredLowerVal(self, confidenceLevel: float, df: int) -> float:
+        return self.__cachedChiSquaredLowerVal(confidenceLevel, df)
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        return self.chisquare.getLeftTailAreaBatch(vals, dfs)
+
+    def getChiSquaredPercentileValBatch(self, percentiles: list, dfs: list) -> list:
+        return self.chisquare.getChiSquaredPercentileValBatch(percentiles, dfs)
+
+    def getHits(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of calls served from the caches
+
+        Returns
+        -------
+        int
+            The number of cache hits
+        """
+        return sum(cache.cache_info().hits for cache in self.__caches())
+
+    def getMisses(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of calls forwarded to the wrapped distribution
+
+        Returns
+        -------
+        int
+            The number of cache misses
+        """
+        return sum(cache.cache_info().misses for cache in self.__caches())
+
+    def clearCache(self) -> None:
+        """
+        Description
+        ----------
+        Empties the caches and resets the hit and miss counters
+        """
+        for cache in self.__caches():
+            cache.cache_clear()
+
+    def __caches(self) -> tuple:
+        return (self.__cachedChiSquaredPercentileVal, self.__cachedChiSquaredUpperVal, self.__cachedChiSquaredLowerVal)
@@ -93,3 +93,59 @@ class IChiSquaredDistribution(ABC):
             The approximate area under the appropriate t distribution
         """
         pass
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        """
+        Description
+        ----------
+        Finds the left tail area of each chi squared value under the chi squared
+        distribution with the matching degrees of freedom. Implementations may
+        override this to evaluate the whole batch at once
+
+        Parameters
+        ----------
+        vals : list
+            The candidate chi squared values, as a list or any array of floats
+
+        dfs: list
+            The number of degrees of freedom for each chi squared value
+
+        Returns
+        -------
+        list
+            The approximate area under the appropriate chi squared distribution
+            for each value, as a list or as a numpy array when evaluated vectorized
+        """
+        if vals is None or dfs is None:
+            raise ValueError("Cannot pass null chi squared values or df values")
+        if len(vals) != len(dfs):
+            raise ValueError("Chi squared values and df values must have the same length")
+        return [self.getLeftTailArea(val, df) for val, df in zip(vals, dfs)]
+
+    def getChiSquaredPercentileValBatch(self, percentiles: list, dfs: list) -> list:
+        """
+        Description
+        ----------
+        Finds the chi squared value of each percentile of the chi squared
+        distribution with the matching degrees of freedom. Implementations may
+        override this to evaluate the whole batch at once
+
+        Parameters
+        ----------
+        percentiles : list
+            The desired areas under the curve, as a list or any array of floats
+
+        dfs: list
+            The number of degrees of freedom for each percentile
+
+        Returns
+        -------
+        list
+            The corresponding chi squared value for each area, as a list or as a
+            numpy array when evaluated vectorized
+        """
+        if percentiles is None or dfs is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if len(percentiles) != len(dfs):
+            raise ValueError("Percentiles and df values must have the same length")
+        return [self.getChiSquaredPercentileVal(percentile, df) for percentile, df in zip(percentiles, dfs)]
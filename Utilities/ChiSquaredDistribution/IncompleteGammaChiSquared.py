@@ -0,0 +1,65 @@
+import math
+
+from Utilities.ChiSquaredDistribution.IChiSquaredDistribution import IChiSquaredDistribution
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+from Utilities.SpecialFunctions import SpecialFunctions
+
+_NORMAL_DIST: ErfNormalDistribution = ErfNormalDistribution()
+
+class IncompleteGammaChiSquared(IChiSquaredDistribution):
+    """Class implementing the IChiSquaredDistribution interface in pure Python through the regularized incomplete gamma function"""
+
+    def getLeftTailArea(self, chiVal: float, df: int) -> float:
+        if chiVal == None:
+            raise ValueError("Cannot pass a null chi squared value")
+        if df == None or df <= 0:
+            raise ValueError("Cannot pass a non-positive or null df value")
+
+        # The chi squared distribution is a gamma distribution with shape df / 2 and scale 2
+        return SpecialFunctions.incompleteGamma(df / 2, chiVal / 2)[0]
+
+    def getChiSquaredPercentileVal(self, percentile: float, df: int) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df <= 0:
+            raise ValueError("Cannot pass a non-positive or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+        return self.__quantile(percentile, 1 - percentile, df)
+
+    def getChiSquaredUpperVal(self, confidenceLevel: float, df: int) -> float:
+        if df == None or df <= 0:
+            raise ValueError("Cannot pass a non-positive or null df value")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+        alpha: float = (1 - confidenceLevel)/2
+        return self.__quantile(1 - alpha, alpha, df)
+
+    def getChiSquaredLowerVal(self, confidenceLevel: float, df: int) -> float:
+        if df == None or df <= 0:
+            raise ValueError("Cannot pass a non-positive or null df value")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+        alpha: float = (1 - confidenceLevel)/2
+        return self.__quantile(alpha, 1 - alpha, df)
+
+    def __quantile(self, lowerArea: float, upperArea: float, df: int) -> float:
+        # Both areas are passed so that whichever is small carries no rounding
+        if lowerArea == 0:
+            return 0.0
+        if upperArea == 0:
+            return math.inf
+
+        # Start from the Wilson-Hilferty cube root approximation, or from the
+        # leading term of the series for P(a, x) where that turns negative
+        a: float = df / 2
+        z: float = _NORMAL_DIST.getZPercentileValue(lowerArea) if lowerArea <= upperArea else -_NORMAL_DIST.getZPercentileValue(upperArea)
+        cubeRoot: float = 1 - (2 / (9 * df)) + (z * math.sqrt(2 / (9 * df)))
+        logSeriesGuess: float = (math.log(lowerArea) + math.lgamma(a + 1)) / a
+        logGuess: float = math.log(df * (cubeRoot ** 3) / 2) if cubeRoot > 0 else logSeriesGuess
+
+        return 2 * math.exp(SpecialFunctions.inverseIncompleteGamma(a, lowerArea, upperArea, logGuess))
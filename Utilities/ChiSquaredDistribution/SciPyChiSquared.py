@@ -1,7 +1,7 @@
 import math
 
-from scipy.stats import chi
 from Utilities.ChiSquaredDistribution.IChiSquaredDistribution import IChiSquaredDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
 
 class SciPyChiSquared(IChiSquaredDistribution):
     """Class implementing the IChiSquaredDistribution interface using scipy"""
@@ -11,7 +11,8 @@ class SciPyChiSquared(IChiSquaredDistribution):
             raise ValueError("Cannot pass a null t value")
         if df == None or df < 0:
             raise ValueError("Cannot pass a negative or null df value")
-        return chi.cdf(math.sqrt(chiVal), df)
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.chi.cdf(math.sqrt(chiVal), df)
 
     def getChiSquaredPercentileVal(self, percentile: float, df: int) -> float:
         if percentile == None or percentile < 0:
@@ -20,7 +21,8 @@ class SciPyChiSquared(IChiSquaredDistribution):
             raise ValueError("Cannot pass a negative or null df value")
         if percentile > 1:
             raise ValueError("Target area cannot be greater than one")
-        return chi.ppf(percentile, df)**2
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.chi.ppf(percentile, df)**2
 
     def getChiSquaredUpperVal(self, confidenceLevel: float, df: int) -> float:
         if df == None or df < 0:
@@ -41,3 +43,37 @@ class SciPyChiSquared(IChiSquaredDistribution):
             raise ValueError("Cannot have a confidenceLevel over 1")
         alpha: float = (1 - confidenceLevel)/2
         return self.getChiSquaredPercentileVal(alpha, df)
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        if vals is None or dfs is None:
+            raise ValueError("Cannot pass null chi squared values or df values")
+        if len(vals) != len(dfs):
+            raise ValueError("Chi squared values and df values must have the same length")
+
+        numpy = OptionalDependencies.require("numpy")
+        stats = OptionalDependencies.require("scipy.stats")
+        vals = numpy.asarray(vals, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(vals)):
+            raise ValueError("Cannot pass a null chi squared value")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        return stats.chi.cdf(numpy.sqrt(vals), dfs)
+
+    def getChiSquaredPercentileValBatch(self, percentiles: list, dfs: list) -> list:
+        if percentiles is None or dfs is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if len(percentiles) != len(dfs):
+            raise ValueError("Percentiles and df values must have the same length")
+
+        numpy = OptionalDependencies.require("numpy")
+        stats = OptionalDependencies.require("scipy.stats")
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Target area cannot be greater than one")
+        return stats.chi.ppf(percentiles, dfs)**2
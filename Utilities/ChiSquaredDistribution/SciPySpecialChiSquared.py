@@ -0,0 +1,97 @@
+from Utilities.ChiSquaredDistribution.IChiSquaredDistribution import IChiSquaredDistribution
+from Utilities.ChiSquaredDistribution.IncompleteGammaChiSquared import IncompleteGammaChiSquared
+from Utilities.OptionalDependencies import OptionalDependencies
+
+_FALLBACK: IChiSquaredDistribution = IncompleteGammaChiSquared()
+
+class SciPySpecialChiSquared(IChiSquaredDistribution):
+    """Class implementing the IChiSquaredDistribution interface with the scalar scipy.special functions, falling back to the pure Python IncompleteGammaChiSquared without scipy"""
+
+    def getLeftTailArea(self, chiVal: float, df: int):
+        if chiVal == None:
+            raise ValueError("Cannot pass a null t value")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getLeftTailArea(chiVal, df)
+        return float(special.chdtr(df, chiVal))
+
+    def getChiSquaredPercentileVal(self, percentile: float, df: int) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getChiSquaredPercentileVal(percentile, df)
+
+        # The chi squared distribution is a gamma distribution with shape df / 2
+        # and scale 2, whose lower quantile avoids rounding 1 - percentile
+        return 2 * float(special.gammaincinv(df / 2, percentile))
+
+    def getChiSquaredUpperVal(self, confidenceLevel: float, df: int) -> float:
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getChiSquaredUpperVal(confidenceLevel, df)
+        alpha: float = (1 - confidenceLevel)/2
+        return float(special.chdtri(df, alpha))
+
+    def getChiSquaredLowerVal(self, confidenceLevel: float, df: int) -> float:
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+        alpha: float = (1 - confidenceLevel)/2
+        return self.getChiSquaredPercentileVal(alpha, df)
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        if vals is None or dfs is None:
+            raise ValueError("Cannot pass null chi squared values or df values")
+        if len(vals) != len(dfs):
+            raise ValueError("Chi squared values and df values must have the same length")
+
+        numpy = OptionalDependencies.load("numpy")
+        special = OptionalDependencies.load("scipy.special")
+        if numpy == None or special == None:
+            return super().getLeftTailAreaBatch(vals, dfs)
+        vals = numpy.asarray(vals, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(vals)):
+            raise ValueError("Cannot pass a null chi squared value")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        return special.chdtr(dfs, vals)
+
+    def getChiSquaredPercentileValBatch(self, percentiles: list, dfs: list) -> list:
+        if percentiles is None or dfs is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if len(percentiles) != len(dfs):
+            raise ValueError("Percentiles and df values must have the same length")
+
+        numpy = OptionalDependencies.load("numpy")
+        special = OptionalDependencies.load("scipy.special")
+        if numpy == None or special == None:
+            return super().getChiSquaredPercentileValBatch(percentiles, dfs)
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Target area cannot be greater than one")
+        return 2 * special.gammaincinv(dfs / 2, percentiles)
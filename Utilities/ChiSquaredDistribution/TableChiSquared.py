@@ -0,0 +1,129 @@
+import os
+
+from Utilities.ChiSquaredDistribution.CachedChiSquared import CachedChiSquared
+from Utilities.ChiSquaredDistribution.IChiSquaredDistribution import IChiSquaredDistribution
+from Utilities.CriticalValueTable import CriticalValueTable, LOWER_PERCENTILES, UPPER_PERCENTILES
+
+DEFAULT_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chiSquaredCriticalValues.bin")
+MAX_DF: int = 10000
+
+class TableChiSquared(IChiSquaredDistribution):
+    """Class implementing the IChiSquaredDistribution interface from a precomputed table of critical values, falling back to exact computation off the grid"""
+
+    def __init__(self, exact: IChiSquaredDistribution = CachedChiSquared(), path: str = DEFAULT_PATH) -> None:
+        """
+        Description
+        ----------
+        Constructor for the TableChiSquared
+
+        Parameters
+        ----------
+        exact: IChiSquaredDistribution
+            The chi squared distribution used for tail areas and for percentiles
+            outside the table
+
+        path: str
+            The path of the table, loaded on first use
+        """
+        if exact == None:
+            raise ValueError("Cannot have null exact")
+        if path == None:
+            raise ValueError("Cannot have a null path")
+
+        self.exact: IChiSquaredDistribution = exact
+        self.path: str = path
+        self.__table: CriticalValueTable = None
+        self.__tableLoaded: bool = False
+        self.__tableHits: dict = {}
+
+    @staticmethod
+    def generate(path: str = DEFAULT_PATH, exact: IChiSquaredDistribution = CachedChiSquared()) -> None:
+        """
+        Description
+        ----------
+        Regenerates the table of lower and upper critical values for every
+        integer df up to MAX_DF
+
+        Parameters
+        ----------
+        path: str
+            The path of the table to write
+
+        exact: IChiSquaredDistribution
+            The chi squared distribution used to compute the table
+        """
+        dfs: list = [float(df) for df in range(1, MAX_DF + 1)]
+        CriticalValueTable.build(LOWER_PERCENTILES + UPPER_PERCENTILES, dfs, [], exact.getChiSquaredPercentileVal).save(path)
+
+    def getLeftTailArea(self, val: float, df: int) -> float:
+        return self.exact.getLeftTailArea(val, df)
+
+    def getChiSquaredPercentileVal(self, percentile: float, df: int) -> float:
+        # Arguments only reach the memo after validation and a table hit, so a
+        # repeated critical value skips both. It only grows with the distinct
+        # tabulated arguments asked for
+        chiVal: float = self.__tableHits.get((percentile, df))
+        if chiVal != None:
+            return chiVal
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+
+        table: CriticalValueTable = self.__getTable()
+        if table != None:
+            chiVal = table.lookup(percentile, df)
+            if chiVal != None:
+                self.__tableHits[(percentile, df)] = chiVal
+                return chiVal
+        return self.exact.getChiSquaredPercentileVal(percentile, df)
+
+    def getChiSquaredUpperVal(self, confidenceLevel: float, df: int) -> float:
+        chiVal: float = self.__tableHits.get(("upper", confidenceLevel, df))
+        if chiVal != None:
+            return chiVal
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+        alpha: float = (1 - confidenceLevel)/2
+        chiVal = self.getChiSquaredPercentileVal(1 - alpha, df)
+        if (1 - alpha, df) in self.__tableHits:
+            self.__tableHits[("upper", confidenceLevel, df)] = chiVal
+        return chiVal
+
+    def getChiSquaredLowerVal(self, confidenceLevel: float, df: int) -> float:
+        chiVal: float = self.__tableHits.get(("lower", confidenceLevel, df))
+        if chiVal != None:
+            return chiVal
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot have negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot have a confidenceLevel over 1")
+        alpha: float = (1 - confidenceLevel)/2
+        chiVal = self.getChiSquaredPercentileVal(alpha, df)
+        if (alpha, df) in self.__tableHits:
+            self.__tableHits[("lower", confidenceLevel, df)] = chiVal
+        return chiVal
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        return self.exact.getLeftTailAreaBatch(vals, dfs)
+
+    def getChiSquaredPercentileValBatch(self, percentiles: list, dfs: list) -> list:
+        # Batches go straight to the vectorized exact computation, as a table
+        # lookup per element would cost more than the single call it replaces
+        return self.exact.getChiSquaredPercentileValBatch(percentiles, dfs)
+
+    def __getTable(self) -> CriticalValueTable:
+        # The shared table is looked up once per instance, keeping the lock and
+        # the path lookup off the path of every repeated critical value
+        if not self.__tableLoaded:
+            self.__table = CriticalValueTable.loadShared(self.path)
+            self.__tableLoaded = True
+        return self.__table
@@ -0,0 +1,252 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
+# Layout of a saved table: magic with format version and byte order, then the
+# number of percentiles and of values on each degrees of freedom axis. Every
+# field is little endian, so that the shipped tables load on any platform
+_MAGIC: bytes = b"SPCVT2LE"
+_HEADER: struct.Struct = struct.Struct("<8sqqq")
+_ITEM_SIZE: int = array("d").itemsize
+
+# Percentiles are matched after rounding, so that a percentile derived from a
+# level by a slightly different sequence of operations still finds its entry
+_PERCENTILE_DIGITS: int = 12
+
+def _distinctPercentiles(percentiles: list) -> tuple:
+    # Keeps one percentile per rounded value, since percentiles which only
+    # differ by rounding share a single entry in the table
+    distinct: dict = {}
+    for percentile in percentiles:
+        distinct.setdefault(round(percentile, _PERCENTILE_DIGITS), percentile)
+    return tuple(sorted(distinct.values()))
+
+# The confidence levels tabulated, and the percentiles the analyzers and comparers
+# derive from them: the level itself for one tailed tests and 1 - (1 - level) / 2
+# for two tailed tests and intervals, computed exactly as they compute them
+CONFIDENCE_LEVELS: tuple = (0.90, 0.95, 0.975, 0.99, 0.999)
+UPPER_PERCENTILES: tuple = _distinctPercentiles(list(CONFIDENCE_LEVELS) + [1 - ((1 - level) / 2) for level in CONFIDENCE_LEVELS])
+LOWER_PERCENTILES: tuple = _distinctPercentiles([1 - level for level in CONFIDENCE_LEVELS] + [(1 - level) / 2 for level in CONFIDENCE_LEVELS])
+
+class CriticalValueTable:
+    """Class holding precomputed quantiles of a distribution over a grid of percentiles and degrees of freedom"""
+
+    __sharedTables: dict = {}
+    __sharedTablesLock: threading.Lock = threading.Lock()
+
+    def __init__(self, percentiles: list, dfs1: list, dfs2: list, values: object) -> None:
+        """
+        Description
+        ----------
+        Constructor for the CriticalValueTable
+
+        Parameters
+        ----------
+        percentiles: list
+            The tabulated percentiles
+
+        dfs1: list
+            The tabulated values of the first degrees of freedom
+
+        dfs2: list
+            The tabulated values of the second degrees of freedom, empty for
+            distributions with a single degrees of freedom parameter
+
+        values: object
+            The quantiles as a flat sequence of doubles, ordered by percentile,
+            then by the first and then by the second degrees of freedom
+        """
+        if percentiles == None or dfs1 == None or dfs2 == None or values == None:
+            raise ValueError("Cannot have null percentiles, degrees of freedom or values")
+        if len(values) != len(percentiles) * len(dfs1) * max(len(dfs2), 1):
+            raise ValueError("Number of values does not match the size of the grid")
+        if len({round(percentile, _PERCENTILE_DIGITS) for percentile in percentiles}) != len(percentiles):
+            raise ValueError("Cannot have percentiles which only differ by rounding")
+
+        self.percentiles: list = list(percentiles)
+        self.dfs1: list = list(dfs1)
+        self.dfs2: list = list(dfs2)
+        self.values: object = values
+        self.__exactPercentileIndices: dict = {percentile: i for i, percentile in enumerate(self.percentiles)}
+        self.__percentileIndices: dict = {round(percentile, _PERCENTILE_DIGITS): i for i, percentile in enumerate(self.percentiles)}
+        self.__df1Indices: dict = {df: i for i, df in enumerate(self.dfs1)}
+        self.__df2Indices: dict = {df: i for i, df in enumerate(self.dfs2)}
+
+    @staticmethod
+    def build(percentiles: list, dfs1: list, dfs2: list, quantile: callable) -> "CriticalValueTable":
+        """
+        Description
+        ----------
+        Builds a table by evaluating a quantile function at every grid point
+
+        Parameters
+        ----------
+        percentiles: list
+            The percentiles to tabulate
+
+        dfs1: list
+            The values of the first degrees of freedom to tabulate
+
+        dfs2: list
+            The values of the second degrees of freedom to tabulate, empty for
+            distributions with a single degrees of freedom parameter
+
+        quantile: callable
+            Called as quantile(percentile, df1) or quantile(percentile, df1, df2)
+
+        Returns
+        -------
+        CriticalValueTable
+            The built table
+        """
+        if quantile == None:
+            raise ValueError("Cannot have a null quantile function")
+        values: array = array("d")
+        for percentile in percentiles:
+            for df1 in dfs1:
+                if len(dfs2) == 0:
+                    values.append(quantile(percentile, df1))
+                for df2 in dfs2:
+                    values.append(quantile(percentile, df1, df2))
+        return CriticalValueTable(percentiles, dfs1, dfs2, values)
+
+    def lookup(self, percentile: float, df1: float, df2: float = None) -> float:
+        """
+        Description
+        ----------
+        Finds a tabulated quantile
+
+        Parameters
+        ----------
+        percentile: float
+            The desired area under the curve
+
+        df1: float
+            The first degrees of freedom
+
+        df2: float
+            The second degrees of freedom, for distributions which have one
+
+        Returns
+        -------
+        float
+            The tabulated quantile, or None if the arguments are outside the grid
+        """
+        # Percentiles derived the way the table was built match exactly, which
+        # skips the comparatively slow rounding
+        percentileIndex: int = self.__exactPercentileIndices.get(percentile)
+        if percentileIndex == None:
+            percentileIndex = self.__percentileIndices.get(round(percentile, _PERCENTILE_DIGITS))
+        df1Index: int = self.__df1Indices.get(df1)
+        if percentileIndex == None or df1Index == None:
+            return None
+        if len(self.dfs2) == 0:
+            return self.values[(percentileIndex * len(self.dfs1)) + df1Index] if df2 == None else None
+        df2Index: int = self.__df2Indices.get(df2)
+        if df2Index == None:
+            return None
+        return self.values[(((percentileIndex * len(self.dfs1)) + df1Index) * len(self.dfs2)) + df2Index]
+
+    def save(self, path: str) -> None:
+        """
+        Description
+        ----------
+        Saves the table to a compact binary file: a fixed size header holding the
+        format version and the size of each axis, followed by the percentiles,
+        the degrees of freedom and the quantiles as little endian float64
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to write
+        """
+        if path == None:
+            raise ValueError("Cannot have a null path")
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(self.percentiles), len(self.dfs1), len(self.dfs2)))
+            for contents in (array("d", self.percentiles + self.dfs1 + self.dfs2), array("d", self.values)):
+                if sys.byteorder == "big":
+                    contents.byteswap()
+                contents.tofile(file)
+
+    @staticmethod
+    def load(path: str) -> "CriticalValueTable":
+        """
+        Description
+        ----------
+        Loads a table written by save by memory mapping the file, so that the
+        quantiles are neither computed nor copied on little endian platforms
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to read
+
+        Returns
+        -------
+        CriticalValueTable
+            The table backed by the memory mapped file
+        """
+        if path == None:
+            raise ValueError("Cannot have a null path")
+        with open(path, "rb") as file:
+            mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < _HEADER.size:
+            raise ValueError("File is too short to hold a saved table")
+        magic, percentileCount, df1Count, df2Count = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            raise ValueError("File does not hold a saved table of this version")
+        axisCount: int = percentileCount + df1Count + df2Count
+        valueCount: int = percentileCount * df1Count * max(df2Count, 1)
+        if len(mapped) != _HEADER.size + ((axisCount + valueCount) * _ITEM_SIZE):
+            raise ValueError("File size does not match the saved grid")
+
+        contents: object = memoryview(mapped)[_HEADER.size:].cast("d")
+        if sys.byteorder == "big":
+            contents = array("d", mapped[_HEADER.size:])
+            contents.byteswap()
+        axes: list = contents[:axisCount].tolist()
+        return CriticalValueTable(
+            axes[:percentileCount],
+            axes[percentileCount:percentileCount + df1Count],
+            axes[percentileCount + df1Count:],
+            contents[axisCount:])
+
+    @staticmethod
+    def loadShared(path: str) -> "CriticalValueTable":
+        """
+        Description
+        ----------
+        Loads a table the first time it is needed, sharing it with every later
+        caller asking for the same path. A missing or unreadable file is
+        remembered as None, so that callers fall back to exact computation
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to read
+
+        Returns
+        -------
+        CriticalValueTable
+            The shared table, or None if the file does not exist or does not
+            hold a table this version can read
+        """
+        # Once a path is loaded it is never replaced, so it can be read without
+        # the lock, which is only taken to load a path for the first time
+        sharedTables: dict = CriticalValueTable.__sharedTables
+        if path in sharedTables:
+            return sharedTables[path]
+        with CriticalValueTable.__sharedTablesLock:
+            if path not in sharedTables:
+                table: CriticalValueTable = None
+                if os.path.exists(path):
+                    try:
+                        table = CriticalValueTable.load(path)
+                    except (OSError, ValueError):
+                        table = None
+                sharedTables[path] = table
+            return sharedTables[path]
@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+from Utilities.FDistribution.IFDistribution import IFDistribution
+from Utilities.FDistribution.SciPySpecialFDistribution import SciPySpecialFDistribution
+
+class CachedFDistribution(IFDistribution):
+    """Class which memoizes the percentiles and critical values of another F distribution in bounded LRU caches"""
+
+    def __init__(self, fDist: IFDistribution = SciPySpecialFDistribution(), maxSize: int = 1024) -> None:
+        """
+        Description
+        ----------
+        Constructor for the CachedFDistribution
+
+        Parameters
+        ----------
+        fDist: IFDistribution
+            The F distribution whose percentiles are cached
+
+        maxSize: int
+            The number of results kept by each of the percentile, upper and lower
+            value caches before the least recently used is evicted
+        """
+        if fDist == None:
+            raise ValueError("Cannot have null fDist")
+        if maxSize == None or maxSize <= 0:
+            raise ValueError("Cannot have a non-positive or null maxSize")
+
+        self.fDist: IFDistribution = fDist
+        self.maxSize: int = maxSize
+        self.__cachedFPercentileValue = lru_cache(maxsize=maxSize)(fDist.getFPercentileValue)
+        self.__cachedFUpperValue = lru_cache(maxsize=maxSize)(fDist.getFUpperValue)
+        self.__cachedFLowerValue = lru_cache(maxsize=maxSize)(fDist.getFLowerValue)
+
+    def getFPercentileValue(self, percentile: float, df1: int, df2: int) -> float:
+        return self.__cachedFPercentileValue(percentile, df1, df2)
+
+    def getFUpperValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        return self.__cachedFUpperValue(confidenceLevel, df1, df2)
+
+    def getFLowerValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        return self.__cachedFLowerValue(confidenceLevel, df1, df2)
+
+    def getFPercentileValueBatch(self, percentiles: list, dfs1: list, dfs2: list) -> list:
+        return self.fDist.getFPercentileValueBatch(percentiles, dfs1, dfs2)
+
+    def getHits(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of calls served from the caches
+
+        Returns
+        -------
+        int
+            The number of cache hits
+        """
+        return sum(cache.cache_info().hits for cache in self.__caches())
+
+    def getMisses(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of calls forwarded to the wrapped distribution
+
+        Returns
+        -------
+        int
+            The number of cache misses
+        """
+        return sum(cache.cache_info().misses for cache in self.__caches())
+
+    def clearCache(self) -> None:
+        """
+        Description
+        ----------
+        Empties the caches and resets the hit and miss counters
+        """
+        for cache in self.__caches():
+            cache.cache_clear()
+
+    def __caches(self) -> tuple:
+        return (self.__cachedFPercentileValue, self.__cachedFUpperValue, self.__cachedFLowerValue)
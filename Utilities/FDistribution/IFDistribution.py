@@ -79,4 +79,35 @@ class IFDistribution(ABC):
         float
             The corresponding F value statistic
         """
-        pass
\ No newline at end of file
+        pass
+
+    def getFPercentileValueBatch(self, percentiles: list, dfs1: list, dfs2: list) -> list:
+        """
+        Description
+        ----------
+        Finds the f value of each percentile of the F distribution with the
+        matching degrees of freedom. Implementations may override this to
+        evaluate the whole batch at once
+
+        Parameters
+        ----------
+        percentiles : list
+            The desired areas under the curve, as a list or any array of floats
+
+        dfs1: list
+            The number of degrees of freedom in population 1 for each percentile
+
+        dfs2: list
+            The number of degrees of freedom in population 2 for each percentile
+
+        Returns
+        -------
+        list
+            The corresponding f value for each area, as a list or as a numpy
+            array when evaluated vectorized
+        """
+        if percentiles is None or dfs1 is None or dfs2 is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if not len(percentiles) == len(dfs1) == len(dfs2):
+            raise ValueError("Percentiles and df values must have the same length")
+        return [self.getFPercentileValue(percentile, df1, df2) for percentile, df1, df2 in zip(percentiles, dfs1, dfs2)]
@@ -0,0 +1,71 @@
+import math
+
+from Utilities.FDistribution.IFDistribution import IFDistribution
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+from Utilities.SpecialFunctions import SpecialFunctions
+
+_NORMAL_DIST: ErfNormalDistribution = ErfNormalDistribution()
+
+class IncompleteBetaFDistribution(IFDistribution):
+    """Class implementing the IFDistribution interface in pure Python through the regularized incomplete beta function"""
+
+    def getFPercentileValue(self, percentile: float, df1: int, df2: int) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if percentile > 1:
+            raise ValueError("Cannot pass a percentile greater than 1")
+        if df1 == None or df1 <= 0:
+            raise ValueError("Cannot pass a non-positive or null df1 value")
+        if df2 == None or df2 <= 0:
+            raise ValueError("Cannot pass a non-positive or null df2 value")
+        return self.__quantile(percentile, 1 - percentile, df1, df2)
+
+    def getFLowerValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot pass a negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot pass a confidenceLevel greater than 1")
+        if df1 == None or df1 <= 0:
+            raise ValueError("Cannot pass a non-positive or null df1 value")
+        if df2 == None or df2 <= 0:
+            raise ValueError("Cannot pass a non-positive or null df2 value")
+        percentile = (1 - confidenceLevel) / 2
+        return self.__quantile(percentile, 1 - percentile, df1, df2)
+
+    def getFUpperValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot pass a negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot pass a confidenceLevel greater than 1")
+        if df1 == None or df1 <= 0:
+            raise ValueError("Cannot pass a non-positive or null df1 value")
+        if df2 == None or df2 <= 0:
+            raise ValueError("Cannot pass a non-positive or null df2 value")
+        alpha = (1 - confidenceLevel) / 2
+        return self.__quantile(1 - alpha, alpha, df1, df2)
+
+    def __quantile(self, lowerArea: float, upperArea: float, df1: int, df2: int) -> float:
+        # Both areas are passed so that whichever is small carries no rounding
+        if lowerArea == 0:
+            return 0.0
+        if upperArea == 0:
+            return math.inf
+
+        # Start from Paulson's cube root approximation, a quadratic in F ** (1 / 3),
+        # taking the root on the same side of the median as the target
+        z: float = _NORMAL_DIST.getZPercentileValue(lowerArea) if lowerArea <= upperArea else -_NORMAL_DIST.getZPercentileValue(upperArea)
+        a: float = 2 / (9 * df1)
+        b: float = 2 / (9 * df2)
+        quadratic: float = ((1 - b) ** 2) - ((z ** 2) * b)
+        linear: float = -2 * (1 - a) * (1 - b)
+        constant: float = ((1 - a) ** 2) - ((z ** 2) * a)
+        discriminant: float = (linear ** 2) - (4 * quadratic * constant)
+        logGuess: float = math.log(df2 / df1)
+        if quadratic > 0 and discriminant >= 0:
+            root: float = (-linear + (math.copysign(1, z) * math.sqrt(discriminant))) / (2 * quadratic)
+            if root > 0:
+                logGuess = 3 * math.log(root)
+
+        # Solve for the log odds log(df1 F / df2) of the beta variable df1 F / (df1 F + df2)
+        logOdds: float = SpecialFunctions.inverseIncompleteBeta(df1 / 2, df2 / 2, lowerArea, upperArea, logGuess + math.log(df1 / df2))
+        return (df2 / df1) * math.exp(logOdds)
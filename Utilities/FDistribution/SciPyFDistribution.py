@@ -1,6 +1,5 @@
-from scipy.stats import f
-
 from Utilities.FDistribution.IFDistribution import IFDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
 
 class SciPyFDistribution(IFDistribution):
     """Class implementing the IFDistribution interface using scipy"""
@@ -15,7 +14,8 @@ class SciPyFDistribution(IFDistribution):
         if df2 == None or df2 < 0:
             raise ValueError("Cannot pass a negative or null df2 value")
 
-        return f.ppf(percentile, df1, df2)
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.f.ppf(percentile, df1, df2)
 
     def getFLowerValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
         if confidenceLevel == None or confidenceLevel < 0:
@@ -27,7 +27,8 @@ class SciPyFDistribution(IFDistribution):
         if df2 == None or df2 < 0:
             raise ValueError("Cannot pass a negative or null df2 value")
         percentile = (1 - confidenceLevel) / 2
-        return f.ppf(percentile, df1, df2)
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.f.ppf(percentile, df1, df2)
 
     def getFUpperValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
         if confidenceLevel == None or confidenceLevel < 0:
@@ -39,4 +40,26 @@ class SciPyFDistribution(IFDistribution):
         if df2 == None or df2 < 0:
             raise ValueError("Cannot pass a negative or null df2 value")
         percentile = 1 - ((1 - confidenceLevel) / 2)
-        return f.ppf(percentile, df1, df2)
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.f.ppf(percentile, df1, df2)
+
+    def getFPercentileValueBatch(self, percentiles: list, dfs1: list, dfs2: list) -> list:
+        if percentiles is None or dfs1 is None or dfs2 is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if not len(percentiles) == len(dfs1) == len(dfs2):
+            raise ValueError("Percentiles and df values must have the same length")
+
+        numpy = OptionalDependencies.require("numpy")
+        stats = OptionalDependencies.require("scipy.stats")
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        dfs1 = numpy.asarray(dfs1, dtype=float)
+        dfs2 = numpy.asarray(dfs2, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Cannot pass a percentile greater than 1")
+        if numpy.any(numpy.isnan(dfs1) | (dfs1 < 0)):
+            raise ValueError("Cannot pass a negative or null df1 value")
+        if numpy.any(numpy.isnan(dfs2) | (dfs2 < 0)):
+            raise ValueError("Cannot pass a negative or null df2 value")
+        return stats.f.ppf(percentiles, dfs1, dfs2)
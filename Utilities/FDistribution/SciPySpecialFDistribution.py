@@ -0,0 +1,85 @@
+import math
+
+from Utilities.FDistribution.IFDistribution import IFDistribution
+from Utilities.FDistribution.IncompleteBetaFDistribution import IncompleteBetaFDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+
+_FALLBACK: IFDistribution = IncompleteBetaFDistribution()
+
+class SciPySpecialFDistribution(IFDistribution):
+    """Class implementing the IFDistribution interface with the scalar scipy.special functions, falling back to the pure Python IncompleteBetaFDistribution without scipy"""
+
+    def getFPercentileValue(self, percentile: float, df1: int, df2: int) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if percentile > 1:
+            raise ValueError("Cannot pass a percentile greater than 1")
+        if df1 == None or df1 < 0:
+            raise ValueError("Cannot pass a negative or null df1 value")
+        if df2 == None or df2 < 0:
+            raise ValueError("Cannot pass a negative or null df2 value")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getFPercentileValue(percentile, df1, df2)
+        return float(special.fdtri(df1, df2, percentile))
+
+    def getFLowerValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot pass a negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot pass a confidenceLevel greater than 1")
+        if df1 == None or df1 < 0:
+            raise ValueError("Cannot pass a negative or null df1 value")
+        if df2 == None or df2 < 0:
+            raise ValueError("Cannot pass a negative or null df2 value")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getFLowerValue(confidenceLevel, df1, df2)
+        percentile = (1 - confidenceLevel) / 2
+        return float(special.fdtri(df1, df2, percentile))
+
+    def getFUpperValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot pass a negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot pass a confidenceLevel greater than 1")
+        if df1 == None or df1 < 0:
+            raise ValueError("Cannot pass a negative or null df1 value")
+        if df2 == None or df2 < 0:
+            raise ValueError("Cannot pass a negative or null df2 value")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getFUpperValue(confidenceLevel, df1, df2)
+
+        # The upper percentile of F(df1, df2) is the reciprocal of the lower
+        # percentile of F(df2, df1), which avoids rounding 1 - alpha
+        percentile = (1 - confidenceLevel) / 2
+        if percentile == 0:
+            return math.inf
+        return 1 / float(special.fdtri(df2, df1, percentile))
+
+    def getFPercentileValueBatch(self, percentiles: list, dfs1: list, dfs2: list) -> list:
+        if percentiles is None or dfs1 is None or dfs2 is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if not len(percentiles) == len(dfs1) == len(dfs2):
+            raise ValueError("Percentiles and df values must have the same length")
+
+        numpy = OptionalDependencies.load("numpy")
+        special = OptionalDependencies.load("scipy.special")
+        if numpy == None or special == None:
+            return super().getFPercentileValueBatch(percentiles, dfs1, dfs2)
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        dfs1 = numpy.asarray(dfs1, dtype=float)
+        dfs2 = numpy.asarray(dfs2, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Cannot pass a percentile greater than 1")
+        if numpy.any(numpy.isnan(dfs1) | (dfs1 < 0)):
+            raise ValueError("Cannot pass a negative or null df1 value")
+        if numpy.any(numpy.isnan(dfs2) | (dfs2 < 0)):
+            raise ValueError("Cannot pass a negative or null df2 value")
+        return special.fdtri(dfs1, dfs2, percentiles)
@@ -0,0 +1,126 @@
+import os
+
+from Utilities.CriticalValueTable import CriticalValueTable, UPPER_PERCENTILES
+from Utilities.FDistribution.CachedFDistribution import CachedFDistribution
+from Utilities.FDistribution.IFDistribution import IFDistribution
+
+DEFAULT_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fCriticalValues.bin")
+
+# Every df up to 60, then progressively sparser values commonly met in practice
+DFS: tuple = tuple(range(1, 61)) + (70, 80, 90, 100, 120, 150, 200, 250, 300, 400, 500, 1000, 5000, 10000)
+
+class TableFDistribution(IFDistribution):
+    """Class implementing the IFDistribution interface from a precomputed table of critical values, falling back to exact computation off the grid"""
+
+    def __init__(self, exact: IFDistribution = CachedFDistribution(), path: str = DEFAULT_PATH) -> None:
+        """
+        Description
+        ----------
+        Constructor for the TableFDistribution
+
+        Parameters
+        ----------
+        exact: IFDistribution
+            The F distribution used for percentiles outside the table
+
+        path: str
+            The path of the table, loaded on first use
+        """
+        if exact == None:
+            raise ValueError("Cannot have null exact")
+        if path == None:
+            raise ValueError("Cannot have a null path")
+
+        self.exact: IFDistribution = exact
+        self.path: str = path
+        self.__table: CriticalValueTable = None
+        self.__tableLoaded: bool = False
+        self.__tableHits: dict = {}
+
+    @staticmethod
+    def generate(path: str = DEFAULT_PATH, exact: IFDistribution = CachedFDistribution()) -> None:
+        """
+        Description
+        ----------
+        Regenerates the table of upper critical values for every pair of df in
+        DFS. Lower critical values are read from it as the reciprocal of the
+        upper critical value with the df swapped
+
+        Parameters
+        ----------
+        path: str
+            The path of the table to write
+
+        exact: IFDistribution
+            The F distribution used to compute the table
+        """
+        dfs: list = [float(df) for df in DFS]
+        CriticalValueTable.build(UPPER_PERCENTILES, dfs, dfs, exact.getFPercentileValue).save(path)
+
+    def getFPercentileValue(self, percentile: float, df1: int, df2: int) -> float:
+        # Arguments only reach the memo after validation and a table hit, so a
+        # repeated critical value skips both. It only grows with the distinct
+        # tabulated arguments asked for
+        fVal: float = self.__tableHits.get((percentile, df1, df2))
+        if fVal != None:
+            return fVal
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if percentile > 1:
+            raise ValueError("Cannot pass a percentile greater than 1")
+        if df1 == None or df1 < 0:
+            raise ValueError("Cannot pass a negative or null df1 value")
+        if df2 == None or df2 < 0:
+            raise ValueError("Cannot pass a negative or null df2 value")
+
+        table: CriticalValueTable = self.__getTable()
+        if table != None:
+            fVal = table.lookup(percentile, df1, df2)
+            if fVal == None:
+                fVal = table.lookup(1 - percentile, df2, df1)
+                fVal = 1 / fVal if fVal != None else None
+            if fVal != None:
+                self.__tableHits[(percentile, df1, df2)] = fVal
+                return fVal
+        return self.exact.getFPercentileValue(percentile, df1, df2)
+
+    def getFLowerValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        fVal: float = self.__tableHits.get(("lower", confidenceLevel, df1, df2))
+        if fVal != None:
+            return fVal
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot pass a negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot pass a confidenceLevel greater than 1")
+        percentile = (1 - confidenceLevel) / 2
+        fVal = self.getFPercentileValue(percentile, df1, df2)
+        if (percentile, df1, df2) in self.__tableHits:
+            self.__tableHits[("lower", confidenceLevel, df1, df2)] = fVal
+        return fVal
+
+    def getFUpperValue(self, confidenceLevel: float, df1: int, df2: int) -> float:
+        fVal: float = self.__tableHits.get(("upper", confidenceLevel, df1, df2))
+        if fVal != None:
+            return fVal
+        if confidenceLevel == None or confidenceLevel < 0:
+            raise ValueError("Cannot pass a negative or null confidenceLevel")
+        if confidenceLevel > 1:
+            raise ValueError("Cannot pass a confidenceLevel greater than 1")
+        percentile = 1 - ((1 - confidenceLevel) / 2)
+        fVal = self.getFPercentileValue(percentile, df1, df2)
+        if (percentile, df1, df2) in self.__tableHits:
+            self.__tableHits[("upper", confidenceLevel, df1, df2)] = fVal
+        return fVal
+
+    def getFPercentileValueBatch(self, percentiles: list, dfs1: list, dfs2: list) -> list:
+        # Batches go straight to the vectorized exact computation, as a table
+        # lookup per element would cost more than the single call it replaces
+        return self.exact.getFPercentileValueBatch(percentiles, dfs1, dfs2)
+
+    def __getTable(self) -> CriticalValueTable:
+        # The shared table is looked up once per instance, keeping the lock and
+        # the path lookup off the path of every repeated critical value
+        if not self.__tableLoaded:
+            self.__table = CriticalValueTable.loadShared(self.path)
+            self.__tableLoaded = True
+        return self.__table
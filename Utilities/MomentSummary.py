@@ -0,0 +1,265 @@
+import math
+
+from Utilities.SampleUtilities import SampleUtilities
+
+class MomentSummary:
+    """Class holding the count, mean and central moment sums of a sample so that shards of a sample can be combined"""
+
+    def __init__(self, n: int, mean: float, m2: float, m3: float = None, m4: float = None) -> None:
+        """
+        Description
+        ----------
+        Constructor for the MomentSummary
+
+        Parameters
+        ----------
+        n: int
+            The number of values summarized
+
+        mean: float
+            The mean of the summarized values
+
+        m2: float
+            The sum of the squared deviations from the mean
+
+        m3: float
+            The sum of the cubed deviations from the mean, if tracked
+
+        m4: float
+            The sum of the fourth power deviations from the mean, if tracked
+        """
+        if n == None or n <= 0:
+            raise ValueError("Cannot have a non-positive or null n")
+        if mean == None:
+            raise ValueError("Cannot have a null mean")
+        if m2 == None or m2 < 0:
+            raise ValueError("Cannot have a negative or null m2")
+        if (m3 == None) != (m4 == None):
+            raise ValueError("Cannot track only one of m3 and m4")
+
+        self.n: int = n
+        self.mean: float = mean
+        self.m2: float = m2
+        self.m3: float = m3
+        self.m4: float = m4
+
+    def __len__(self) -> int:
+        return self.n
+
+    @staticmethod
+    def fromValues(values: list, higherMoments: bool = False) -> "MomentSummary":
+        """
+        Description
+        ----------
+        Summarizes a sample in a single pass over its values
+
+        Parameters
+        ----------
+        values : list
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
+
+        higherMoments : bool
+            Whether the third and fourth central moment sums should also be tracked
+
+        Returns
+        -------
+        MomentSummary
+            The summary of the provided values
+        """
+        n, mean, m2, m3, m4 = SampleUtilities.estimateMoments(values, higherMoments)
+        return MomentSummary(n, mean, m2, m3, m4)
+
+    @staticmethod
+    def fromStatistics(n: int, mean: float, stdDev: float) -> "MomentSummary":
+        """
+        Description
+        ----------
+        Builds a summary from the size, mean and standard deviation of a sample,
+        such as those held in a pre-aggregated table
+
+        Parameters
+        ----------
+        n: int
+            The size of the sample
+
+        mean: float
+            The mean of the sample
+
+        stdDev: float
+            The standard deviation of the sample
+
+        Returns
+        -------
+        MomentSummary
+            The summary of the sample
+        """
+        if n == None or n <= 0:
+            raise ValueError("Cannot have a non-positive or null n")
+        if stdDev == None or stdDev < 0:
+            raise ValueError("Cannot have a negative or null stdDev")
+        return MomentSummary(n, mean, (stdDev ** 2) * (n - 1))
+
+    @staticmethod
+    def asSummary(values: object) -> "MomentSummary":
+        """
+        Description
+        ----------
+        Returns the provided summary as is, or summarizes the provided sample
+
+        Parameters
+        ----------
+        values : object
+            Either a MomentSummary or a population sample of floating point numbers
+
+        Returns
+        -------
+        MomentSummary
+            The summary of the provided values
+        """
+        if isinstance(values, MomentSummary):
+            return values
+        return MomentSummary.fromValues(values)
+
+    @staticmethod
+    def combine(summaries: list) -> "MomentSummary":
+        """
+        Description
+        ----------
+        Combines the summaries of several disjoint shards of a sample
+
+        Parameters
+        ----------
+        summaries : list
+            The summaries of each shard
+
+        Returns
+        -------
+        MomentSummary
+            The summary of the union of the shards
+        """
+        if summaries == None or len(summaries) == 0:
+            raise ValueError("Cannot have empty or null summaries")
+        combined: MomentSummary = summaries[0]
+        for summary in summaries[1:]:
+            combined = combined.merge(summary)
+        return combined
+
+    def merge(self, other: "MomentSummary") -> "MomentSummary":
+        """
+        Description
+        ----------
+        Merges this summary with the summary of a disjoint shard using the
+        pairwise update formulas of Chan et al. and Pébay. The third and fourth
+        moment sums are kept only when both summaries track them
+
+        Parameters
+        ----------
+        other : MomentSummary
+            The summary of the other shard
+
+        Returns
+        -------
+        MomentSummary
+            The summary of both shards
+        """
+        if other == None:
+            raise ValueError("Cannot merge a null summary")
+
+        na: int = self.n
+        nb: int = other.n
+        n: int = na + nb
+        delta: float = other.mean - self.mean
+        deltaOverN: float = delta / n
+
+        mean: float = self.mean + (deltaOverN * nb)
+        m2: float = self.m2 + other.m2 + (delta * deltaOverN * na * nb)
+        if self.m3 == None or other.m3 == None:
+            return MomentSummary(n, mean, m2)
+
+        m3: float = self.m3 + other.m3 \
+            + (delta * (deltaOverN ** 2) * na * nb * (na - nb)) \
+            + (3 * deltaOverN * ((na * other.m2) - (nb * self.m2)))
+        m4: float = self.m4 + other.m4 \
+            + (delta * (deltaOverN ** 3) * na * nb * ((na ** 2) - (na * nb) + (nb ** 2))) \
+            + (6 * (deltaOverN ** 2) * (((na ** 2) * other.m2) + ((nb ** 2) * self.m2))) \
+            + (4 * deltaOverN * ((na * other.m3) - (nb * self.m3)))
+        return MomentSummary(n, mean, m2, m3, m4)
+
+    def getMean(self) -> float:
+        """
+        Description
+        ----------
+        Returns the mean of the summarized values
+
+        Returns
+        -------
+        float
+            The mean of the summarized values
+        """
+        return self.mean
+
+    def getVariance(self) -> float:
+        """
+        Description
+        ----------
+        Returns the unbiased variance estimate of the summarized values
+
+        Returns
+        -------
+        float
+            The variance of the summarized values
+        """
+        if self.n == 1:
+            raise ValueError("Cannot calculate variance of 1 element")
+        return self.m2 / (self.n - 1)
+
+    def getStdDev(self) -> float:
+        """
+        Description
+        ----------
+        Returns the standard deviation estimate of the summarized values
+
+        Returns
+        -------
+        float
+            The standard deviation of the summarized values
+        """
+        if self.n == 1:
+            raise ValueError("Cannot calculate standard deviation of 1 element")
+        return math.sqrt(self.getVariance())
+
+    def toDict(self) -> dict:
+        """
+        Description
+        ----------
+        Serializes the summary into a dictionary of plain numbers, suitable for
+        json or for sending between worker processes
+
+        Returns
+        -------
+        dict
+            The fields of the summary
+        """
+        return {"n": self.n, "mean": self.mean, "m2": self.m2, "m3": self.m3, "m4": self.m4}
+
+    @staticmethod
+    def fromDict(fields: dict) -> "MomentSummary":
+        """
+        Description
+        ----------
+        Deserializes a summary produced by toDict
+
+        Parameters
+        ----------
+        fields : dict
+            The fields of the summary
+
+        Returns
+        -------
+        MomentSummary
+            The deserialized summary
+        """
+        if fields == None:
+            raise ValueError("Cannot have null fields")
+        return MomentSummary(fields["n"], fields["mean"], fields["m2"], fields.get("m3"), fields.get("m4"))
@@ -1,15 +1,37 @@
 import math
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
 
 from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+
+# Layout of a saved table: magic with format version and byte order, step,
+# precision, lowerbound, upperbound, integration, entry count. Every field is
+# little endian, so that a saved table loads on any platform
+_MAGIC: bytes = b"SPNTB3LE"
+_HEADER: struct.Struct = struct.Struct("<8sdqddqq")
+_HEADER_ITEM_SIZE: int = array("d").itemsize
+_INTEGRATIONS: tuple = ("rectangle", "trapezoid", "simpson")
 
 class ApproximateNormalTable(INormalDistribution):
     """Class which creates an approximated standard normal table"""
 
+    # Tables are built on first use and shared by every instance with the same
+    # step, precision, bounds and integration rule, keyed by those parameters
+    __sharedTables: dict = {}
+    __sharedTablesLock: threading.Lock = threading.Lock()
+
     def __init__(self, 
         step: float = 0.001, 
         precision: int = 3, 
         lowerbound: float = -5.0, 
-        upperbound: float = 5.0) -> None:
+        upperbound: float = 5.0,
+        interpolate: bool = False,
+        integration: str = "rectangle") -> None:
         """
         Description
         ----------
@@ -30,6 +52,14 @@ class ApproximateNormalTable(INormalDistribution):
         upperbound: float
             The right most value of the approximated standard normal distribution
 
+        interpolate: bool
+            Whether lookups should linearly interpolate between neighbouring grid
+            points rather than snapping to the nearest one
+
+        integration: str
+            The rule used to integrate the pdf between grid points. "rectangle"
+            accumulates the pdf at each grid point, while "trapezoid" and "simpson"
+            are higher order rules which reach the same accuracy with a coarser step
         """
         if step == None or step < 0:
             raise ValueError("Step cannot be negative or null")
@@ -39,12 +69,132 @@ class ApproximateNormalTable(INormalDistribution):
             raise ValueError("Lowerbound cannot null")
         if upperbound == None:
             raise ValueError("Upperbound cannot null")
+        if upperbound <= lowerbound:
+            raise ValueError("Upperbound must be greater than the lowerbound")
+        if integration not in _INTEGRATIONS:
+            raise ValueError("Integration must be one of " + ", ".join(_INTEGRATIONS))
 
         self.step: float = step
         self.precision: int = precision
         self.lowerbound: float = lowerbound
         self.uppperbound: float = upperbound
-        self.table: dict = self.__approximateCdf()
+        self.interpolate: bool = interpolate
+        self.integration: str = integration
+        self.__sharedTable: array = None
+
+    @property
+    def table(self) -> dict:
+        """
+        Description
+        ----------
+        A dictionary view of the table, mapping the values of z to their left
+        tail cdf value. The view is rebuilt on every access, so lookups should
+        go through getLeftTailArea and getZPercentileValue instead
+
+        Returns
+        -------
+        dict
+            The values of z and their left tail cdf value
+        """
+        cdfValues = self.getCdfValues()
+        return {self.__getZValue(index): cdfValues[index] for index in range(len(cdfValues))}
+
+    def getCdfValues(self) -> array:
+        """
+        Description
+        ----------
+        Returns the left tail cdf values of the table in ascending order of z.
+        The values are shared with every instance having the same step,
+        precision and bounds, and are built the first time any of them is used
+
+        Returns
+        -------
+        array
+            The cdf values, either as an array of doubles or as a read only view
+            over a memory mapped file when the table was loaded from disk
+        """
+        if self.__sharedTable == None:
+            key: tuple = (self.step, self.precision, self.lowerbound, self.uppperbound, self.integration)
+            with ApproximateNormalTable.__sharedTablesLock:
+                sharedTable = ApproximateNormalTable.__sharedTables.get(key)
+                if sharedTable == None:
+                    sharedTable = self.__approximateCdf()
+                    ApproximateNormalTable.__sharedTables[key] = sharedTable
+            self.__sharedTable = sharedTable
+        return self.__sharedTable
+
+    def __getZValue(self, index: int) -> float:
+        return round(self.lowerbound + (index * self.step), self.precision)
+
+    def __getIndex(self, val: float) -> int:
+        return round((val - self.lowerbound) / self.step)
+
+    def save(self, path: str) -> None:
+        """
+        Description
+        ----------
+        Saves the table to a compact binary file: a fixed size header holding the
+        step, precision, bounds and entry count, followed by the cdf values as
+        little endian float64
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to write
+        """
+        if path == None:
+            raise ValueError("Cannot have a null path")
+        cdfValues = self.getCdfValues()
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, self.step, self.precision, self.lowerbound, self.uppperbound,
+                _INTEGRATIONS.index(self.integration), len(cdfValues)))
+            contents: array = array("d", cdfValues)
+            if sys.byteorder == "big":
+                contents.byteswap()
+            contents.tofile(file)
+
+    @staticmethod
+    def load(path: str) -> "ApproximateNormalTable":
+        """
+        Description
+        ----------
+        Loads a table written by save by memory mapping the file, so that no cdf
+        values are computed or copied and processes loading the same file share
+        its pages on little endian platforms. The loaded values become the
+        shared table for its parameters
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to read
+
+        Returns
+        -------
+        ApproximateNormalTable
+            The table backed by the memory mapped file
+        """
+        if path == None:
+            raise ValueError("Cannot have a null path")
+        with open(path, "rb") as file:
+            mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < _HEADER.size:
+            raise ValueError("File is too short to hold a saved table")
+        magic, step, precision, lowerbound, upperbound, integration, count = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or integration < 0 or integration >= len(_INTEGRATIONS):
+            raise ValueError("File does not hold a saved table")
+        if len(mapped) != _HEADER.size + (count * _HEADER_ITEM_SIZE):
+            raise ValueError("File size does not match the saved entry count")
+
+        table: ApproximateNormalTable = ApproximateNormalTable(step, precision, lowerbound, upperbound,
+            integration=_INTEGRATIONS[integration])
+        cdfValues: object = memoryview(mapped)[_HEADER.size:].cast("d")
+        if sys.byteorder == "big":
+            cdfValues = array("d", mapped[_HEADER.size:])
+            cdfValues.byteswap()
+        with ApproximateNormalTable.__sharedTablesLock:
+            ApproximateNormalTable.__sharedTables[(step, precision, lowerbound, upperbound, table.integration)] = cdfValues
+        table.__sharedTable = cdfValues
+        return table
 
     @staticmethod
     def pdf(x : float):
@@ -67,50 +217,117 @@ class ApproximateNormalTable(INormalDistribution):
             raise ValueError("Cannot pass a null value")
         return math.exp(-(x**2) / 2) / (math.sqrt(2) * math.pi)
 
-    def __approximateCdf(self) -> dict:
+    def __getGridSize(self) -> int:
+        """
+        Description
+        ----------
+        Counts the values of z on the grid, being every rounded step from the
+        lowerbound which does not pass the upperbound
+
+        Returns
+        -------
+        int
+            The number of grid points
+        """
+        count: int = math.floor(((self.uppperbound - self.lowerbound) / self.step) + 0.5) + 1
+        while count > 1 and self.__getZValue(count - 1) > self.uppperbound:
+            count -= 1
+        while self.__getZValue(count) <= self.uppperbound:
+            count += 1
+        return count
+
+    def __approximateCdf(self) -> array:
         """
         Description
         ----------
         Approximates the behaviour of the cumulative density function represented as
-        a dictionary
+        an array of doubles, one per step from the lowerbound. Each entry adds the
+        area between the previous grid point and its own under the chosen
+        integration rule, and the whole is normalized to end at one
 
         Returns
         -------
-        dict
-            The a dictionary of values of z and their right tail cdf value
+        array
+            The left tail cdf value of each value of z on the grid
         """
-        lowerbound: float = self.lowerbound
-        upperbound: float = self.uppperbound
-        step: float = self.step
-        cursor: float = lowerbound
+        count: int = self.__getGridSize()
+        if OptionalDependencies.load("numpy") is not None:
+            return self.__approximateCdfVectorized(count)
+
+        zValues: list = [self.__getZValue(index) for index in range(count)]
+        pdfValues: list = [ApproximateNormalTable.pdf(zVal) for zVal in zValues]
         sum: float = 0
+        leftTailCdf: array = array("d")
+
+        if self.integration == "rectangle":
+            for pdfVal in pdfValues:
+                sum += pdfVal
+                leftTailCdf.append(sum)
+        else:
+            leftTailCdf.append(0)
+            for index in range(1, count):
+                if self.integration == "trapezoid":
+                    sum += (pdfValues[index - 1] + pdfValues[index]) / 2
+                else:
+                    midpointPdf: float = ApproximateNormalTable.pdf((zValues[index - 1] + zValues[index]) / 2)
+                    sum += (pdfValues[index - 1] + (4 * midpointPdf) + pdfValues[index]) / 6
+                leftTailCdf.append(sum)
 
-        rightTailCdf: dict = {}
+        for index in range(count):
+            leftTailCdf[index] /= sum
 
-        while cursor <= upperbound:
-            pdfVal: float = ApproximateNormalTable.pdf(cursor)
-            sum += pdfVal
+        return leftTailCdf
 
-            rightTailCdf[cursor] = sum
-            cursor += step
-            cursor = round(cursor, self.precision)
+    def __approximateCdfVectorized(self, count: int) -> array:
+        numpy = OptionalDependencies.load("numpy")
+        zValues = numpy.round(self.lowerbound + (numpy.arange(count) * self.step), self.precision)
+        pdfValues = numpy.exp(-(zValues ** 2) / 2) / (math.sqrt(2) * math.pi)
 
-        for key in rightTailCdf:
-            rightTailCdf[key] /= sum
+        if self.integration == "rectangle":
+            increments = pdfValues
+        else:
+            increments = numpy.empty(count)
+            increments[0] = 0
+            if self.integration == "trapezoid":
+                increments[1:] = (pdfValues[:-1] + pdfValues[1:]) / 2
+            else:
+                midpoints = (zValues[:-1] + zValues[1:]) / 2
+                midpointPdfValues = numpy.exp(-(midpoints ** 2) / 2) / (math.sqrt(2) * math.pi)
+                increments[1:] = (pdfValues[:-1] + (4 * midpointPdfValues) + pdfValues[1:]) / 6
 
-        return rightTailCdf
+        leftTailCdf = numpy.cumsum(increments)
+        leftTailCdf /= leftTailCdf[-1]
+        return array("d", leftTailCdf.tobytes())
 
     def getLeftTailArea(self, val: float) -> float:
         if val == None:
             raise ValueError("Cannot pass a z null value")
 
-        val = round(val, self.precision)
-        if val < self.lowerbound:
+        if self.interpolate:
+            return self.__interpolateLeftTailArea(val)
+
+        # Snap to the nearest grid point by its index alone, the same rule as
+        # getLeftTailAreaBatch, so that both agree on values halfway between points
+        cdfValues = self.getCdfValues()
+        index: int = self.__getIndex(val)
+        if index < 0:
             return 0
-        elif val > self.uppperbound:
+        elif index >= len(cdfValues):
             return 1
 
-        return self.table[val]
+        return cdfValues[index]
+
+    def __interpolateLeftTailArea(self, val: float) -> float:
+        cdfValues = self.getCdfValues()
+        position: float = (val - self.lowerbound) / self.step
+        if position < 0:
+            return 0
+        if position >= len(cdfValues) - 1:
+            return 1 if position > len(cdfValues) - 1 else cdfValues[-1]
+
+        index: int = int(position)
+        fraction: float = position - index
+        return cdfValues[index] + (fraction * (cdfValues[index + 1] - cdfValues[index]))
 
     def getZPercentileValue(self, percentile: float) -> float:
         if percentile == None or percentile < 0:
@@ -118,10 +335,68 @@ class ApproximateNormalTable(INormalDistribution):
         if percentile > 1:
             raise ValueError("Target area cannot be greater than one")
 
-        for key in self.table:
-            val = self.table[key]
-            if val >= percentile:
-                return key
+        # The cdf values are ascending, so the first z with atleast the target
+        # area is found by bisection rather than by walking the table
+        cdfValues = self.getCdfValues()
+        index: int = bisect_left(cdfValues, percentile)
+        if index == len(cdfValues):
+            return self.uppperbound
+        if not self.interpolate or index == 0:
+            return self.__getZValue(index)
+
+        # Invert the linear interpolation between the grid points either side of the target
+        lowerArea: float = cdfValues[index - 1]
+        fraction: float = (percentile - lowerArea) / (cdfValues[index] - lowerArea)
+        return self.lowerbound + ((index - 1 + fraction) * self.step)
+
+    def getLeftTailAreaBatch(self, vals: list) -> list:
+        numpy = OptionalDependencies.load("numpy")
+        if numpy is None:
+            return super().getLeftTailAreaBatch(vals)
+        if vals is None:
+            raise ValueError("Cannot pass null z values")
+
+        vals = numpy.asarray(vals, dtype=float)
+        cdfValues = numpy.frombuffer(self.getCdfValues(), dtype=float)
+        if self.interpolate:
+            positions = (vals - self.lowerbound) / self.step
+            return numpy.interp(positions, numpy.arange(len(cdfValues)), cdfValues, left=0, right=1)
+
+        # rint rounds half to even like round, so indices match getLeftTailArea
+        positions = numpy.rint((vals - self.lowerbound) / self.step)
+        areas = cdfValues[numpy.clip(positions, 0, len(cdfValues) - 1).astype(int)]
+        areas[positions < 0] = 0
+        areas[positions >= len(cdfValues)] = 1
+        return areas
+
+    def getZPercentileValueBatch(self, targetAreas: list) -> list:
+        numpy = OptionalDependencies.load("numpy")
+        if numpy is None:
+            return super().getZPercentileValueBatch(targetAreas)
+        if targetAreas is None:
+            raise ValueError("Cannot pass null target areas")
+
+        targetAreas = numpy.asarray(targetAreas, dtype=float)
+        if numpy.any(targetAreas < 0) or numpy.any(numpy.isnan(targetAreas)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(targetAreas > 1):
+            raise ValueError("Target area cannot be greater than one")
+
+        cdfValues = numpy.frombuffer(self.getCdfValues(), dtype=float)
+        indices = numpy.searchsorted(cdfValues, targetAreas, side="left")
+        beyondTable = indices == len(cdfValues)
+        indices = numpy.minimum(indices, len(cdfValues) - 1)
+
+        if self.interpolate:
+            previous = numpy.maximum(indices - 1, 0)
+            lowerAreas = cdfValues[previous]
+            spans = cdfValues[indices] - lowerAreas
+            fractions = numpy.divide(targetAreas - lowerAreas, spans, out=numpy.zeros_like(targetAreas), where=spans > 0)
+            zValues = numpy.where(indices == 0,
+                numpy.round(self.lowerbound + (indices * self.step), self.precision),
+                self.lowerbound + ((previous + fractions) * self.step))
+        else:
+            zValues = numpy.round(self.lowerbound + (indices * self.step), self.precision)
 
-        return self.uppperbound
-    
\ No newline at end of file
+        zValues[beyondTable] = self.uppperbound
+        return zValues
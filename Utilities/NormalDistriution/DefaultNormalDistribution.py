@@ -0,0 +1,52 @@
+from Utilities.NormalDistriution.ApproximateNormalTable import ApproximateNormalTable
+from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
+
+class DefaultNormalDistribution(INormalDistribution):
+    """Class which forwards to the process wide default normal distribution, so the default can be selected after import"""
+
+    __implementation: INormalDistribution = ApproximateNormalTable()
+
+    @staticmethod
+    def getImplementation() -> INormalDistribution:
+        """
+        Description
+        ----------
+        Returns the normal distribution currently used by default
+
+        Returns
+        -------
+        INormalDistribution
+            The default normal distribution
+        """
+        return DefaultNormalDistribution.__implementation
+
+    @staticmethod
+    def setImplementation(normalDist: INormalDistribution) -> None:
+        """
+        Description
+        ----------
+        Selects the normal distribution used by every analyzer and comparer
+        constructed without an explicit one, including those already constructed
+
+        Parameters
+        ----------
+        normalDist: INormalDistribution
+            The normal distribution to use by default
+        """
+        if normalDist == None:
+            raise ValueError("Cannot have null normalDist")
+        if isinstance(normalDist, DefaultNormalDistribution):
+            raise ValueError("Cannot forward the default normal distribution to itself")
+        DefaultNormalDistribution.__implementation = normalDist
+
+    def getLeftTailArea(self, val: float) -> float:
+        return DefaultNormalDistribution.__implementation.getLeftTailArea(val)
+
+    def getZPercentileValue(self, targetArea: float) -> float:
+        return DefaultNormalDistribution.__implementation.getZPercentileValue(targetArea)
+
+    def getLeftTailAreaBatch(self, vals: list) -> list:
+        return DefaultNormalDistribution.__implementation.getLeftTailAreaBatch(vals)
+
+    def getZPercentileValueBatch(self, targetAreas: list) -> list:
+        return DefaultNormalDistribution.__implementation.getZPercentileValueBatch(targetAreas)
@@ -40,4 +40,49 @@ class INormalDistribution(ABC):
         float
             The corresponding z value for that area under the approximated curves
         """
-        pass
\ No newline at end of file
+        pass
+
+    def getLeftTailAreaBatch(self, vals: list) -> list:
+        """
+        Description
+        ----------
+        Finds the left tail area value of each of the given z values. Implementations
+        may override this to evaluate the whole batch at once
+
+        Parameters
+        ----------
+        vals : list
+            The candidate z values, as a list or any array of floats
+
+        Returns
+        -------
+        list
+            The approximate area under the standard normal curve for each z value,
+            as a list or as a numpy array when evaluated vectorized
+        """
+        if vals is None:
+            raise ValueError("Cannot pass null z values")
+        return [self.getLeftTailArea(val) for val in vals]
+
+    def getZPercentileValueBatch(self, targetAreas: list) -> list:
+        """
+        Description
+        ----------
+        Finds the z value of each of the given target areas. Implementations may
+        override this to evaluate the whole batch at once
+
+        Parameters
+        ----------
+        targetAreas : list
+            The desired areas under the standard normal curve, as a list or any
+            array of floats
+
+        Returns
+        -------
+        list
+            The corresponding z value for each area, as a list or as a numpy array
+            when evaluated vectorized
+        """
+        if targetAreas is None:
+            raise ValueError("Cannot pass null target areas")
+        return [self.getZPercentileValue(targetArea) for targetArea in targetAreas]
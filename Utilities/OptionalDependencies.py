@@ -0,0 +1,55 @@
+import importlib
+
+class OptionalDependencies:
+    """Class which imports the numerical dependencies on first use, so that importing the package stays fast"""
+
+    __modules: dict = {}
+
+    @staticmethod
+    def load(name: str) -> object:
+        """
+        Description
+        ----------
+        Imports a module the first time it is needed and remembers the result,
+        including whether it is installed at all
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the module, such as "numpy" or "scipy.stats"
+
+        Returns
+        -------
+        object
+            The module, or None if it is not installed
+        """
+        if name not in OptionalDependencies.__modules:
+            try:
+                module: object = importlib.import_module(name)
+            except ImportError:
+                module = None
+            OptionalDependencies.__modules[name] = module
+        return OptionalDependencies.__modules[name]
+
+    @staticmethod
+    def require(name: str) -> object:
+        """
+        Description
+        ----------
+        Imports a module the first time it is needed like load, for callers
+        which cannot work without it
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the module, such as "numpy" or "scipy.stats"
+
+        Returns
+        -------
+        object
+            The module
+        """
+        module: object = OptionalDependencies.load(name)
+        if module == None:
+            raise ImportError("Module " + name + " is required but not installed")
+        return module
@@ -1,6 +1,8 @@
 import math
 import random
 
+from Utilities.OptionalDependencies import OptionalDependencies
+
 class SampleUtilities:
     """Class for reusable sample measurement methods"""
 
@@ -14,15 +16,19 @@ class SampleUtilities:
         Parameters
         ----------
         values : list
-            A population sample of floating point numbers
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
 
         Returns
         -------
         float
             The average of the provided values
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null sample")
+        array = SampleUtilities.asArray(values)
+        if array is not None:
+            return float(array.mean())
         return sum(values) / len(values)
 
     @staticmethod
@@ -35,18 +41,19 @@ class SampleUtilities:
         Parameters
         ----------
         values : list
-            A population sample of floating point numbers
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
 
         Returns
         -------
         float
             The standard deviation of the provided values
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null sample")
         if len(values) == 1:
             raise ValueError("Cannot calculate standard deviation of 1 element")
-        return math.sqrt(SampleUtilities.estimateVariance(values))
+        return math.sqrt(SampleUtilities.estimateMeanAndVariance(values)[1])
 
     @staticmethod
     def estimateVariance(values: list) -> float:
@@ -58,26 +65,145 @@ class SampleUtilities:
         Parameters
         ----------
         values : list
-            A population sample of floating point numbers
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
 
         Returns
         -------
         float
             The variance of the provided values
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null sample")
         if len(values) == 1:
             raise ValueError("Cannot calculate variance of 1 element")
+        return SampleUtilities.estimateMeanAndVariance(values)[1]
+
+    @staticmethod
+    def estimateMeanAndVariance(values: list) -> tuple:
+        """
+        Description
+        ----------
+        Estimates both the mean and the variance of a list of values using a
+        single sweep over the deviations from the mean
+
+        Parameters
+        ----------
+        values : list
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
+
+        Returns
+        -------
+        tuple
+            The mean and the variance of the provided values
+        """
+        if values is None or len(values) == 0:
+            raise ValueError("Cannot have empty or null sample")
+        if len(values) == 1:
+            raise ValueError("Cannot calculate variance of 1 element")
+
+        n, mean, m2, _, _ = SampleUtilities.estimateMoments(values)
+        return (mean, m2 / (n-1))
+
+    @staticmethod
+    def estimateMoments(values: list, higherMoments: bool = False) -> tuple:
+        """
+        Description
+        ----------
+        Accumulates the count, mean and central moment sums of a list of values.
+        The mean is taken with the builtin sum, after which every central moment
+        is gathered in one shared pass over the values
+
+        Parameters
+        ----------
+        values : list
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
+
+        higherMoments : bool
+            Whether the third and fourth central moment sums should also be accumulated
+
+        Returns
+        -------
+        tuple
+            The count, mean, and the sums of the squared, cubed and fourth power
+            deviations from the mean (the last two are None unless higherMoments is set)
+        """
+        if values is None or len(values) == 0:
+            raise ValueError("Cannot have empty or null sample")
+
+        array = SampleUtilities.asArray(values)
+        if array is not None:
+            return SampleUtilities.__estimateArrayMoments(array, higherMoments)
 
-        mean: float = SampleUtilities.estimateMean(values)
         n: int = len(values)
+        mean: float = sum(values) / n
+
+        m2: float = 0
+        if not higherMoments:
+            for item in values:
+                m2 += (item - mean) ** 2
+            return (n, mean, m2, None, None)
 
-        sum: float = 0
+        m3: float = 0
+        m4: float = 0
         for item in values:
-            sum += (item - mean) ** 2
+            delta: float = item - mean
+            deltaSquared: float = delta ** 2
+            m2 += deltaSquared
+            m3 += deltaSquared * delta
+            m4 += deltaSquared ** 2
+        return (n, mean, m2, m3, m4)
 
-        return sum / (n-1)
+    @staticmethod
+    def __estimateArrayMoments(array: object, higherMoments: bool) -> tuple:
+        n: int = len(array)
+        mean: float = float(array.mean())
+        deviations = array - mean
+        m2: float = float(deviations @ deviations)
+        if not higherMoments:
+            return (n, mean, m2, None, None)
+
+        squaredDeviations = deviations * deviations
+        return (n, mean, m2, float(squaredDeviations @ deviations), float(squaredDeviations @ squaredDeviations))
+
+    @staticmethod
+    def asArray(values: object) -> object:
+        """
+        Description
+        ----------
+        Views a sample as a floating point numpy array so that it can be reduced
+        with vectorized operations. Lists and tuples are left to the pure python
+        path, as are all samples when numpy is not installed. Bytes and arrays
+        with more than one dimension are rejected rather than read as samples
+
+        Parameters
+        ----------
+        values : object
+            A population sample of floating point numbers
+
+        Returns
+        -------
+        object
+            A numpy.ndarray of floats sharing memory with the sample where possible,
+            or None if the sample should be processed element by element
+        """
+        if isinstance(values, (bytes, bytearray)):
+            raise ValueError("Cannot use bytes as a sample")
+        if values is None or isinstance(values, (list, tuple)):
+            return None
+        numpy = OptionalDependencies.load("numpy")
+        if numpy is None:
+            return None
+        if not isinstance(values, numpy.ndarray):
+            try:
+                values = numpy.asarray(memoryview(values))
+            except TypeError:
+                return None
+        if values.ndim != 1:
+            raise ValueError("Sample must be one dimensional")
+        return values.astype(float, copy=False)
 
     @staticmethod
     def bootstrap(values: list) -> list:
@@ -89,14 +215,15 @@ class SampleUtilities:
         Parameters
         ----------
         values : list
-            A population sample of floating point numbers
+            A population sample of floating point numbers, either as a list or as
+            any buffer-protocol array such as numpy.ndarray or array.array
 
         Returns
         -------
         list
             The standard deviation of the provided values
         """
-        if values == None or len(values) == 0:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot have empty or null sample")
             
         return random.choices(values, k=len(values))
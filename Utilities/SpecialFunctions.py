@@ -0,0 +1,398 @@
+import math
+
+# Coefficients of the asymptotic series for the error of Stirling's approximation
+_STIRLING_SERIES: tuple = (1 / 12, 1 / 360, 1 / 1260, 1 / 1680, 1 / 1188)
+_HALF_LOG_TWO_PI: float = 0.5 * math.log(2 * math.pi)
+
+# Smallest magnitude kept by the modified Lentz method in place of zero
+_TINY: float = 1e-300
+_EPSILON: float = 1e-15
+_MAX_SOLVER_ITERATIONS: int = 200
+_MAX_STRIDE: float = 2.0
+
+class SpecialFunctions:
+    """Class holding pure Python incomplete beta and gamma functions and their inverses, for use without scipy"""
+
+    @staticmethod
+    def stirlingError(n: float) -> float:
+        """
+        Description
+        ----------
+        Finds log(n!) - log(sqrt(2 pi n) (n / e) ** n), which is small for every
+        n so it can be differenced without the cancellation lgamma would suffer
+
+        Parameters
+        ----------
+        n : float
+            A positive value, not necessarily an integer
+
+        Returns
+        -------
+        float
+            The error of Stirling's approximation to log(n!)
+        """
+        if n <= 15:
+            return math.lgamma(n + 1) - ((n + 0.5) * math.log(n)) + n - _HALF_LOG_TWO_PI
+        nn: float = n * n
+        s0, s1, s2, s3, s4 = _STIRLING_SERIES
+        if n > 500:
+            return (s0 - (s1 / nn)) / n
+        if n > 80:
+            return (s0 - ((s1 - (s2 / nn)) / nn)) / n
+        if n > 35:
+            return (s0 - ((s1 - ((s2 - (s3 / nn)) / nn)) / nn)) / n
+        return (s0 - ((s1 - ((s2 - ((s3 - (s4 / nn)) / nn)) / nn)) / nn)) / n
+
+    @staticmethod
+    def deviance(x: float, mean: float) -> float:
+        """
+        Description
+        ----------
+        Finds x log(x / mean) + mean - x, summed as a series when x is close to
+        the mean since the direct form then cancels to nearly nothing
+
+        Parameters
+        ----------
+        x : float
+            A positive value
+
+        mean : float
+            A positive value
+
+        Returns
+        -------
+        float
+            The non-negative deviance of x from the mean
+        """
+        if abs(x - mean) < 0.1 * (x + mean):
+            v: float = (x - mean) / (x + mean)
+            total: float = (x - mean) * v
+            term: float = 2 * x * v
+            v = v * v
+            j: int = 1
+            while True:
+                term *= v
+                nextTotal: float = total + (term / ((2 * j) + 1))
+                if nextTotal == total:
+                    return total
+                total = nextTotal
+                j += 1
+        return (x * math.log(x / mean)) + mean - x
+
+    @staticmethod
+    def incompleteBeta(a: float, b: float, x: float, y: float = None) -> tuple:
+        """
+        Description
+        ----------
+        Finds the regularized incomplete beta function I_x(a, b) and its
+        complement, the smaller of which is computed directly by continued
+        fraction so that neither loses precision in the tails
+
+        Parameters
+        ----------
+        a : float
+            The first positive shape parameter
+
+        b : float
+            The second positive shape parameter
+
+        x : float
+            The upper limit of integration, between 0 and 1
+
+        y : float
+            1 - x, which callers can often compute without rounding
+
+        Returns
+        -------
+        tuple
+            I_x(a, b) and 1 - I_x(a, b)
+        """
+        y = 1 - x if y == None else y
+        if x <= 0:
+            return (0.0, 1.0)
+        if y <= 0:
+            return (1.0, 0.0)
+
+        front: float = SpecialFunctions.incompleteBetaFront(a, b, x, y)
+        if x < (a + 1) / (a + b + 2):
+            lower: float = front * SpecialFunctions.incompleteBetaFraction(a, b, x) / a
+            return (lower, 1 - lower)
+        upper: float = front * SpecialFunctions.incompleteBetaFraction(b, a, y) / b
+        return (1 - upper, upper)
+
+    @staticmethod
+    def incompleteBetaFront(a: float, b: float, x: float, y: float) -> float:
+        """
+        Description
+        ----------
+        Finds x ** a * y ** b / B(a, b), the derivative of I_x(a, b) with respect
+        to log(x / y), in Loader's saddle point form which stays accurate for
+        shape parameters in the millions
+
+        Parameters
+        ----------
+        a : float
+            The first positive shape parameter
+
+        b : float
+            The second positive shape parameter
+
+        x : float
+            A value strictly between 0 and 1
+
+        y : float
+            1 - x
+
+        Returns
+        -------
+        float
+            The front factor of the incomplete beta function
+        """
+        if x <= 0 or y <= 0:
+            return 0.0
+        n: float = a + b
+        logFront: float = SpecialFunctions.stirlingError(n) - SpecialFunctions.stirlingError(a) - SpecialFunctions.stirlingError(b) \
+            - SpecialFunctions.deviance(a, n * x) - SpecialFunctions.deviance(b, n * y)
+        return math.exp(logFront) * math.sqrt(a * b / (2 * math.pi * n))
+
+    @staticmethod
+    def incompleteBetaFraction(a: float, b: float, x: float) -> float:
+        """
+        Description
+        ----------
+        Evaluates the continued fraction of I_x(a, b) by the modified Lentz
+        method, which converges quickly for x below the mean of the beta
+        distribution
+
+        Parameters
+        ----------
+        a : float
+            The first positive shape parameter
+
+        b : float
+            The second positive shape parameter
+
+        x : float
+            A value below (a + 1) / (a + b + 2)
+
+        Returns
+        -------
+        float
+            The continued fraction, equal to a * I_x(a, b) / (x ** a * (1 - x) ** b / B(a, b))
+        """
+        c: float = 1
+        d: float = 1 - ((a + b) * x / (a + 1))
+        d = 1 / (d if abs(d) > _TINY else _TINY)
+        fraction: float = d
+
+        # The number of terms needed grows with the square root of the parameters
+        maxIterations: int = 200 + int(10 * math.sqrt(max(a, b)))
+        for m in range(1, maxIterations + 1):
+            for numerator in (
+                m * (b - m) * x / ((a + (2 * m) - 1) * (a + (2 * m))),
+                -(a + m) * (a + b + m) * x / ((a + (2 * m)) * (a + (2 * m) + 1))):
+                d = 1 + (numerator * d)
+                d = 1 / (d if abs(d) > _TINY else _TINY)
+                c = 1 + (numerator / c)
+                c = c if abs(c) > _TINY else _TINY
+                fraction *= d * c
+            if abs((d * c) - 1) < _EPSILON:
+                break
+        return fraction
+
+    @staticmethod
+    def incompleteGamma(a: float, x: float) -> tuple:
+        """
+        Description
+        ----------
+        Finds the regularized lower incomplete gamma function P(a, x) and its
+        complement Q(a, x), summed as a series below a + 1 and as a continued
+        fraction above it, where each converges quickly
+
+        Parameters
+        ----------
+        a : float
+            The positive shape parameter
+
+        x : float
+            The non-negative upper limit of integration
+
+        Returns
+        -------
+        tuple
+            P(a, x) and Q(a, x) = 1 - P(a, x)
+        """
+        if x <= 0:
+            return (0.0, 1.0)
+        if math.isinf(x):
+            return (1.0, 0.0)
+
+        front: float = SpecialFunctions.incompleteGammaFront(a, x)
+        if x < a + 1:
+            term: float = 1 / a
+            total: float = term
+            n: int = 1
+            while abs(term) > abs(total) * _EPSILON:
+                term *= x / (a + n)
+                total += term
+                n += 1
+            lower: float = front * total
+            return (lower, 1 - lower)
+
+        b: float = x + 1 - a
+        c: float = 1 / _TINY
+        d: float = 1 / b
+        fraction: float = d
+        maxIterations: int = 200 + int(10 * math.sqrt(a))
+        for n in range(1, maxIterations + 1):
+            numerator: float = -n * (n - a)
+            b += 2
+            d = (numerator * d) + b
+            d = 1 / (d if abs(d) > _TINY else _TINY)
+            c = b + (numerator / c)
+            c = c if abs(c) > _TINY else _TINY
+            fraction *= d * c
+            if abs((d * c) - 1) < _EPSILON:
+                break
+        upper: float = front * fraction
+        return (1 - upper, upper)
+
+    @staticmethod
+    def incompleteGammaFront(a: float, x: float) -> float:
+        """
+        Description
+        ----------
+        Finds x ** a * exp(-x) / gamma(a), the derivative of P(a, x) with respect
+        to log(x), in Loader's saddle point form
+
+        Parameters
+        ----------
+        a : float
+            The positive shape parameter
+
+        x : float
+            A positive value
+
+        Returns
+        -------
+        float
+            The front factor of the incomplete gamma function
+        """
+        if x <= 0 or math.isinf(x):
+            return 0.0
+        logFront: float = -SpecialFunctions.stirlingError(a) - SpecialFunctions.deviance(a, x)
+        return math.exp(logFront) * math.sqrt(a / (2 * math.pi))
+
+    @staticmethod
+    def inverseIncompleteBeta(a: float, b: float, lowerArea: float, upperArea: float, guess: float) -> float:
+        """
+        Description
+        ----------
+        Finds the log odds log(x / (1 - x)) at which I_x(a, b) reaches the target
+        area, by safeguarded Halley iteration
+
+        Parameters
+        ----------
+        a : float
+            The first positive shape parameter
+
+        b : float
+            The second positive shape parameter
+
+        lowerArea : float
+            The target I_x(a, b), strictly between 0 and 1
+
+        upperArea : float
+            1 - lowerArea, passed separately so that it carries no rounding when
+            the caller holds it exactly. The smaller of the two areas is matched
+
+        guess : float
+            An initial estimate of the log odds
+
+        Returns
+        -------
+        float
+            The log odds of the quantile
+        """
+        def evaluate(logOdds: float) -> tuple:
+            # x / y is the odds, with both computed without cancellation or overflow
+            odds: float = math.exp(-abs(logOdds))
+            x: float = 1 / (1 + odds) if logOdds >= 0 else odds / (1 + odds)
+            y: float = odds / (1 + odds) if logOdds >= 0 else 1 / (1 + odds)
+            lower, upper = SpecialFunctions.incompleteBeta(a, b, x, y)
+            residual: float = lower - lowerArea if lowerArea <= upperArea else upperArea - upper
+            return (residual, SpecialFunctions.incompleteBetaFront(a, b, x, y), (a * y) - (b * x))
+        return SpecialFunctions.__solve(evaluate, guess)
+
+    @staticmethod
+    def inverseIncompleteGamma(a: float, lowerArea: float, upperArea: float, guess: float) -> float:
+        """
+        Description
+        ----------
+        Finds the log of the x at which P(a, x) reaches the target area, by
+        safeguarded Halley iteration
+
+        Parameters
+        ----------
+        a : float
+            The positive shape parameter
+
+        lowerArea : float
+            The target P(a, x), strictly between 0 and 1
+
+        upperArea : float
+            1 - lowerArea, passed separately so that it carries no rounding when
+            the caller holds it exactly. The smaller of the two areas is matched
+
+        guess : float
+            An initial estimate of log(x)
+
+        Returns
+        -------
+        float
+            The log of the quantile
+        """
+        def evaluate(logX: float) -> tuple:
+            x: float = math.exp(min(logX, 709))
+            lower, upper = SpecialFunctions.incompleteGamma(a, x)
+            residual: float = lower - lowerArea if lowerArea <= upperArea else upperArea - upper
+            return (residual, SpecialFunctions.incompleteGammaFront(a, x), a - x)
+        return SpecialFunctions.__solve(evaluate, guess)
+
+    @staticmethod
+    def __solve(evaluate: callable, guess: float) -> float:
+        # evaluate returns an increasing residual, its derivative and the
+        # derivative of the log of that derivative. Every evaluation narrows a
+        # bracket around the root, and a Halley step which would leave the
+        # bracket is replaced by bisection. Far from the root the residual is
+        # flat and a Halley step can overshoot by orders of magnitude, so steps
+        # are capped at a fixed stride in log space
+        lowerBound: float = -math.inf
+        upperBound: float = math.inf
+        current: float = guess
+        for _ in range(_MAX_SOLVER_ITERATIONS):
+            residual, derivative, curvature = evaluate(current)
+            if residual == 0:
+                return current
+            if residual < 0:
+                lowerBound = current
+            else:
+                upperBound = current
+
+            step: float = math.inf
+            if derivative > 0:
+                step = residual / derivative
+                # Halley's correction only helps once the step is small against
+                # the curvature, and far away it shrinks the step to a crawl
+                if abs(step * curvature) < 1:
+                    step /= 1 - (step * curvature / 2)
+            halley: bool = abs(step) <= _MAX_STRIDE
+            following: float = current - (step if halley else math.copysign(_MAX_STRIDE, residual))
+            if halley and abs(following - current) <= 1e-13 * max(1.0, abs(following)):
+                return following
+            if not lowerBound < following < upperBound:
+                following = (lowerBound + upperBound) / 2
+            if upperBound - lowerBound <= _EPSILON * max(1.0, abs(following)):
+                return following
+            current = following
+        return current
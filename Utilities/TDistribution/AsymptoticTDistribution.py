@@ -0,0 +1,130 @@
+import math
+
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+from Utilities.NormalDistriution.INormalDistribution import INormalDistribution
+from Utilities.TDistribution.CachedTDistribution import CachedTDistribution
+from Utilities.TDistribution.ITDistribution import ITDistribution
+
+class AsymptoticTDistribution(ITDistribution):
+    """Class implementing the ITDistribution interface with the Cornish-Fisher expansion of the t quantile for large df, delegating to an exact distribution otherwise"""
+
+    def __init__(self,
+        exact: ITDistribution = CachedTDistribution(),
+        threshold: float = 1000,
+        tolerance: float = 1e-10,
+        normalDist: INormalDistribution = ErfNormalDistribution()) -> None:
+        """
+        Description
+        ----------
+        Constructor for the AsymptoticTDistribution
+
+        Parameters
+        ----------
+        exact: ITDistribution
+            The t distribution used for tail areas, for df below the threshold,
+            and wherever the expansion's error bound exceeds the tolerance
+
+        threshold: float
+            The smallest df for which the expansion is used
+
+        tolerance: float
+            The largest estimate of the absolute error of a t value accepted
+            from the expansion. The estimate is the size of the series' last
+            term, which held with margin against exact quantiles for df from 10
+            to 100000 and percentiles down to 1e-14, but is not a proven bound
+
+        normalDist: INormalDistribution
+            Normal distribution utility used for the normal quantile the
+            expansion corrects. It must be accurate to well within the
+            tolerance, since its error passes straight into the t value, so an
+            ApproximateNormalTable is unsuitable
+        """
+        if exact == None:
+            raise ValueError("Cannot have null exact")
+        if threshold == None or threshold <= 0:
+            raise ValueError("Cannot have a non-positive or null threshold")
+        if tolerance == None or tolerance < 0:
+            raise ValueError("Cannot have negative or null tolerance")
+        if normalDist == None:
+            raise ValueError("Cannot have null normalDist")
+
+        self.exact: ITDistribution = exact
+        self.threshold: float = threshold
+        self.tolerance: float = tolerance
+        self.normalDist: INormalDistribution = normalDist
+
+    def getLeftTailArea(self, val: float, df: float) -> float:
+        return self.exact.getLeftTailArea(val, df)
+
+    def getTPercentileValue(self, percentile: float, df: float) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+
+        tVal: float = self.__expansion(percentile, df)
+        return self.exact.getTPercentileValue(percentile, df) if tVal == None else tVal
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        return self.exact.getLeftTailAreaBatch(vals, dfs)
+
+    def getTPercentileValueBatch(self, percentiles: list, dfs: list) -> list:
+        # The exact distribution evaluates a whole batch in one call, which is
+        # cheaper than the expansion element by element
+        return self.exact.getTPercentileValueBatch(percentiles, dfs)
+
+    def getMethod(self, percentile: float, df: float) -> str:
+        """
+        Description
+        ----------
+        Reports how getTPercentileValue computes the given percentile, for
+        auditing results
+
+        Parameters
+        ----------
+        percentile : float
+            The desired area under the curve
+
+        df: float
+            The number of degrees of freedom
+
+        Returns
+        -------
+        str
+            "asymptotic" or "exact"
+        """
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+        return "asymptotic" if self.__expansion(percentile, df) != None else "exact"
+
+    def __expansion(self, percentile: float, df: float) -> float:
+        # Returns the expansion's t value, or None where it cannot be trusted
+        if df < self.threshold or percentile == 0 or percentile == 1:
+            return None
+
+        # The Cornish-Fisher expansion t = z + g1 / df + ... + g4 / df ** 4 about
+        # the normal quantile z, from Abramowitz and Stegun 26.7.5
+        z: float = self.normalDist.getZPercentileValue(percentile)
+        z2: float = z * z
+        g1: float = z * (z2 + 1) / 4
+        g2: float = z * (((5 * z2) + 16) * z2 + 3) / 96
+        g3: float = z * ((((3 * z2) + 19) * z2 + 17) * z2 - 15) / 384
+        g4: float = z * (((((79 * z2) + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) / 92160
+
+        # While the terms are still shrinking, the truncation error of this
+        # asymptotic series is estimated by its last term. This is a heuristic
+        # rather than a proven bound, checked against exact quantiles, and it
+        # assumes z itself is exact. Taking every coefficient positive keeps the
+        # estimate from vanishing near the roots of g3 and g4
+        a: float = abs(z)
+        estimate3: float = a * ((((3 * z2) + 19) * z2 + 17) * z2 + 15) / (384 * (df ** 3))
+        estimate4: float = a * (((((79 * z2) + 776) * z2 + 1482) * z2 + 1920) * z2 + 945) / (92160 * (df ** 4))
+        if estimate4 > estimate3 or estimate4 > self.tolerance:
+            return None
+        return z + ((g1 + ((g2 + ((g3 + (g4 / df)) / df)) / df)) / df)
@@ -0,0 +1,81 @@
+from functools import lru_cache
+
+from Utilities.TDistribution.ITDistribution import ITDistribution
+from Utilities.TDistribution.SciPySpecialTDistribution import SciPySpecialTDistribution
+
+class CachedTDistribution(ITDistribution):
+    """Class which memoizes the percentiles of another t distribution in a bounded LRU cache"""
+
+    def __init__(self, tDist: ITDistribution = SciPySpecialTDistribution(), maxSize: int = 1024) -> None:
+        """
+        Description
+        ----------
+        Constructor for the CachedTDistribution
+
+        Parameters
+        ----------
+        tDist: ITDistribution
+            The t distribution whose percentiles are cached
+
+        maxSize: int
+            The number of (percentile, df) results kept before the least recently
+            used is evicted
+        """
+        if tDist == None:
+            raise ValueError("Cannot have null tDist")
+        if maxSize == None or maxSize <= 0:
+            raise ValueError("Cannot have a non-positive or null maxSize")
+
+        self.tDist: ITDistribution = tDist
+        self.maxSize: int = maxSize
+        self.__cachedTPercentileValue = lru_cache(maxsize=maxSize)(tDist.getTPercentileValue)
+
+    def getLeftTailArea(self, val: float, df: float) -> float:
+        # Tail areas of continuous test statistics rarely repeat, so they are
+        # not cached where they would only evict critical values
+        return self.tDist.getLeftTailArea(val, df)
+
+    def getTPercentileValue(self, percentile: float, df: float) -> float:
+        return self.__cachedTPercentileValue(percentile, df)
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        return self.tDist.getLeftTailAreaBatch(vals, dfs)
+
+    def getTPercentileValueBatch(self, percentiles: list, dfs: list) -> list:
+        # A batch is evaluated in one call by the wrapped distribution, which is
+        # faster than looking each percentile up in the cache
+        return self.tDist.getTPercentileValueBatch(percentiles, dfs)
+
+    def getHits(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of percentiles served from the cache
+
+        Returns
+        -------
+        int
+            The number of cache hits
+        """
+        return self.__cachedTPercentileValue.cache_info().hits
+
+    def getMisses(self) -> int:
+        """
+        Description
+        ----------
+        Returns the number of percentiles computed by the wrapped distribution
+
+        Returns
+        -------
+        int
+            The number of cache misses
+        """
+        return self.__cachedTPercentileValue.cache_info().misses
+
+    def clearCache(self) -> None:
+        """
+        Description
+        ----------
+        Empties the cache and resets the hit and miss counters
+        """
+        self.__cachedTPercentileValue.cache_clear()
@@ -47,3 +47,59 @@ class ITDistribution(ABC):
             The corresponding t value for that area under the approximated curve
         """
         pass
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        """
+        Description
+        ----------
+        Finds the left tail area of each t value under the t distribution with
+        the matching degrees of freedom. Implementations may override this to
+        evaluate the whole batch at once
+
+        Parameters
+        ----------
+        vals : list
+            The candidate t values, as a list or any array of floats
+
+        dfs: list
+            The number of degrees of freedom for each t value
+
+        Returns
+        -------
+        list
+            The approximate area under the appropriate t distribution for each
+            t value, as a list or as a numpy array when evaluated vectorized
+        """
+        if vals is None or dfs is None:
+            raise ValueError("Cannot pass null t values or df values")
+        if len(vals) != len(dfs):
+            raise ValueError("t values and df values must have the same length")
+        return [self.getLeftTailArea(val, df) for val, df in zip(vals, dfs)]
+
+    def getTPercentileValueBatch(self, percentiles: list, dfs: list) -> list:
+        """
+        Description
+        ----------
+        Finds the t value of each percentile of the t distribution with the
+        matching degrees of freedom. Implementations may override this to
+        evaluate the whole batch at once
+
+        Parameters
+        ----------
+        percentiles : list
+            The desired areas under the curve, as a list or any array of floats
+
+        dfs: list
+            The number of degrees of freedom for each percentile
+
+        Returns
+        -------
+        list
+            The corresponding t value for each area, as a list or as a numpy
+            array when evaluated vectorized
+        """
+        if percentiles is None or dfs is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if len(percentiles) != len(dfs):
+            raise ValueError("Percentiles and df values must have the same length")
+        return [self.getTPercentileValue(percentile, df) for percentile, df in zip(percentiles, dfs)]
@@ -0,0 +1,69 @@
+import math
+
+from Utilities.NormalDistriution.ErfNormalDistribution import ErfNormalDistribution
+from Utilities.SpecialFunctions import SpecialFunctions
+from Utilities.TDistribution.ITDistribution import ITDistribution
+
+_NORMAL_DIST: ErfNormalDistribution = ErfNormalDistribution()
+
+class IncompleteBetaTDistribution(ITDistribution):
+    """Class implementing the ITDistribution interface in pure Python through the regularized incomplete beta function"""
+
+    def getLeftTailArea(self, val: float, df: float) -> float:
+        if val == None:
+            raise ValueError("Cannot pass a null t value")
+        if df == None or df <= 0:
+            raise ValueError("Cannot pass a non-positive or null df value")
+        if val == 0:
+            return 0.5
+        if math.isinf(val):
+            return 0.0 if val < 0 else 1.0
+
+        # The two tails together are I_x(df / 2, 1 / 2) at x = df / (df + t ** 2)
+        x, y = IncompleteBetaTDistribution.__split(df, val)
+        tail: float = 0.5 * SpecialFunctions.incompleteBeta(df / 2, 0.5, x, y)[0]
+        return tail if val < 0 else 1 - tail
+
+    def getTPercentileValue(self, percentile: float, df: float) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df <= 0:
+            raise ValueError("Cannot pass a non-positive or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+        if percentile == 0:
+            return -math.inf
+        if percentile == 1:
+            return math.inf
+        if percentile == 0.5:
+            return 0.0
+
+        # Work in the lower tail by symmetry, where 1 - percentile is exact
+        if percentile > 0.5:
+            return -self.__lowerTailValue(1 - percentile, df)
+        return self.__lowerTailValue(percentile, df)
+
+    def __lowerTailValue(self, percentile: float, df: float) -> float:
+        a: float = df / 2
+
+        # Start from the Cornish-Fisher expansion about the normal quantile,
+        # capped by the tail bound |t| <= (df ** (df / 2) / (df B(df / 2, 1 / 2) percentile)) ** (1 / df),
+        # which the expansion overshoots for few df far into the tail
+        z: float = _NORMAL_DIST.getZPercentileValue(percentile)
+        expansion: float = z + (((z ** 3) + z) / (4 * df)) + (((5 * (z ** 5)) + (16 * (z ** 3)) + (3 * z)) / (96 * (df ** 2)))
+        logBeta: float = math.lgamma(a) + math.lgamma(0.5) - math.lgamma(a + 0.5)
+        logTailBound: float = ((a * math.log(df)) - math.log(df) - logBeta - math.log(percentile)) / df
+        logMagnitude: float = min(math.log(-expansion), logTailBound) if expansion < 0 else logTailBound
+
+        # Solve for the log odds log(df / t ** 2) of the two tailed area
+        logOdds: float = SpecialFunctions.inverseIncompleteBeta(a, 0.5, 2 * percentile, 1 - (2 * percentile), math.log(df) - (2 * logMagnitude))
+        return -math.sqrt(df) * math.exp(-logOdds / 2)
+
+    @staticmethod
+    def __split(df: float, val: float) -> tuple:
+        # df / (df + t ** 2) and its complement, without overflow for large t
+        if abs(val) > math.sqrt(df):
+            ratio: float = (df / val) / val
+            return (ratio / (1 + ratio), 1 / (1 + ratio))
+        ratio: float = (val / df) * val
+        return (1 / (1 + ratio), ratio / (1 + ratio))
@@ -0,0 +1,70 @@
+from Utilities.TDistribution.ITDistribution import ITDistribution
+from Utilities.TDistribution.IncompleteBetaTDistribution import IncompleteBetaTDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
+
+_FALLBACK: ITDistribution = IncompleteBetaTDistribution()
+
+class SciPySpecialTDistribution(ITDistribution):
+    """Class implementing the ITDistribution interface with the scalar scipy.special functions, falling back to the pure Python IncompleteBetaTDistribution without scipy"""
+
+    def getLeftTailArea(self, val: float, df: float) -> float:
+        if val == None:
+            raise ValueError("Cannot pass a null t value")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getLeftTailArea(val, df)
+        return float(special.stdtr(df, val))
+
+    def getTPercentileValue(self, percentile: float, df: float) -> float:
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+
+        special = OptionalDependencies.load("scipy.special")
+        if special == None:
+            return _FALLBACK.getTPercentileValue(percentile, df)
+        return float(special.stdtrit(df, percentile))
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        if vals is None or dfs is None:
+            raise ValueError("Cannot pass null t values or df values")
+        if len(vals) != len(dfs):
+            raise ValueError("t values and df values must have the same length")
+
+        numpy = OptionalDependencies.load("numpy")
+        special = OptionalDependencies.load("scipy.special")
+        if numpy == None or special == None:
+            return super().getLeftTailAreaBatch(vals, dfs)
+        vals = numpy.asarray(vals, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(vals)):
+            raise ValueError("Cannot pass a null t value")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        return special.stdtr(dfs, vals)
+
+    def getTPercentileValueBatch(self, percentiles: list, dfs: list) -> list:
+        if percentiles is None or dfs is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if len(percentiles) != len(dfs):
+            raise ValueError("Percentiles and df values must have the same length")
+
+        numpy = OptionalDependencies.load("numpy")
+        special = OptionalDependencies.load("scipy.special")
+        if numpy == None or special == None:
+            return super().getTPercentileValueBatch(percentiles, dfs)
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Target area cannot be greater than one")
+        return special.stdtrit(dfs, percentiles)
@@ -1,6 +1,5 @@
-from scipy.stats import t
-
 from Utilities.TDistribution.ITDistribution import ITDistribution
+from Utilities.OptionalDependencies import OptionalDependencies
 
 class SciPyTDistribution(ITDistribution):
     """Class implementing the ITDistribution interface using scipy"""
@@ -11,7 +10,8 @@ class SciPyTDistribution(ITDistribution):
         if df == None or df < 0:
             raise ValueError("Cannot pass a negative or null df value")
         
-        return t.cdf(val, df)
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.t.cdf(val, df)
 
     def getTPercentileValue(self, percentile: float, df: float) -> float:
         if percentile == None or percentile < 0:
@@ -21,4 +21,39 @@ class SciPyTDistribution(ITDistribution):
         if percentile > 1:
             raise ValueError("Target area cannot be greater than one")
 
-        return t.ppf(percentile, df)
+        stats = OptionalDependencies.require("scipy.stats")
+        return stats.t.ppf(percentile, df)
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        if vals is None or dfs is None:
+            raise ValueError("Cannot pass null t values or df values")
+        if len(vals) != len(dfs):
+            raise ValueError("t values and df values must have the same length")
+
+        numpy = OptionalDependencies.require("numpy")
+        stats = OptionalDependencies.require("scipy.stats")
+        vals = numpy.asarray(vals, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(vals)):
+            raise ValueError("Cannot pass a null t value")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        return stats.t.cdf(vals, dfs)
+
+    def getTPercentileValueBatch(self, percentiles: list, dfs: list) -> list:
+        if percentiles is None or dfs is None:
+            raise ValueError("Cannot pass null percentiles or df values")
+        if len(percentiles) != len(dfs):
+            raise ValueError("Percentiles and df values must have the same length")
+
+        numpy = OptionalDependencies.require("numpy")
+        stats = OptionalDependencies.require("scipy.stats")
+        percentiles = numpy.asarray(percentiles, dtype=float)
+        dfs = numpy.asarray(dfs, dtype=float)
+        if numpy.any(numpy.isnan(percentiles) | (percentiles < 0)):
+            raise ValueError("Cannot pass a negative or null percentile")
+        if numpy.any(numpy.isnan(dfs) | (dfs < 0)):
+            raise ValueError("Cannot pass a negative or null df value")
+        if numpy.any(percentiles > 1):
+            raise ValueError("Target area cannot be greater than one")
+        return stats.t.ppf(percentiles, dfs)
@@ -0,0 +1,99 @@
+import os
+
+from Utilities.CriticalValueTable import CriticalValueTable, UPPER_PERCENTILES
+from Utilities.TDistribution.CachedTDistribution import CachedTDistribution
+from Utilities.TDistribution.ITDistribution import ITDistribution
+
+DEFAULT_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tCriticalValues.bin")
+MAX_DF: int = 10000
+
+class TableTDistribution(ITDistribution):
+    """Class implementing the ITDistribution interface from a precomputed table of critical values, falling back to exact computation off the grid"""
+
+    def __init__(self, exact: ITDistribution = CachedTDistribution(), path: str = DEFAULT_PATH) -> None:
+        """
+        Description
+        ----------
+        Constructor for the TableTDistribution
+
+        Parameters
+        ----------
+        exact: ITDistribution
+            The t distribution used for tail areas and for percentiles outside the table
+
+        path: str
+            The path of the table, loaded on first use
+        """
+        if exact == None:
+            raise ValueError("Cannot have null exact")
+        if path == None:
+            raise ValueError("Cannot have a null path")
+
+        self.exact: ITDistribution = exact
+        self.path: str = path
+        self.__table: CriticalValueTable = None
+        self.__tableLoaded: bool = False
+        self.__tableHits: dict = {}
+
+    @staticmethod
+    def generate(path: str = DEFAULT_PATH, exact: ITDistribution = CachedTDistribution()) -> None:
+        """
+        Description
+        ----------
+        Regenerates the table of upper critical values for every integer df up
+        to MAX_DF. Lower critical values are read from it by symmetry
+
+        Parameters
+        ----------
+        path: str
+            The path of the table to write
+
+        exact: ITDistribution
+            The t distribution used to compute the table
+        """
+        dfs: list = [float(df) for df in range(1, MAX_DF + 1)]
+        CriticalValueTable.build(UPPER_PERCENTILES, dfs, [], exact.getTPercentileValue).save(path)
+
+    def getLeftTailArea(self, val: float, df: float) -> float:
+        return self.exact.getLeftTailArea(val, df)
+
+    def getTPercentileValue(self, percentile: float, df: float) -> float:
+        # Arguments only reach the memo after validation and a table hit, so a
+        # repeated critical value skips both. It only grows with the distinct
+        # tabulated arguments asked for
+        tVal: float = self.__tableHits.get((percentile, df))
+        if tVal != None:
+            return tVal
+        if percentile == None or percentile < 0:
+            raise ValueError("Cannot pass a negative or null percentile")
+        if df == None or df < 0:
+            raise ValueError("Cannot pass a negative or null df value")
+        if percentile > 1:
+            raise ValueError("Target area cannot be greater than one")
+
+        table: CriticalValueTable = self.__getTable()
+        if table != None:
+            tVal = table.lookup(percentile, df)
+            if tVal == None:
+                tVal = table.lookup(1 - percentile, df)
+                tVal = -tVal if tVal != None else None
+            if tVal != None:
+                self.__tableHits[(percentile, df)] = tVal
+                return tVal
+        return self.exact.getTPercentileValue(percentile, df)
+
+    def getLeftTailAreaBatch(self, vals: list, dfs: list) -> list:
+        return self.exact.getLeftTailAreaBatch(vals, dfs)
+
+    def getTPercentileValueBatch(self, percentiles: list, dfs: list) -> list:
+        # Batches go straight to the vectorized exact computation, as a table
+        # lookup per element would cost more than the single call it replaces
+        return self.exact.getTPercentileValueBatch(percentiles, dfs)
+
+    def __getTable(self) -> CriticalValueTable:
+        # The shared table is looked up once per instance, keeping the lock and
+        # the path lookup off the path of every repeated critical value
+        if not self.__tableLoaded:
+            self.__table = CriticalValueTable.loadShared(self.path)
+            self.__tableLoaded = True
+        return self.__table
@@ -1,16 +1,37 @@
 import unittest
 from UnitTests.ApproximateNormalTableTests import ApproximateNormalTableTests
+from UnitTests.ErfNormalDistributionTests import ErfNormalDistributionTests
+from UnitTests.DefaultNormalDistributionTests import DefaultNormalDistributionTests
 from UnitTests.ScipPyTDistributionTests import SciPyTDistributionTests
+from UnitTests.SciPySpecialTDistributionTests import SciPySpecialTDistributionTests
+from UnitTests.IncompleteBetaTDistributionTests import IncompleteBetaTDistributionTests
+from UnitTests.CachedTDistributionTests import CachedTDistributionTests
+from UnitTests.CriticalValueTableTests import CriticalValueTableTests
+from UnitTests.TableTDistributionTests import TableTDistributionTests
+from UnitTests.AsymptoticTDistributionTests import AsymptoticTDistributionTests
 from UnitTests.BinomialDistributionTests import BinomialDistributionTests
+from UnitTests.CachedBinomialDistributionTests import CachedBinomialDistributionTests
 from UnitTests.BootstrappedCentralValueAnalyzerTests import BootstrappedCentralValueAnalyzerTests
 from UnitTests.NormalCentralValueAnalyzerTests import NormalCentralValueAnalyzerTests
 from UnitTests.SciPyChiSquaredDistributionTests import SciPyChiSquaredTests
+from UnitTests.SciPySpecialChiSquaredTests import SciPySpecialChiSquaredTests
+from UnitTests.IncompleteGammaChiSquaredTests import IncompleteGammaChiSquaredTests
+from UnitTests.CachedChiSquaredTests import CachedChiSquaredTests
+from UnitTests.TableChiSquaredTests import TableChiSquaredTests
 from UnitTests.NormalBinomialAnalyzerTests import NormalBinomialAnalyzerTests
 from UnitTests.SampleUtilitiesTests import SampleUtilitiesTests
 from UnitTests.CategoricalSampleUtilitiesTests import CategoricalSampleUtilitiesTests
+from UnitTests.MomentSummaryTests import MomentSummaryTests
+from UnitTests.OptionalDependenciesTests import OptionalDependenciesTests
+from UnitTests.SpecialFunctionsTests import SpecialFunctionsTests
 from UnitTests.TDistributionCentralValueAnalyzerTests import TDistributionCentralValueAnalyzerTests
 from UnitTests.NormalVarianceAnalyzerTests import NormalVarianceAnalyzerTests
 from UnitTests.SciPyFDistributionTests import SciPyFDistributionTests
+from UnitTests.SciPySpecialFDistributionTests import SciPySpecialFDistributionTests
+from UnitTests.IncompleteBetaFDistributionTests import IncompleteBetaFDistributionTests
+from UnitTests.CachedFDistributionTests import CachedFDistributionTests
+from UnitTests.TableFDistributionTests import TableFDistributionTests
+from UnitTests.SciPyBetaDistributionTests import SciPyBetaDistributionTests
 from UnitTests.NormalCentralValueComparerTests import NormalCentralValueComparerTests
 from UnitTests.EqualVarianceNormalCentralValueComparerTests import EqualVarianceNormalCentralValueComparerTests
 from UnitTests.PairedNormalCentralValueComparerTests import PairedNormalCentralValueComparerTests